@@ -12,15 +12,20 @@ Reads EQUI_Animations.xml and all window XMLs to verify that:
 Usage:
     python .bin/audit_gauges.py              # Report only
     python .bin/audit_gauges.py --verbose    # Show all matched values
-    python .bin/audit_gauges.py --json       # Output JSON report to .tmp/
+    python .bin/audit_gauges.py --json       # Output JSON report (+ timings) to .tmp/
+    python .bin/audit_gauges.py -j 0         # Check window XMLs on all cores
 
 The canonical marker positions come from snap_columns config (exact fifths).
 """
 
 import argparse
 import json
+import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 # ============================================================================
@@ -78,12 +83,12 @@ ANIMS_FILE = ROOT / "EQUI_Animations.xml"
 # SCANNING
 # ============================================================================
 
-def scan_animations(verbose=False):
+def scan_animations(verbose=False, anims_file=ANIMS_FILE):
     """Scan EQUI_Animations.xml for oversized animation offset correctness."""
     issues = []
     ok_count = 0
 
-    with open(ANIMS_FILE, "r", encoding="utf-8-sig") as f:
+    with open(anims_file, "r", encoding="utf-8-sig") as f:
         content = f.read()
 
     pattern = re.compile(
@@ -138,8 +143,56 @@ def scan_animations(verbose=False):
     return issues, ok_count
 
 
-def scan_gauge_file(filepath, size, verbose=False):
-    """Scan a window XML for gauge offset alignment issues."""
+# Window XML scans: one pass for GaugeOffsetX (A and B parts) and one for
+# 16px-high Size blocks (clip containers). Literal-prefix patterns are
+# several times faster than a single alternation over the whole text.
+OFFSET_RE = re.compile(r"<GaugeOffsetX>-(\d+)</GaugeOffsetX>")
+CLIP_RE = re.compile(r"<Size>\s*<CX>(\d+)</CX>\s*<CY>16</CY>\s*</Size>")
+ITEM_RE = re.compile(r'item\s*=\s*"([^"]+)"')
+
+
+@dataclass
+class GaugeRecord:
+    """One audited value in a window XML."""
+    part: str    # "a_offset" (x100 scale), "b_offset" (pixels) or "clip" (Screen CX)
+    value: int
+    pos: int     # offset in the file text (see locate())
+
+
+def parse_gauge_records(content):
+    """Extract A/B-part GaugeOffsetX values and clip CX values, in file order.
+
+    Works on the raw text, so a file that is not well-formed is still audited.
+    """
+    records = []
+    for m in OFFSET_RE.finditer(content):
+        digits = m.group(1)
+        records.append(GaugeRecord("a_offset" if len(digits) >= 4 else "b_offset", -int(digits), m.start()))
+    for m in CLIP_RE.finditer(content):
+        records.append(GaugeRecord("clip", int(m.group(1)), m.start()))
+    records.sort(key=lambda record: record.pos)
+    return records
+
+
+def locate(content, pos):
+    """(item, line) of a position: the nearest preceding item="..." and its 1-based line.
+
+    Only called for issues, so clean files never pay for it.
+    """
+    line = content.count("\n", 0, pos) + 1
+    end = pos
+    while True:
+        start = content.rfind("item", 0, end)
+        if start < 0:
+            return None, line
+        m = ITEM_RE.match(content, start)
+        if m:
+            return m.group(1), line
+        end = start
+
+
+def check_gauge_records(records, size, rel_path, content):
+    """Check parsed records against the canonical markers for a gauge size."""
     issues = []
     ok_count = 0
     markers = GRID_MARKERS[size]
@@ -147,164 +200,117 @@ def scan_gauge_file(filepath, size, verbose=False):
     old_markers = OLD_MARKERS[size]
     old_clips = get_old_clips(size)
     width = WIDTHS[size]
-
-    with open(filepath, "r", encoding="utf-8-sig") as f:
-        content = f.read()
-
-    rel_path = str(Path(filepath).relative_to(ROOT))
-
-    # ── A-part offsets (×100 scale, negative values > 1000) ──
-    a_pattern = re.compile(r"<GaugeOffsetX>(-\d{4,})</GaugeOffsetX>")
-    for m in a_pattern.finditer(content):
-        offset = int(m.group(1))
-        # Check if matches any expected band (marker × 100)
-        matched = False
-        for i, marker in enumerate(markers):
-            if offset == -(marker * 100):
-                matched = True
+    a_expected = {-(marker * 100) for marker in markers}
+    clip_set = set(clips)
+
+    def add(issue_type, record, **fields):
+        item, line = locate(content, record.pos)
+        issue = {"type": issue_type, "file": rel_path, "size": size}
+        issue.update(fields)
+        issue["item"] = item
+        issue["line"] = line
+        issues.append(issue)
+
+    for record in records:
+        value = record.value
+
+        # ── A-part offsets (×100 scale, negative values > 1000) ──
+        if record.part == "a_offset":
+            if value in a_expected:
                 ok_count += 1
-                break
-
-        if not matched:
+                continue
             # Check if it's a stale old value
-            identified = False
             for i, om in enumerate(old_markers):
-                if offset == -(om * 100) and om != markers[i]:
-                    issues.append({
-                        "type": "stale_a_offset",
-                        "file": rel_path,
-                        "size": size,
-                        "band": i + 1,
-                        "actual": offset,
-                        "expected": -(markers[i] * 100),
-                    })
-                    identified = True
+                if value == -(om * 100) and om != markers[i]:
+                    add("stale_a_offset", record, band=i + 1, actual=value, expected=-(markers[i] * 100))
                     break
-            if not identified and abs(offset) > 1000:
-                issues.append({
-                    "type": "unknown_a_offset",
-                    "file": rel_path,
-                    "size": size,
-                    "actual": offset,
-                    "band": "?",
-                })
-
-    # ── B-part offsets (pixel scale, small negative 5-300) ──
-    b_pattern = re.compile(r"<GaugeOffsetX>(-\d{1,3})</GaugeOffsetX>")
-    for m in b_pattern.finditer(content):
-        offset = int(m.group(1))
-        if abs(offset) < 5:
+            else:
+                if abs(value) > 1000:
+                    add("unknown_a_offset", record, actual=value, band="?")
             continue
 
-        matched = False
-        for i, clip in enumerate(clips):
-            if offset == -clip:
-                matched = True
-                ok_count += 1
-                break
+        # ── B-part offsets (pixel scale, small negative 5-300) ──
+        # ── Screen clip containers (CX = clip value, CY = 16) ──
+        if record.part == "b_offset":
+            if value > -5:
+                continue
+            magnitude = -value
+            issue_type = "stale_b_offset"
+        else:
+            if value < 10 or value > 300 or value == width:
+                continue  # Skip full-width or tiny values
+            magnitude = value
+            issue_type = "stale_screen_clip"
 
-        if not matched:
-            # Check against old clips (marker-1) and old markers
-            for i, oc in enumerate(old_clips):
-                if offset == -oc and oc != clips[i]:
-                    issues.append({
-                        "type": "stale_b_offset",
-                        "file": rel_path,
-                        "size": size,
-                        "band": i + 1,
-                        "actual": offset,
-                        "expected": -clips[i],
-                    })
-                    break
-            else:
-                # Also check old markers (pre-OBY1 files used marker-exact)
-                for i, om in enumerate(old_markers):
-                    if offset == -om and om != clips[i]:
-                        issues.append({
-                            "type": "stale_b_offset",
-                            "file": rel_path,
-                            "size": size,
-                            "band": i + 1,
-                            "actual": offset,
-                            "expected": -clips[i],
-                        })
-                        break
-
-    # ── Screen clip containers (CX = clip value, CY = 16) ──
-    # Match Screen elements with Size CX in clip range and CY=16
-    screen_pattern = re.compile(
-        r"<Size>\s*<CX>(\d+)</CX>\s*<CY>16</CY>\s*</Size>"
-    )
-    for m in screen_pattern.finditer(content):
-        cx_val = int(m.group(1))
-        if cx_val < 10 or cx_val > 300 or cx_val == width:
-            continue  # Skip full-width or tiny values
-
-        matched = False
-        for clip in clips:
-            if cx_val == clip:
-                matched = True
-                ok_count += 1
+        if magnitude in clip_set:
+            ok_count += 1
+            continue
+        # Check against old clips (marker-1), then old markers (pre-OBY1 files used marker-exact)
+        for old_values in (old_clips, old_markers):
+            stale = [i for i, old in enumerate(old_values) if magnitude == old and old != clips[i]]
+            if stale:
+                i = stale[0]
+                expected = -clips[i] if record.part == "b_offset" else clips[i]
+                add(issue_type, record, band=i + 1, actual=value, expected=expected)
                 break
 
-        if not matched:
-            # Check old clips
-            for i, oc in enumerate(old_clips):
-                if cx_val == oc and oc != clips[i]:
-                    issues.append({
-                        "type": "stale_screen_clip",
-                        "file": rel_path,
-                        "size": size,
-                        "band": i + 1,
-                        "actual": cx_val,
-                        "expected": clips[i],
-                    })
-                    break
-            else:
-                # Also check old markers (pre-OBY1 files used marker-exact)
-                for i, om in enumerate(old_markers):
-                    if cx_val == om and om != clips[i]:
-                        issues.append({
-                            "type": "stale_screen_clip",
-                            "file": rel_path,
-                            "size": size,
-                            "band": i + 1,
-                            "actual": cx_val,
-                            "expected": clips[i],
-                        })
-                        break
-
     return issues, ok_count
 
 
-def discover_all_files():
-    """Find all XML files with composite gauges (main + Options + Testing)."""
-    files = []
+def scan_gauge_file(filepath, size, verbose=False, root=ROOT):
+    """Scan a window XML for gauge offset alignment issues."""
+    with open(filepath, "r", encoding="utf-8-sig") as f:
+        content = f.read()
+    rel_path = str(Path(filepath).relative_to(root))
+    return check_gauge_records(parse_gauge_records(content), size, rel_path, content)
+
 
-    # Main files
+def audit_file(task):
+    """Worker: read, parse and check one file. Returns issues, ok count and timings."""
+    filepath, size, rel_path = task
+    t0 = time.perf_counter()
+    with open(filepath, "r", encoding="utf-8-sig") as f:
+        content = f.read()
+    t1 = time.perf_counter()
+    records = parse_gauge_records(content)
+    t2 = time.perf_counter()
+    issues, ok_count = check_gauge_records(records, size, rel_path, content)
+    t3 = time.perf_counter()
+    return {
+        "issues": issues,
+        "ok": ok_count,
+        "records": len(records),
+        "read_ms": round((t1 - t0) * 1000, 3),
+        "parse_ms": round((t2 - t1) * 1000, 3),
+        "check_ms": round((t3 - t2) * 1000, 3),
+    }
+
+
+def discover_all_files(root=ROOT):
+    """Find all XML files with composite gauges (main + Options + Testing) in one walk."""
+    size_of = {}
+    order = {}
     for size, fnames in GAUGE_FILES_BY_SIZE.items():
         for fname in fnames:
-            path = ROOT / fname
-            if path.exists():
-                files.append((path, size, "main"))
-
-    # Options variants
-    options_dir = ROOT / "Options"
-    if options_dir.exists():
-        for size, fnames in GAUGE_FILES_BY_SIZE.items():
-            for fname in fnames:
-                for f in options_dir.rglob(fname):
-                    files.append((f, size, "option"))
-
-    # Testing variants
-    testing_dir = ROOT / "Testing"
-    if testing_dir.exists():
-        for size, fnames in GAUGE_FILES_BY_SIZE.items():
-            for fname in fnames:
-                for f in testing_dir.rglob(fname):
-                    files.append((f, size, "testing"))
+            size_of[fname] = size
+            order[fname] = len(order)
+    source_rank = {"main": 0, "option": 1, "testing": 2}
+
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        current = Path(dirpath)
+        if current == root:
+            # Main files, then only the Options and Testing trees
+            dirnames[:] = [d for d in dirnames if d in ("Options", "Testing")]
+            source = "main"
+        else:
+            source = "option" if current.relative_to(root).parts[0] == "Options" else "testing"
+        for fname in filenames:
+            if fname in size_of:
+                found.append((current / fname, size_of[fname], source))
 
-    return files
+    found.sort(key=lambda entry: (source_rank[entry[2]], order[entry[0].name], str(entry[0]).lower()))
+    return found
 
 
 # ============================================================================
@@ -314,9 +320,17 @@ def discover_all_files():
 def main():
     parser = argparse.ArgumentParser(description="Audit gauge alignment")
     parser.add_argument("--verbose", "-v", action="store_true")
-    parser.add_argument("--json", action="store_true", help="Write JSON to .tmp/")
+    parser.add_argument("--json", action="store_true", help="Write JSON (with timing breakdown) to .tmp/")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Worker processes for the window XMLs (default: 1 serial, 0 = all cores)")
+    parser.add_argument("--root", default=str(ROOT), help="Skin directory (default: thorne_drak/)")
     args = parser.parse_args()
 
+    root = Path(args.root).resolve()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    timings = {}
+    run_start = time.perf_counter()
+
     print("=" * 65)
     print("  Gauge Alignment Audit (snap_columns edition)")
     print("=" * 65)
@@ -343,7 +357,9 @@ def main():
     print("-" * 65)
     print("Layer 1: Animations (EQUI_Animations.xml)")
     print("-" * 65)
-    anim_issues, anim_ok = scan_animations(args.verbose)
+    t0 = time.perf_counter()
+    anim_issues, anim_ok = scan_animations(args.verbose, root / ANIMS_FILE.name)
+    timings["animations_ms"] = round((time.perf_counter() - t0) * 1000, 3)
     if anim_issues:
         for issue in anim_issues:
             print(f"  ISSUE [{issue['type']}] {issue['name']}: "
@@ -357,13 +373,38 @@ def main():
     print("-" * 65)
     print("Layer 2: Gauge Elements (window XMLs)")
     print("-" * 65)
-    files = discover_all_files()
+    t0 = time.perf_counter()
+    files = discover_all_files(root)
+    timings["discover_ms"] = round((time.perf_counter() - t0) * 1000, 3)
+
+    t0 = time.perf_counter()
+    tasks = [(str(filepath), size, str(filepath.relative_to(root))) for filepath, size, _ in files]
+    if jobs > 1 and len(tasks) > 1:
+        workers = min(jobs, len(tasks))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(audit_file, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    else:
+        results = [audit_file(task) for task in tasks]
+    timings["files_ms"] = round((time.perf_counter() - t0) * 1000, 3)
+
     file_ok_count = 0
     file_issue_count = 0
-
-    for filepath, size, source in files:
-        rel = filepath.relative_to(ROOT)
-        file_issues, file_ok = scan_gauge_file(str(filepath), size, args.verbose)
+    per_file = []
+
+    for (filepath, size, source), result in zip(files, results):
+        rel = filepath.relative_to(root)
+        file_issues = result["issues"]
+        per_file.append({
+            "file": str(rel),
+            "size": size,
+            "source": source,
+            "records": result["records"],
+            "ok": result["ok"],
+            "issues": len(file_issues),
+            "read_ms": result["read_ms"],
+            "parse_ms": result["parse_ms"],
+            "check_ms": result["check_ms"],
+        })
         if file_issues:
             file_issue_count += 1
             print(f"\n  {rel} ({size}):")
@@ -372,14 +413,16 @@ def main():
                 desc += f"actual={issue['actual']}"
                 if 'expected' in issue:
                     desc += f", expected={issue['expected']}"
+                desc += f"  ({issue['item']}, line {issue['line']})"
                 print(desc)
             all_issues.extend(file_issues)
         else:
             file_ok_count += 1
             if args.verbose:
-                print(f"  {rel}: OK ({file_ok} values checked)")
+                print(f"  {rel}: OK ({result['ok']} values checked)")
 
     print()
+    timings["total_ms"] = round((time.perf_counter() - run_start) * 1000, 3)
 
     # ── Summary ──
     print("=" * 65)
@@ -406,6 +449,10 @@ def main():
     if args.json:
         tmp_dir = Path(__file__).resolve().parent.parent / ".tmp"
         tmp_dir.mkdir(exist_ok=True)
+        timings["jobs"] = jobs
+        timings["read_ms"] = round(sum(f["read_ms"] for f in per_file), 3)
+        timings["parse_ms"] = round(sum(f["parse_ms"] for f in per_file), 3)
+        timings["check_ms"] = round(sum(f["check_ms"] for f in per_file), 3)
         report = {
             "markers": GRID_MARKERS,
             "old_markers": OLD_MARKERS,
@@ -413,11 +460,15 @@ def main():
             "issues": all_issues,
             "files_checked": file_ok_count + file_issue_count,
             "files_with_issues": file_issue_count,
+            "timings": timings,
+            "files": per_file,
         }
         out = tmp_dir / "audit_gauges.json"
         with open(out, "w") as f:
             json.dump(report, f, indent=2)
         print(f"\nJSON report: {out}")
+        print(f"Elapsed: {timings['total_ms']:.0f} ms (discover {timings['discover_ms']:.0f}, "
+              f"animations {timings['animations_ms']:.0f}, window XMLs {timings['files_ms']:.0f}; jobs={jobs})")
 
     return 1 if all_issues else 0
 
@@ -0,0 +1,17 @@
+@echo off
+REM build.bat - Wrapper to run build.py from .bin directory
+REM Builds every out-of-date stage of the asset pipeline (dependency order, parallel)
+REM
+REM Usage:
+REM   build.bat                                            (Build everything that is out of date)
+REM   build.bat regen_slots                                (Slots + everything upstream)
+REM   build.bat --dry-run                                  (Show what would run)
+REM   build.bat --force                                    (Rebuild every stage)
+
+setlocal
+
+set "SCRIPT_DIR=%~dp0"
+
+python "%SCRIPT_DIR%build.py" %*
+
+exit /b %errorlevel%
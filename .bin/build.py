@@ -0,0 +1,526 @@
+#!/usr/bin/env python3
+"""
+Build orchestrator for the Thorne asset pipeline.
+
+Declares every generator script as a stage with its file inputs and outputs
+and runs the resulting dependency graph:
+
+    extract_eq_items -> pick_class_icons -> generate_regen_json -> regen_thorne:research
+                     -> build_slot_reference
+    generate_thorne_logo_atlas   \\
+    generate_thorne_button_atlas  -> regen_thorne:master -> regen_thorne:<Class> -> regen_slots:<Class>
+    regen_gems (gemicons + spell_icons_thorne + stat icons, in-process)
+    regen_gauges
+
+Staleness:
+    After a stage succeeds, the size, mtime and sha256 of every input and
+    output file it matched are recorded in .tmp/build-state.json. A stage is
+    re-run when that set of files changes, any file's content hash changes
+    (files whose size/mtime are unchanged are not re-hashed), or its
+    arguments change. In-place generators (logo/button atlases) work because
+    the post-run state is what gets recorded. Each regen_* script still keeps
+    its own per-output build cache, so a re-run only regenerates what changed.
+
+Scheduling:
+    Independent stages run concurrently as separate processes (--jobs,
+    default: all cores). regen_thorne and regen_slots fan out per class;
+    only the primary class (Thorne) performs the thorne_drak/ copyback.
+    A stage whose inputs do not exist (e.g. no quarm_*.sql in .tmp/) is
+    skipped and its dependents use the files already on disk; a failed
+    stage skips everything downstream of it.
+
+Usage:
+    python build.py                      # Build everything that is out of date
+    python build.py regen_slots          # regen_slots:* and everything upstream
+    python build.py regen_slots:Bard     # One class (plus upstream)
+    python build.py --dry-run            # Show what would run
+    python build.py --force              # Rebuild all stages (passes --force)
+    python build.py --jobs 4             # Limit concurrent stages
+
+Output:
+    .tmp/build-state.json   -- Recorded fingerprints and last run time per stage
+    .tmp/build-logs/*.log   -- Captured output of each stage's last run
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+STATE_FILE = REPO_ROOT / ".tmp" / "build-state.json"
+LOG_DIR = REPO_ROOT / ".tmp" / "build-logs"
+STATE_FORMAT = 1
+
+ITEM_CACHE = ".master/items/.cache"
+ICONS = "thorne_drak/Options/Icons"
+GAUGES = "thorne_drak/Options/Gauges"
+
+# regen_slots copies <PRIMARY_CLASS>/Thorne back to thorne_drak/ (same as --all)
+PRIMARY_CLASS = "Thorne"
+
+# Helper modules imported by the texture scripts
+TEXTURE_HELPERS = ("buildcache.py", "imagecache.py")
+
+
+@dataclass
+class Stage:
+    """One script invocation in the pipeline.
+
+    inputs/outputs are glob patterns relative to the repository root; every
+    input pattern must match at least one file for the stage to run.
+    """
+
+    name: str
+    script: str
+    args: list[str] = field(default_factory=list)
+    inputs: list[str] = field(default_factory=list)
+    outputs: list[str] = field(default_factory=list)
+    deps: list[str] = field(default_factory=list)
+    helpers: tuple[str, ...] = ()
+    accepts_force: bool = True
+
+    def command(self, force: bool) -> list[str]:
+        args = list(self.args)
+        if force and self.accepts_force:
+            args.append("--force")
+        return [sys.executable, str(SCRIPT_DIR / self.script)] + args
+
+    def tool_files(self) -> list[str]:
+        return [f".bin/{name}" for name in (self.script,) + self.helpers]
+
+
+def discover_classes(root: Path) -> list[str]:
+    """Class override directories, as regen_slots.discover_classes() sees them."""
+    classes_dir = root / ".master" / "classes"
+    if not classes_dir.exists():
+        return []
+    return [d.name for d in sorted(classes_dir.iterdir()) if d.is_dir() and not d.name.startswith(".") and (d / ".regen_thorne.json").exists()]
+
+
+def plan_stages(root: Path = REPO_ROOT) -> dict[str, Stage]:
+    """Declare every pipeline stage (in a valid serial order)."""
+    thorne_sources = [".master/.regen_thorne.json", ".master/items/dragitem*.tga", ".master/*.tga"]
+    stages = [
+        Stage(
+            "extract_eq_items",
+            "extract_eq_items.py",
+            inputs=[".tmp/quarm_*.sql"],
+            outputs=[f"{ITEM_CACHE}/eq_items.*"],
+            helpers=("eq_items_store.py",),
+            accepts_force=False,
+        ),
+        Stage(
+            "pick_class_icons",
+            "pick_class_icons.py",
+            inputs=[f"{ITEM_CACHE}/eq_items.*"],
+            outputs=[f"{ITEM_CACHE}/class_icon_picks.*"],
+            deps=["extract_eq_items"],
+            helpers=("eq_items_store.py",),
+            accepts_force=False,
+        ),
+        Stage(
+            "build_slot_reference",
+            "build_slot_reference.py",
+            inputs=[f"{ITEM_CACHE}/eq_items.*"],
+            outputs=[f"{ITEM_CACHE}/slot_icon_reference.*"],
+            deps=["extract_eq_items"],
+            helpers=("eq_items_store.py",),
+            accepts_force=False,
+        ),
+        Stage(
+            "generate_regen_json",
+            "generate_regen_json.py",
+            inputs=[f"{ITEM_CACHE}/class_icon_picks.json", ".master/.regen_thorne.json"],
+            outputs=[".master/research/*/.regen_thorne.json"],
+            deps=["pick_class_icons"],
+            accepts_force=False,
+        ),
+        Stage(
+            "generate_thorne_logo_atlas",
+            "generate_thorne_logo_atlas.py",
+            inputs=[".bin/generate_thorne_logo_atlas.json", ".master/logo_atlas_thorne01.tga"],
+            outputs=[".master/logo_atlas_thorne01.tga", "thorne_drak/logo_icons_thorne01.tga"],
+            accepts_force=False,
+        ),
+        Stage(
+            "generate_thorne_button_atlas",
+            "generate_thorne_button_atlas.py",
+            inputs=[".bin/generate_thorne_button_atlas.json", ".master/button_atlas_thorne01.tga"],
+            outputs=[".master/button_atlas_thorne01.tga"],
+            accepts_force=False,
+        ),
+        # regen_thorne loads every .master/*.tga as a fallback source, so
+        # nothing may run against .master/ while the atlases are rewritten
+        Stage(
+            "regen_thorne:master",
+            "regen_thorne.py",
+            ["--master"],
+            inputs=thorne_sources,
+            outputs=[".master/item_atlas_thorne01.tga", ".master/item_icons_thorne01.tga"],
+            deps=["generate_thorne_logo_atlas", "generate_thorne_button_atlas"],
+            helpers=TEXTURE_HELPERS,
+        ),
+        Stage(
+            "regen_thorne:research",
+            "regen_thorne.py",
+            ["--research"],
+            inputs=thorne_sources + [".master/research/*/.regen_thorne.json"],
+            outputs=[".master/research/*/*.tga"],
+            deps=["regen_thorne:master", "generate_regen_json"],
+            helpers=TEXTURE_HELPERS,
+        ),
+    ]
+
+    for class_name in discover_classes(root):
+        class_dir = f".master/classes/{class_name}"
+        primary = class_name == PRIMARY_CLASS
+        stages.append(
+            Stage(
+                f"regen_thorne:{class_name}",
+                "regen_thorne.py",
+                ["--class", class_name],
+                inputs=thorne_sources + [f"{class_dir}/.regen_thorne.json"],
+                outputs=[f"{class_dir}/*.tga"],
+                deps=["regen_thorne:master"],
+                helpers=TEXTURE_HELPERS,
+            )
+        )
+        stages.append(
+            Stage(
+                f"regen_slots:{class_name}",
+                "regen_slots.py",
+                ["--class", class_name] + ([] if primary else ["--no-copyback"]),
+                inputs=[".master/.regen_slots.json", ".master/themes/*/.regen_slots.json", f"{class_dir}/*.tga", ".master/button_atlas_thorne01.tga"],
+                outputs=[f"thorne_drak/Options/Slots/{class_name}/*/item_slots_thorne01.tga"] + (["thorne_drak/item_slots_thorne01.tga"] if primary else []),
+                deps=[f"regen_thorne:{class_name}", "generate_thorne_button_atlas"],
+                helpers=TEXTURE_HELPERS + ("slot_kernels.py",),
+            )
+        )
+
+    stages += [
+        Stage(
+            "regen_gems",
+            "regen_gems.py",
+            ["--all"],
+            inputs=[f"{ICONS}/*/spells*.tga", ".bin/regen_icons.json"],
+            outputs=[
+                f"{ICONS}/*/gemicons*.tga",
+                f"{ICONS}/*/spell_icons_thorne*.tga",
+                f"{ICONS}/*/stat_icons_thorne01.tga",
+                "thorne_drak/gemicons*.tga",
+                "thorne_drak/spell_icons_thorne*.tga",
+                "thorne_drak/stat_icons_thorne01.tga",
+            ],
+            helpers=TEXTURE_HELPERS + ("regen_icons.py",),
+        ),
+        Stage(
+            "regen_gauges",
+            "regen_gauges.py",
+            ["--all"],
+            inputs=[f"{GAUGES}/*/.regen_gauges.json", f"{GAUGES}/*/gauge*.tga"],
+            outputs=[f"{GAUGES}/*/gauge*.tga", "thorne_drak/gauge*.tga"],
+            helpers=TEXTURE_HELPERS + ("gauge_kernels.py",),
+        ),
+    ]
+    return {stage.name: stage for stage in stages}
+
+
+def select_stages(stages: dict[str, Stage], targets: list[str]) -> dict[str, Stage]:
+    """Restrict to the named stages (or name prefixes before ':') plus everything upstream.
+
+    Raises:
+        KeyError: A target matches no stage
+    """
+    if not targets:
+        return stages
+    wanted: set[str] = set()
+    todo = []
+    for target in targets:
+        matches = [name for name in stages if name == target or name.split(":")[0] == target]
+        if not matches:
+            raise KeyError(target)
+        todo.extend(matches)
+    while todo:
+        name = todo.pop()
+        if name in wanted:
+            continue
+        wanted.add(name)
+        todo.extend(dep for dep in stages[name].deps if dep in stages)
+    return {name: stage for name, stage in stages.items() if name in wanted}
+
+
+# ---------------------------------------------------------------------------
+# Fingerprints and state
+# ---------------------------------------------------------------------------
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def resolve(patterns: list[str], root: Path = REPO_ROOT) -> tuple[list[str], list[str]]:
+    """Expand glob patterns; returns (sorted repo-relative files, patterns with no match)."""
+    files: set[str] = set()
+    missing = []
+    for pattern in patterns:
+        matched = [p for p in root.glob(pattern) if p.is_file()]
+        if not matched:
+            missing.append(pattern)
+        files.update(p.relative_to(root).as_posix() for p in matched)
+    return sorted(files), missing
+
+
+def fingerprint(files: list[str], previous: dict[str, list]) -> dict[str, list]:
+    """[size, mtime_ns, sha256] per file, reusing recorded hashes when size/mtime match."""
+    result = {}
+    for rel in files:
+        path = REPO_ROOT / rel
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        prev = previous.get(rel)
+        if prev and prev[0] == st.st_size and prev[1] == st.st_mtime_ns:
+            result[rel] = prev
+        else:
+            result[rel] = [st.st_size, st.st_mtime_ns, _sha256(path)]
+    return result
+
+
+def load_state() -> dict:
+    try:
+        with open(STATE_FILE, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("format") == STATE_FORMAT:
+            return state
+    except (OSError, ValueError):
+        pass
+    return {"format": STATE_FORMAT, "stages": {}}
+
+
+def save_state(state: dict) -> None:
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = STATE_FILE.with_suffix(".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(tmp_file, STATE_FILE)
+
+
+def check_stage(stage: Stage, record: dict | None, force: bool) -> tuple[str, str, dict]:
+    """Decide what to do with a stage whose dependencies are finished.
+
+    Returns:
+        (status, reason, files): status is "run", "fresh" or "blocked";
+        files is the current fingerprint (to refresh the record's mtimes)
+    """
+    inputs, missing = resolve(stage.inputs + stage.tool_files())
+    if missing:
+        return "blocked", "missing inputs: " + ", ".join(missing), {}
+    outputs, _ = resolve(stage.outputs)
+    previous = record.get("files", {}) if record else {}
+    files = fingerprint(sorted(set(inputs) | set(outputs)), previous)
+
+    if force:
+        return "run", "forced", files
+    if record is None:
+        return "run", "never built", files
+    if record.get("args") != stage.args:
+        return "run", "arguments changed", files
+    if not outputs:
+        return "run", "no outputs", files
+    changed = sorted(rel for rel in set(files) | set(previous) if rel not in files or rel not in previous or files[rel][2] != previous[rel][2])
+    if changed:
+        more = f" (+{len(changed) - 1} more)" if len(changed) > 1 else ""
+        return "run", f"changed: {changed[0]}{more}", files
+    return "fresh", "up to date", files
+
+
+# ---------------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------------
+
+
+def run_stage(stage: Stage, force: bool) -> tuple[int, float, Path]:
+    """Run one stage as a child process, capturing its output to a log file."""
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    log_path = LOG_DIR / f"{stage.name.replace(':', '-')}.log"
+    env = dict(os.environ, PYTHONIOENCODING="utf-8")
+    start = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        try:
+            returncode = subprocess.run(stage.command(force), cwd=REPO_ROOT, stdout=log, stderr=subprocess.STDOUT, env=env).returncode
+        except OSError as e:
+            log.write(f"Failed to start: {e}\n")
+            returncode = -1
+    return returncode, time.perf_counter() - start, log_path
+
+
+def _log_tail(log_path: Path, lines: int = 15) -> list[str]:
+    try:
+        text = log_path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return []
+    return text.rstrip().splitlines()[-lines:]
+
+
+def build(stages: dict[str, Stage], jobs: int, force: bool = False, dry_run: bool = False, verbose: bool = False) -> int:
+    """Run every stale stage, dependencies first. Returns a process exit code."""
+    state = load_state()
+    records = state["stages"]
+    result: dict[str, str] = {}  # name -> ran / fresh / blocked / failed / skipped / stale (dry run)
+    timings: dict[str, float] = {}
+    state_dirty = False
+    start = time.perf_counter()
+
+    def ready(name: str) -> bool:
+        return all(result.get(dep) is not None for dep in stages[name].deps if dep in stages)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        running: dict = {}
+        pending = list(stages)
+        while pending or running:
+            for name in [n for n in pending if ready(n)]:
+                pending.remove(name)
+                stage = stages[name]
+                failed_deps = [d for d in stage.deps if result.get(d) in ("failed", "skipped")]
+                if failed_deps:
+                    result[name] = "skipped"
+                    print(f"  SKIP     {name}  (dependency failed: {', '.join(failed_deps)})")
+                    continue
+                status, reason, files = check_stage(stage, records.get(name), force)
+                stale_deps = [d for d in stage.deps if result.get(d) == "stale"]
+                if dry_run and stale_deps and status == "fresh":
+                    status, reason = "run", f"after {', '.join(stale_deps)}"
+                if status == "blocked":
+                    result[name] = "blocked"
+                    print(f"  SKIP     {name}  ({reason})")
+                elif status == "fresh":
+                    result[name] = "fresh"
+                    if files != records[name]["files"]:
+                        records[name]["files"] = files  # touched but identical
+                        state_dirty = True
+                    if verbose:
+                        print(f"  ok       {name}")
+                elif dry_run:
+                    result[name] = "stale"
+                    print(f"  STALE    {name}  ({reason})")
+                else:
+                    if verbose:
+                        print(f"  start    {name}  ({reason})")
+                    running[pool.submit(run_stage, stage, force)] = name
+
+            if not running:
+                if pending and not any(ready(n) for n in pending):
+                    raise RuntimeError(f"Unresolvable stage dependencies: {', '.join(pending)}")
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                stage = stages[name]
+                returncode, seconds, log_path = future.result()
+                timings[name] = seconds
+                if returncode != 0:
+                    result[name] = "failed"
+                    print(f"  FAILED   {name}  (exit {returncode}, {seconds:.1f}s) - {log_path}")
+                    for line in _log_tail(log_path):
+                        print(f"           | {line}")
+                    continue
+                result[name] = "ran"
+                inputs, _ = resolve(stage.inputs + stage.tool_files())
+                outputs, _ = resolve(stage.outputs)
+                records[name] = {
+                    "args": stage.args,
+                    "files": fingerprint(sorted(set(inputs) | set(outputs)), {}),
+                    "seconds": round(seconds, 2),
+                }
+                state_dirty = True
+                save_state(state)  # keep progress if a later stage is interrupted
+                print(f"  built    {name}  ({seconds:.1f}s)")
+                if not outputs:
+                    print(f"           WARNING: no outputs matched {stage.outputs}")
+
+    if state_dirty and not dry_run:
+        save_state(state)
+
+    counts = {key: sum(1 for v in result.values() if v == key) for key in ("ran", "fresh", "blocked", "failed", "skipped", "stale")}
+    elapsed = time.perf_counter() - start
+    print(f"\n{'=' * 70}")
+    if dry_run:
+        print(f"DRY RUN: {counts['stale']} stale, {counts['fresh']} up to date, {counts['blocked']} skipped ({elapsed:.2f}s)")
+        print(f"{'=' * 70}")
+        return 0
+    print(
+        f"SUMMARY: {counts['ran']} built, {counts['fresh']} up to date, "
+        f"{counts['blocked'] + counts['skipped']} skipped, {counts['failed']} failed "
+        f"({elapsed:.2f}s wall, {sum(timings.values()):.1f}s in stages, {jobs} job(s))"
+    )
+    print(f"{'=' * 70}")
+    return 1 if counts["failed"] or counts["skipped"] else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Build the Thorne asset pipeline (dependency-ordered, incremental, parallel)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python build.py                       # Everything that is out of date
+  python build.py regen_slots           # All regen_slots:<Class> stages + upstream
+  python build.py regen_thorne:Bard     # One class atlas + upstream
+  python build.py --dry-run             # List stale stages without running them
+  python build.py --list                # Show the stage graph
+  python build.py --force               # Rebuild every stage
+
+Stages are skipped when none of their input/output files changed since their
+last successful run (.tmp/build-state.json). Stage output goes to
+.tmp/build-logs/<stage>.log; a failing stage prints the tail of its log.
+        """,
+    )
+    parser.add_argument("targets", nargs="*", help="Stage names or script names (default: all stages)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Maximum stages to run at once (default: number of CPU cores)")
+    parser.add_argument("--force", action="store_true", help="Run every selected stage and pass --force to scripts that accept it")
+    parser.add_argument("--dry-run", action="store_true", help="Report stale stages without running them")
+    parser.add_argument("--list", action="store_true", help="List stages, dependencies and outputs, then exit")
+    parser.add_argument("--verbose", action="store_true", help="Also report up-to-date stages and rebuild reasons")
+    args = parser.parse_args()
+
+    stages = plan_stages()
+    try:
+        stages = select_stages(stages, args.targets)
+    except KeyError as e:
+        print(f"ERROR: Unknown stage: {e.args[0]}")
+        print(f"  Available: {', '.join(plan_stages())}")
+        return 1
+
+    if args.list:
+        for stage in stages.values():
+            deps = f"  <- {', '.join(stage.deps)}" if stage.deps else ""
+            print(f"{stage.name}{deps}")
+            print(f"    {' '.join([stage.script] + stage.args)}")
+            for pattern in stage.outputs:
+                print(f"    -> {pattern}")
+        return 0
+
+    print(f"{'=' * 70}")
+    print(f"BUILD: {len(stages)} stage(s), {args.jobs} job(s)" + (" [dry run]" if args.dry_run else ""))
+    print(f"{'=' * 70}")
+    return build(stages, args.jobs, force=args.force, dry_run=args.dry_run, verbose=args.verbose)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
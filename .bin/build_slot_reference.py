@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Build a class-to-icon reference for equipment slot art selection.
 
-Reads eq_items.csv (produced by extract_eq_items.py) and generates a
+Reads the item store (eq_items.npz, produced by extract_eq_items.py) and generates a
 reference mapping of which dragitem icons are used by which EQ class
 archetypes at each equipment slot.
 
@@ -17,16 +17,17 @@ import os
 import sys
 from collections import defaultdict
 
+import eq_items_store
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
 CACHE_DIR = os.path.join(PROJECT_ROOT, '.master', 'items', '.cache')
 
-CSV_IN = os.path.join(CACHE_DIR, 'eq_items.csv')
 JSON_OUT = os.path.join(CACHE_DIR, 'slot_icon_reference.json')
 CSV_OUT = os.path.join(CACHE_DIR, 'slot_icon_reference.csv')
 
-if not os.path.exists(CSV_IN):
-    print("ERROR: eq_items.csv not found. Run extract_eq_items.py first.")
+if not (os.path.exists(eq_items_store.STORE_PATH) or os.path.exists(eq_items_store.CSV_PATH)):
+    print("ERROR: eq_items.npz/csv not found. Run extract_eq_items.py first.")
     sys.exit(1)
 
 # ============================================================
@@ -104,20 +105,13 @@ def archetype_for_classes(class_set):
 
 def main():
     # Load items
-    items = []
-    with open(CSV_IN, encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            items.append(row)
+    store = eq_items_store.load_items()
 
-    print(f"Loaded {len(items)} items from eq_items.csv")
+    print(f"Loaded {len(store)} items from {store.source}")
 
     # Filter to equippable items (slots > 0, itemclass=0 Common)
-    equippable = [
-        i for i in items
-        if int(i['slots']) > 0 and int(i['itemclass']) == 0
-    ]
-    print(f"Equippable items: {len(equippable)}")
+    equippable_mask = (store['slots'] > 0) & (store['itemclass'] == 0)
+    print(f"Equippable items: {int(equippable_mask.sum())}")
 
     # ============================================================
     # BUILD: slot → icon → class data
@@ -144,26 +138,25 @@ def main():
         'dragitem_col': 0,
     }))
 
-    for item in equippable:
-        slots_bitmask = int(item['slots'])
-        classes_bitmask = int(item['classes'])
-        icon = int(item['icon'])
+    # Class bitmask → (class set, archetypes), decoded once per distinct mask
+    decoded = {}
+    for classes_bitmask in set(store['classes'][equippable_mask].tolist()):
         class_set = decode_class_set(classes_bitmask)
-        archetypes = archetype_for_classes(class_set)
-        itemtype = int(item['itemtype'])
-
-        for slot_bit, slot_name in SLOT_BITS.items():
-            if slots_bitmask & slot_bit:
-                entry = slot_data[slot_name][icon]
-                entry['classes'].update(class_set)
-                entry['archetypes'].update(archetypes)
-                entry['itemtypes'].add(itemtype)
-                entry['item_count'] += 1
-                entry['dragitem_file'] = int(item['dragitem_file'])
-                entry['dragitem_row'] = int(item['dragitem_row'])
-                entry['dragitem_col'] = int(item['dragitem_col'])
-                if len(entry['example_names']) < 5:
-                    entry['example_names'].append(item['Name'])
+        decoded[classes_bitmask] = (class_set, archetype_for_classes(class_set))
+
+    for slot_bit, slot_name in SLOT_BITS.items():
+        for item in store.records(equippable_mask & store.slot_mask(slot_bit)):
+            class_set, archetypes = decoded[item['classes']]
+            entry = slot_data[slot_name][item['icon']]
+            entry['classes'].update(class_set)
+            entry['archetypes'].update(archetypes)
+            entry['itemtypes'].add(item['itemtype'])
+            entry['item_count'] += 1
+            entry['dragitem_file'] = item['dragitem_file']
+            entry['dragitem_row'] = item['dragitem_row']
+            entry['dragitem_col'] = item['dragitem_col']
+            if len(entry['example_names']) < 5:
+                entry['example_names'].append(item['Name'])
 
     # ============================================================
     # BUILD: archetype → slot → ranked icons
@@ -232,7 +225,7 @@ def main():
         '_meta': {
             'description': 'Icon reference for Thorne UI class-specific slot art',
             'source': 'eq_items.csv (Quarm database)',
-            'total_equippable': len(equippable),
+            'total_equippable': int(equippable_mask.sum()),
             'archetypes': {k: sorted(v) for k, v in ARCHETYPES.items()},
             'slot_order': SLOT_ORDER,
         },
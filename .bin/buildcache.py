@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Content-hash incremental build cache for the regen_* texture scripts.
+
+Each output directory keeps a small manifest (``.<script>-cache.json``)
+mapping every generated file to the digest of the inputs that produced it:
+
+    - decoded source pixels (RGBA bytes + size, so a re-saved TGA with the
+      same pixels still hits)
+    - the merged config that drove generation (serialized with sort_keys)
+    - the script version (hash of the generator script and its helper
+      modules, so code changes invalidate everything they touch)
+
+A task is skipped when all of its outputs exist, their digest matches, and
+their size/mtime still match what was recorded (a hand-edited or deleted
+output is regenerated). Source pixel digests are memoized by path, size and
+mtime so unchanged sources are not decoded twice.
+
+Usage:
+    cache = BuildCache(output_dir, "regen_gems", script_version(__file__))
+    digest = cache.digest(sources=[src_tga], config=merged_config, key="gemicons")
+    if not cache.is_fresh([out_tga], digest):
+        ...generate out_tga...
+        cache.record([out_tga], digest)
+    cache.save()
+    stats["cache"] = cache.summary()
+
+Worker processes build their own BuildCache on the same directory and hand
+back export(); the parent merge()s it and is the only writer of the manifest.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Iterable
+
+try:
+    from PIL import Image
+    import imagecache
+except ImportError:  # pragma: no cover - every regen script already requires Pillow
+    Image = None
+
+CACHE_FORMAT = 1
+
+
+def script_version(*paths: str | Path) -> str:
+    """Hash the source of a generator script and its helper modules."""
+    h = hashlib.sha256()
+    for path in paths:
+        p = Path(path)
+        h.update(p.name.encode("utf-8"))
+        try:
+            h.update(p.read_bytes())
+        except OSError:
+            h.update(b"<missing>")
+    return h.hexdigest()[:16]
+
+
+def _stat_key(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+class BuildCache:
+    """Per-directory manifest of output digests with hit/miss accounting."""
+
+    def __init__(self, directory: Path, name: str, version: str, enabled: bool = True) -> None:
+        self.directory = Path(directory)
+        self.name = name
+        self.version = version
+        self.enabled = enabled
+        self.manifest_path = self.directory / f".{name}-cache.json"
+        self.hits = 0
+        self.misses = 0
+        self.outputs: dict[str, dict[str, Any]] = {}
+        self.sources: dict[str, dict[str, Any]] = {}
+        self.changes: dict[str, dict[str, Any]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.manifest_path.exists():
+            return
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("format") != CACHE_FORMAT:
+            return
+        self.outputs = data.get("outputs", {})
+        self.sources = data.get("sources", {})
+
+    def _key(self, path: Path) -> str:
+        path = Path(path)
+        try:
+            return path.resolve().relative_to(self.directory.resolve()).as_posix()
+        except ValueError:
+            return path.resolve().as_posix()
+
+    # ------------------------------------------------------------------
+    # Digests
+    # ------------------------------------------------------------------
+
+    def source_digest(self, path: Path) -> str:
+        """Digest of a source image's decoded RGBA pixels (memoized by size/mtime)."""
+        path = Path(path)
+        stat = _stat_key(path)
+        if stat is None:
+            return "missing"
+        memo_key = path.resolve().as_posix()
+        memo = self.sources.get(memo_key)
+        if memo and memo.get("stat") == stat:
+            return memo["digest"]
+
+        h = hashlib.sha256()
+        if Image is not None and path.suffix.lower() in (".tga", ".png", ".bmp", ".dds"):
+            try:
+                # Decoding through the shared cache also primes it for the
+                # generator that loads this source right after the digest
+                rgba = imagecache.load_rgba(path, shared=True)
+                h.update(f"{rgba.size[0]}x{rgba.size[1]}".encode("ascii"))
+                h.update(rgba.tobytes())
+            except Exception:
+                h.update(path.read_bytes())
+        else:
+            h.update(path.read_bytes())
+        digest = h.hexdigest()
+        self.sources[memo_key] = {"stat": stat, "digest": digest}
+        return digest
+
+    def digest(self, sources: Iterable[Path] = (), config: Any = None, key: str = "") -> str:
+        """Combine source pixels, merged config and script version into one digest.
+
+        Args:
+            sources: Source image (or data) files the output is derived from
+            config: JSON-serializable merged config that drove generation
+            key: Task discriminator (e.g. output width) within the directory
+        """
+        h = hashlib.sha256()
+        h.update(f"v{CACHE_FORMAT}:{self.version}:{key}".encode("utf-8"))
+        for src in sources:
+            h.update(b"\0")
+            h.update(Path(src).name.encode("utf-8"))
+            h.update(self.source_digest(src).encode("ascii"))
+        h.update(b"\0")
+        h.update(json.dumps(config, sort_keys=True, default=str).encode("utf-8"))
+        return h.hexdigest()
+
+    # ------------------------------------------------------------------
+    # Freshness
+    # ------------------------------------------------------------------
+
+    def is_fresh(self, outputs: Iterable[Path], digest: str) -> bool:
+        """True if every output exists unchanged and was built from digest.
+
+        Counts a hit or miss per output file.
+        """
+        outputs = [Path(p) for p in outputs]
+        fresh = self.enabled and bool(outputs)
+        if fresh:
+            for out in outputs:
+                entry = self.outputs.get(self._key(out))
+                if not entry or entry.get("digest") != digest or entry.get("stat") != _stat_key(out):
+                    fresh = False
+                    break
+        if fresh:
+            self.hits += len(outputs)
+        else:
+            self.misses += len(outputs)
+        return fresh
+
+    def record(self, outputs: Iterable[Path], digest: str, meta: Any = None) -> None:
+        """Record freshly written outputs as built from digest.
+
+        meta is an optional JSON-serializable payload (e.g. the per-item
+        stats produced while rendering) returned by meta() on later hits, so
+        skipped outputs still contribute complete -stats.json reports.
+        """
+        for out in outputs:
+            out = Path(out)
+            stat = _stat_key(out)
+            if stat is None:
+                continue
+            entry = {"digest": digest, "stat": stat}
+            if meta is not None:
+                entry["meta"] = meta
+            key = self._key(out)
+            self.outputs[key] = entry
+            self.changes[key] = entry
+
+    def export(self) -> dict[str, Any]:
+        """Entries and counters to hand back from a worker process."""
+        return {
+            "changes": self.changes,
+            "sources": self.sources,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def meta(self, output: Path) -> Any:
+        """Payload recorded with an output (None if none was stored)."""
+        entry = self.outputs.get(self._key(output))
+        return entry.get("meta") if entry else None
+
+    def merge(self, exported: dict[str, Any]) -> None:
+        """Fold in a worker BuildCache's export()."""
+        self.outputs.update(exported["changes"])
+        self.changes.update(exported["changes"])
+        self.sources.update(exported["sources"])
+        self.hits += exported["hits"]
+        self.misses += exported["misses"]
+
+    def save(self) -> None:
+        """Write the manifest (outputs that no longer exist are dropped)."""
+        outputs = {key: entry for key, entry in sorted(self.outputs.items()) if (self.directory / key).exists() or Path(key).is_absolute()}
+        data = {
+            "format": CACHE_FORMAT,
+            "script": self.name,
+            "version": self.version,
+            "outputs": outputs,
+            "sources": dict(sorted(self.sources.items())),
+        }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.manifest_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+        except OSError as e:
+            print(f"  WARNING: Failed to save build cache {self.manifest_path.name}: {e}")
+
+    def summary(self) -> dict[str, Any]:
+        """Hit/miss counters for the -stats.json report."""
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,17 @@
+@echo off
+REM deploy.bat - Wrapper to run deploy.py from .bin directory
+REM Incrementally deploys thorne_drak/ to thorne_dev/ (only changed files are written)
+REM
+REM Usage:
+REM   deploy.bat                                           (thorne_drak -> thorne_dev)
+REM   deploy.bat --dry-run --verbose                       (Show what would change)
+REM   deploy.bat --mirror                                  (Also delete files not in thorne_drak)
+REM   deploy.bat --dest D:\test\thorne_dev                 (Different target)
+
+setlocal
+
+set "SCRIPT_DIR=%~dp0"
+
+python "%SCRIPT_DIR%deploy.py" %*
+
+exit /b %errorlevel%
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Incremental file deploy for copyback (thorne_drak/) and thorne_dev/ syncs.
+
+The regen_* scripts, sync_option.py and the full-skin deploy below all go
+through Deployer.deploy(src, dst) instead of shutil.copy2:
+
+    - a file whose content is already at the destination is skipped; the
+      (size, mtime_ns) of both sides are remembered in .tmp/deploy-state.json,
+      so an unchanged pair costs two stat() calls and no reads, and a pair
+      whose stat changed is compared by sha256 before anything is written
+    - changed files are written to a temp file next to the destination and
+      renamed over it (the game never sees a half-written TGA/XML), using the
+      cheapest transfer the filesystem offers:
+        reflink      copy-on-write clone (Linux FICLONE: Btrfs, XFS, ...)
+        copy_file_range  in-kernel copy, no user-space buffers
+        buffered     plain copy (Windows, other platforms)
+      LINK_MODE "copy" skips the reflink attempt.
+      LINK_MODE "hardlink" links the destination to the source instead (no
+      data written at all; both paths then share one file, so edits made in
+      either place show up in both - opt in only for throwaway targets)
+    - bytes copied / linked / skipped are counted for the summary line
+
+Target and transfer mode are configurable per run or through the
+environment (THORNE_DEV_PATH, THORNE_DEPLOY_LINK=auto|hardlink|copy).
+
+Usage:
+    deployer = deploy.Deployer()
+    action = deployer.deploy(src, root_path / src.name)   # "copied", "reflinked", ..., "unchanged"
+    ...
+    deployer.save()
+    print(f"  {deployer.summary()}")
+
+    python .bin/deploy.py                  # full thorne_drak/ -> thorne_dev/ deploy
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SKIN_DIR = REPO_ROOT / "thorne_drak"
+STATE_PATH = REPO_ROOT / ".tmp" / "deploy-state.json"
+
+DEFAULT_DEV_PATH = Path(r"C:\TAKP\uifiles\thorne_dev")
+LINK_MODES = ("auto", "hardlink", "copy")
+
+# Same exclusions as sync-thorne-ui.bat (ROBOCOPY /XD, /XF)
+EXCLUDED_DIRS = {".git", "__pycache__", ".vscode"}
+EXCLUDED_FILES = ("*.backup_*", "*.bak", "*.old", "*.tmp", ".DS_Store", "Thumbs.db")
+
+FICLONE = 0x40049409  # _IOW(0x94, 9, int) from linux/fs.h
+STATE_FORMAT = 1
+
+
+def dev_path() -> Path:
+    """thorne_dev/ deploy target (THORNE_DEV_PATH overrides the TAKP default)."""
+    return Path(os.environ.get("THORNE_DEV_PATH") or DEFAULT_DEV_PATH)
+
+
+def default_link_mode() -> str:
+    mode = os.environ.get("THORNE_DEPLOY_LINK", "auto").strip().lower()
+    return mode if mode in LINK_MODES else "auto"
+
+
+def format_bytes(count: int) -> str:
+    if count < 1024:
+        return f"{count} B"
+    size = float(count)
+    for unit in ("KiB", "MiB", "GiB"):
+        size /= 1024
+        if size < 1024 or unit == "GiB":
+            break
+    return f"{size:.1f} {unit}"
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _clone(fsrc, fdst) -> bool:
+    """Copy-on-write clone of fsrc into fdst; False if unsupported here."""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        return True
+    except OSError:
+        return False
+
+
+def _copy_range(fsrc, fdst, size: int) -> None:
+    """In-kernel copy with os.copy_file_range, falling back to a buffered copy."""
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            offset = 0
+            while offset < size:
+                sent = copy_file_range(fsrc.fileno(), fdst.fileno(), size - offset, offset, offset)
+                if sent == 0:
+                    break
+                offset += sent
+            if offset == size:
+                return
+        except OSError:
+            pass  # cross-device on old kernels, unsupported filesystem, ...
+        fsrc.seek(0)
+        fdst.seek(0)
+        fdst.truncate()
+    shutil.copyfileobj(fsrc, fdst, 1 << 20)
+
+
+class Deployer:
+    """Copies files only when their content changed, with byte accounting."""
+
+    def __init__(self, link_mode: str | None = None, dry_run: bool = False, state_path: Path = STATE_PATH) -> None:
+        self.link_mode = link_mode or default_link_mode()
+        if self.link_mode not in LINK_MODES:
+            raise ValueError(f"link_mode must be one of {LINK_MODES}, got {self.link_mode!r}")
+        self.dry_run = dry_run
+        self.state_path = state_path
+        self.state = self._load_state()
+        self._dirty: dict[str, list[int]] = {}
+        self.counts = {"copied": 0, "reflinked": 0, "hardlinked": 0, "unchanged": 0}
+        self.bytes_copied = 0
+        self.bytes_linked = 0
+        self.bytes_skipped = 0
+        self._start = time.perf_counter()
+
+    def _load_state(self) -> dict[str, list[int]]:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("format") != STATE_FORMAT:
+            return {}
+        return data.get("files", {})
+
+    def save(self) -> None:
+        """Merge this run's file records into the state file (no-op in dry-run)."""
+        if self.dry_run or not self._dirty:
+            return
+        files = self._load_state()  # another process may have deployed meanwhile
+        files.update(self._dirty)
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_path.with_name(f"{self.state_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"format": STATE_FORMAT, "files": files}, f, separators=(",", ":"))
+            os.replace(tmp_path, self.state_path)
+        except OSError:
+            pass  # read-only checkout: next run re-hashes instead of trusting stats
+        self._dirty.clear()
+
+    def _record(self, key: str, src_st: os.stat_result, dst: Path) -> None:
+        if self.dry_run:
+            return
+        dst_st = dst.stat()
+        entry = [src_st.st_size, src_st.st_mtime_ns, dst_st.st_size, dst_st.st_mtime_ns]
+        self.state[key] = entry
+        self._dirty[key] = entry
+
+    def _transfer(self, src: Path, dst: Path, size: int) -> str:
+        tmp = dst.with_name(f".{dst.name}.{os.getpid()}.deploy-tmp")
+        try:
+            if self.link_mode == "hardlink":
+                try:
+                    os.link(src, tmp)
+                    os.replace(tmp, dst)
+                    return "hardlinked"
+                except OSError:
+                    tmp.unlink(missing_ok=True)  # cross-device or unsupported: copy instead
+            with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+                if self.link_mode != "copy" and _clone(fsrc, fdst):
+                    action = "reflinked"
+                else:
+                    _copy_range(fsrc, fdst, size)
+                    action = "copied"
+            shutil.copystat(src, tmp)
+            os.replace(tmp, dst)
+            return action
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    def deploy(self, src: str | Path, dst: str | Path) -> str:
+        """Make dst hold src's content. Returns the action taken:
+        "unchanged", "copied", "reflinked" or "hardlinked" (dry-run reports
+        "copied" for anything that would be written).
+        """
+        src, dst = Path(src), Path(dst)
+        src_st = src.stat()
+        key = os.path.abspath(dst)
+        try:
+            dst_st = dst.stat()
+        except OSError:
+            dst_st = None
+
+        if dst_st is not None and dst_st.st_size == src_st.st_size:
+            known = self.state.get(key)
+            current = [src_st.st_size, src_st.st_mtime_ns, dst_st.st_size, dst_st.st_mtime_ns]
+            if known == current or (dst_st.st_ino == src_st.st_ino and dst_st.st_dev == src_st.st_dev and dst_st.st_ino) or _sha256(src) == _sha256(dst):
+                if known != current:
+                    self._record(key, src_st, dst)
+                self.counts["unchanged"] += 1
+                self.bytes_skipped += src_st.st_size
+                return "unchanged"
+
+        if self.dry_run:
+            action = "copied"
+        else:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            action = self._transfer(src, dst, src_st.st_size)
+            self._record(key, src_st, dst)
+        self.counts[action] += 1
+        if action == "copied":
+            self.bytes_copied += src_st.st_size
+        else:
+            self.bytes_linked += src_st.st_size
+        return action
+
+    @property
+    def changed(self) -> int:
+        return self.counts["copied"] + self.counts["reflinked"] + self.counts["hardlinked"]
+
+    def summary(self) -> str:
+        """One-line report: files updated/unchanged and bytes moved."""
+        linked = self.counts["reflinked"] + self.counts["hardlinked"]
+        return (
+            f"{self.changed} updated ({self.counts['copied']} copied, {linked} linked), "
+            f"{self.counts['unchanged']} unchanged; "
+            f"{format_bytes(self.bytes_copied)} moved, {format_bytes(self.bytes_linked)} linked, "
+            f"{format_bytes(self.bytes_skipped)} skipped "
+            f"({time.perf_counter() - self._start:.2f}s)"
+        )
+
+
+def _excluded(name: str) -> bool:
+    return any(fnmatch.fnmatch(name, pattern) for pattern in EXCLUDED_FILES)
+
+
+def skin_files(source: Path) -> list[Path]:
+    """Every deployable file under source (relative paths, sync-thorne-ui.bat exclusions)."""
+    files: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(source):
+        dirnames[:] = sorted(d for d in dirnames if d not in EXCLUDED_DIRS)
+        rel_dir = Path(dirpath).relative_to(source)
+        files.extend(rel_dir / name for name in sorted(filenames) if not _excluded(name))
+    return files
+
+
+def deploy_tree(source: Path, dest: Path, deployer: Deployer, mirror: bool = False, verbose: bool = False) -> int:
+    """Deploy every skin file from source to dest; returns files removed by mirror."""
+    wanted = skin_files(source)
+    for rel in wanted:
+        action = deployer.deploy(source / rel, dest / rel)
+        if verbose and action != "unchanged":
+            print(f"  {action:<10} {rel.as_posix()}")
+
+    removed = 0
+    if mirror and dest.exists():
+        keep = {rel.as_posix().lower() for rel in wanted}
+        for rel in skin_files(dest):
+            if rel.as_posix().lower() not in keep:
+                if not deployer.dry_run:
+                    (dest / rel).unlink()
+                removed += 1
+                if verbose:
+                    print(f"  {'removed':<10} {rel.as_posix()}")
+    return removed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Incrementally deploy thorne_drak/ to thorne_dev/ (only changed files are written)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python .bin/deploy.py                         # thorne_drak/ -> thorne_dev/
+  python .bin/deploy.py --dry-run --verbose     # Show what would change
+  python .bin/deploy.py --mirror                # Also delete files not in thorne_drak/
+  python .bin/deploy.py --dest D:\\test\\thorne_dev --link hardlink
+
+Environment:
+  THORNE_DEV_PATH     Default destination (instead of C:\\TAKP\\uifiles\\thorne_dev)
+  THORNE_DEPLOY_LINK  auto (reflink, else in-kernel copy) | hardlink | copy
+
+The regen_* scripts and sync_option.py use the same module for their
+copyback/deploy steps, so those honour the same settings.
+        """,
+    )
+    parser.add_argument("--source", default=str(SKIN_DIR), help=f"Skin directory to deploy (default: {SKIN_DIR})")
+    parser.add_argument("--dest", default=None, help=f"Destination directory (default: {DEFAULT_DEV_PATH} or THORNE_DEV_PATH)")
+    parser.add_argument("--link", choices=LINK_MODES, default=None, help="Transfer mode (default: THORNE_DEPLOY_LINK or auto)")
+    parser.add_argument("--mirror", action="store_true", help="Delete destination files that are not in the source (like ROBOCOPY /MIR)")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing")
+    parser.add_argument("--verbose", action="store_true", help="List every file written or removed")
+    args = parser.parse_args()
+
+    source = Path(args.source)
+    dest = Path(args.dest) if args.dest else dev_path()
+    if not source.is_dir():
+        print(f"ERROR: Source directory not found: {source}")
+        return 1
+
+    deployer = Deployer(link_mode=args.link, dry_run=args.dry_run)
+    print(f"{'=' * 70}")
+    print(f"DEPLOY: {source} -> {dest}")
+    print(f"Mode: {deployer.link_mode}{' (dry-run)' if args.dry_run else ''}")
+    print(f"{'=' * 70}")
+
+    removed = deploy_tree(source, dest, deployer, mirror=args.mirror, verbose=args.verbose)
+    deployer.save()
+
+    print(f"\nSUMMARY: {deployer.summary()}")
+    if args.mirror:
+        print(f"  {removed} file(s) {'would be ' if args.dry_run else ''}removed (not in source)")
+    if deployer.changed and not args.dry_run:
+        print("\nReady to test in-game with: /loadskin thorne_dev")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
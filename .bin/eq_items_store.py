@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Typed columnar item store shared by the item data pipeline.
+
+extract_eq_items.py writes .master/items/.cache/eq_items.npz (compressed) next to
+eq_items.csv: one NumPy array per CSV column (int64 for numeric fields,
+fixed-width unicode for names/decoded strings), in the same (icon, id) row
+order as the CSV, plus prebuilt bit indexes:
+
+    slot_index   (n_slot_bits,  n_items) packed bits - item fits slot bit
+    class_index  (n_class_bits, n_items) packed bits - item usable by class bit
+    n_classes    popcount of the classes bitmask per item
+
+Downstream scripts (build_slot_reference.py, pick_class_icons.py) load it
+through load_items() and filter with boolean array masks instead of
+re-parsing the CSV into string dicts:
+
+    store = load_items()
+    mask = store.slot_mask(4) & store.class_mask(1024) & (store['itemclass'] == 0)
+    for item in store.records(mask):
+        ...
+
+If the .npz is missing or older than eq_items.csv (e.g. the CSV came from an
+older extract run) the store is rebuilt from the CSV and written back.
+"""
+
+import csv
+import io
+import os
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+CACHE_DIR = os.path.join(PROJECT_ROOT, ".master", "items", ".cache")
+
+CSV_PATH = os.path.join(CACHE_DIR, "eq_items.csv")
+STORE_PATH = os.path.join(CACHE_DIR, "eq_items.npz")
+
+STORE_FORMAT = 1
+
+# Columns kept as text; every other column is an integer
+STRING_FIELDS = ("Name", "itemclass_str", "itemtype_str", "classes_str", "slots_str", "idfile", "lore")
+
+# Every slot bit (Charm .. Ammo) and class bit (WAR .. BER) gets an index row
+SLOT_INDEX_BITS = tuple(1 << b for b in range(22))
+CLASS_INDEX_BITS = tuple(1 << b for b in range(16))
+
+
+def _bit_index(values, bits):
+    """Packed (len(bits), n) bit matrix: row k is values & bits[k] != 0."""
+    rows = np.stack([(values & bit) != 0 for bit in bits]) if len(values) else np.zeros((len(bits), 0), dtype=bool)
+    return np.packbits(rows, axis=1)
+
+
+def _save(f, items, fields):
+    """Serialize typed columns and bit indexes into an open file."""
+    columns = {}
+    for name in fields:
+        values = [item.get(name, "" if name in STRING_FIELDS else 0) for item in items]
+        if name in STRING_FIELDS:
+            columns[name] = np.array([str(v) for v in values], dtype=str)
+        else:
+            columns[name] = np.array(values, dtype=np.int64)
+
+    classes = columns.get("classes", np.zeros(len(items), dtype=np.int64))
+    slots = columns.get("slots", np.zeros(len(items), dtype=np.int64))
+
+    np.savez_compressed(
+        f,
+        _format=np.array(STORE_FORMAT),
+        _fields=np.array(list(fields), dtype=str),
+        _slot_index=_bit_index(slots, SLOT_INDEX_BITS),
+        _class_index=_bit_index(classes, CLASS_INDEX_BITS),
+        _n_classes=np.array([bin(v).count("1") for v in classes.tolist()], dtype=np.int8),
+        **{f"col_{name}": arr for name, arr in columns.items()},
+    )
+
+
+def write_store(items, fields, path=STORE_PATH):
+    """Write item dicts (already in output row order) as a columnar .npz.
+
+    Args:
+        items: List of item dicts as produced by extract_eq_items.extract_item
+        fields: Column names to store (the CSV header)
+        path: Destination .npz
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        _save(f, items, fields)
+    os.replace(tmp_path, path)
+
+
+def _items_from_csv(csv_path):
+    """Read eq_items.csv into (items, fields) with typed values."""
+    with open(csv_path, encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        fields = list(reader.fieldnames or [])
+        items = [{k: (v if k in STRING_FIELDS else int(v)) for k, v in row.items()} for row in reader]
+    return items, fields
+
+
+class ItemStore:
+    """Column arrays plus slot/class bit indexes for the extracted items."""
+
+    def __init__(self, data, source):
+        self.source = source
+        self.fields = [str(name) for name in data["_fields"]]
+        self.columns = {name: data[f"col_{name}"] for name in self.fields}
+        self.n_classes = data["_n_classes"]
+        n = len(self.n_classes)
+        self._slot_rows = np.unpackbits(data["_slot_index"], axis=1, count=n).astype(bool)
+        self._class_rows = np.unpackbits(data["_class_index"], axis=1, count=n).astype(bool)
+        self._rows = None
+
+    def __len__(self):
+        return len(self.n_classes)
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def _mask(self, rows, index_bits, column, bits):
+        if bits in index_bits:
+            return rows[index_bits.index(bits)]
+        return (self.columns[column] & bits) != 0
+
+    def slot_mask(self, bits):
+        """Boolean mask of items that fit any slot in the bitmask."""
+        return self._mask(self._slot_rows, SLOT_INDEX_BITS, "slots", bits)
+
+    def class_mask(self, bits):
+        """Boolean mask of items usable by any class in the bitmask."""
+        return self._mask(self._class_rows, CLASS_INDEX_BITS, "classes", bits)
+
+    def records(self, mask=None):
+        """Item dicts (native int/str values) in row order, optionally masked.
+
+        Dicts are built once and shared between calls, so selecting the same
+        item through different masks yields the same object.
+        """
+        if self._rows is None:
+            values = [self.columns[name].tolist() for name in self.fields]
+            self._rows = [dict(zip(self.fields, row)) for row in zip(*values)]
+        if mask is None:
+            return list(self._rows)
+        rows = self._rows
+        return [rows[k] for k in np.flatnonzero(mask).tolist()]
+
+
+def load_items(store_path=STORE_PATH, csv_path=CSV_PATH):
+    """Load the item store, rebuilding it from eq_items.csv when stale.
+
+    Raises:
+        FileNotFoundError: Neither the store nor the CSV exists
+    """
+    csv_mtime = os.path.getmtime(csv_path) if os.path.exists(csv_path) else None
+    if os.path.exists(store_path) and (csv_mtime is None or os.path.getmtime(store_path) >= csv_mtime):
+        try:
+            with np.load(store_path, allow_pickle=False) as data:
+                if int(data["_format"]) == STORE_FORMAT:
+                    return ItemStore(data, os.path.basename(store_path))
+        except (OSError, ValueError, KeyError):
+            pass
+
+    if csv_mtime is None:
+        raise FileNotFoundError(store_path)
+
+    items, fields = _items_from_csv(csv_path)
+    try:
+        write_store(items, fields, store_path)
+        source = store_path
+    except OSError:
+        # Read-only cache dir: keep the rebuilt store in memory
+        source = io.BytesIO()
+        _save(source, items, fields)
+        source.seek(0)
+    with np.load(source, allow_pickle=False) as data:
+        return ItemStore(data, os.path.basename(csv_path))
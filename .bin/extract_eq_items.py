@@ -5,7 +5,7 @@ Parses INSERT INTO `items` VALUES(...) statements and outputs a CSV with
 all columns relevant to class-specific slot art mapping.
 
 Source: SecretsOTheP/EQMacEmu Quarm database dump
-Output: .master/items/.cache/eq_items.csv  (+.json)
+Output: .master/items/.cache/eq_items.csv  (+.json, +.npz typed column store)
 
 Usage:
     python .bin/extract_eq_items.py
@@ -15,9 +15,12 @@ import glob
 import io
 import json
 import os
+import re
 import sys
 from collections import Counter
 
+import eq_items_store
+
 # Ensure stdout can handle Unicode (Windows cp1252 workaround)
 if sys.stdout.encoding and sys.stdout.encoding.lower().startswith('cp'):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
@@ -43,6 +46,7 @@ os.makedirs(CACHE_DIR, exist_ok=True)
 
 CSV_OUT = os.path.join(CACHE_DIR, 'eq_items.csv')
 JSON_OUT = os.path.join(CACHE_DIR, 'eq_items.json')
+NPZ_OUT = os.path.join(CACHE_DIR, 'eq_items.npz')
 
 # ============================================================
 # COLUMN INDICES (0-based from CREATE TABLE `items`)
@@ -92,6 +96,9 @@ COLUMNS = {
 # Max column index we need to read
 MAX_COL = max(COLUMNS.values())
 
+# Dump is read in blocks of whole lines of roughly this many characters
+READ_CHUNK = 8 * 1024 * 1024
+
 # ============================================================
 # EQ REFERENCE DATA
 # ============================================================
@@ -148,72 +155,179 @@ def decode_slots(bitmask):
 # ============================================================
 # SQL PARSER
 # ============================================================
-
-def parse_row(row_str):
-    """Parse a single VALUES tuple into a list of field strings."""
-    fields = []
-    field = []
-    in_q = False
+# Streaming tokenizer for the `items` INSERT statements. Stripped lines are
+# appended to one buffer that is consumed by offset (only the unfinished
+# tail is carried over between lines), tuples are delimited with a single
+# regex match, and a second regex captures just the COLUMNS fields. Quoting
+# and escaping follow the original character-by-character parser exactly:
+# a backslash escapes the next character inside or outside quotes, a quote
+# toggles quoting and is dropped, and each field is whitespace-stripped.
+
+# Characters that change tuple-scanner state outside / inside a quoted string
+_SPECIAL_OUT = re.compile(r"[\\'()]")
+_SPECIAL_IN = re.compile(r"[\\']")
+
+# A complete (...) tuple with no nested parentheses outside quotes
+_TUPLE = re.compile(r"\((?:[^'\\()]++|\\.|'(?:[^'\\]++|\\.)*+')*+\)", re.DOTALL)
+
+# One raw field: unquoted text, escapes and quoted segments up to a comma
+_FIELD = r"(?:[^,'\\]++|\\.|'(?:[^'\\]++|\\.)*+')*+"
+
+
+def _build_row_pattern():
+    """Regex capturing the COLUMNS fields of a tuple with > MAX_COL fields."""
+    wanted = set(COLUMNS.values())
+    parts = [f"({_FIELD})" if idx in wanted else _FIELD for idx in range(MAX_COL + 1)]
+    return re.compile(",".join(parts) + r"(?:,|\Z)", re.DOTALL)
+
+
+_ROW = _build_row_pattern()
+_ROW_GROUPS = sorted(COLUMNS.values())
+
+
+def _unquote(raw):
+    """Decode one raw field: drop quotes, apply backslash escapes, strip."""
+    if "\\" not in raw:
+        if "'" not in raw:
+            return raw.strip()
+        # Common case: one plain quoted string (optionally space-padded)
+        body = raw.strip()
+        if len(body) >= 2 and body[0] == body[-1] == "'" and "'" not in body[1:-1]:
+            return body[1:-1].strip()
+    out = []
     esc = False
-    for c in row_str:
+    for c in raw:
         if esc:
-            field.append(c)
+            out.append(c)
             esc = False
         elif c == '\\':
             esc = True
-        elif c == "'" and not in_q:
-            in_q = True
-        elif c == "'" and in_q:
-            in_q = False
-        elif c == ',' and not in_q:
-            fields.append(''.join(field).strip())
-            field = []
+        elif c != "'":
+            out.append(c)
+    return ''.join(out).strip()
+
+
+def _scan_tuple(buffer, start):
+    """Find the end of the tuple opening at buffer[start] (slow path).
+
+    Handles nested parentheses outside quotes. Returns the index just past
+    the closing ')', or -1 if the tuple is not complete yet.
+    """
+    i = start + 1
+    depth = 1
+    in_quote = False
+    n = len(buffer)
+    while i < n:
+        m = (_SPECIAL_IN if in_quote else _SPECIAL_OUT).search(buffer, i)
+        if not m:
+            return -1
+        i = m.start()
+        c = buffer[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == "'":
+            in_quote = not in_quote
+        elif c == '(':
+            depth += 1
         else:
-            field.append(c)
-    fields.append(''.join(field).strip())
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return -1
+
+
+def parse_fields(buffer, start, end):
+    """Parse the tuple body buffer[start:end] into a field list.
+
+    Only COLUMNS indices are decoded (others are left empty). Returns None
+    if the tuple has MAX_COL or fewer fields.
+    """
+    m = _ROW.match(buffer, start, end)
+    if not m:
+        return None
+    fields = [''] * (MAX_COL + 1)
+    for idx, raw in zip(_ROW_GROUPS, m.groups()):
+        fields[idx] = raw.strip() if "'" not in raw and "\\" not in raw else _unquote(raw)
     return fields
 
 
-def extract_tuples(buffer):
-    """Extract complete (...) tuples from buffer.
+class ItemsTupleReader:
+    """Incrementally split one INSERT statement's text into field lists."""
 
-    Returns (list_of_tuple_strings, remaining_buffer).
+    def __init__(self, text=""):
+        self.buffer = text
+        self.pos = 0
+
+    def feed(self, text):
+        """Append text (a stripped dump line); return fields of completed tuples."""
+        if self.pos:
+            self.buffer = self.buffer[self.pos:] + text
+            self.pos = 0
+        else:
+            self.buffer += text
+        return self.drain()
+
+    def drain(self):
+        """Parse every complete tuple in the buffer, keeping the unfinished tail."""
+        rows = []
+        buffer = self.buffer
+        pos = self.pos
+        while True:
+            start = buffer.find('(', pos)
+            if start == -1:
+                self.buffer, self.pos = "", 0
+                return rows
+            m = _TUPLE.match(buffer, start)
+            end = m.end() if m else _scan_tuple(buffer, start)
+            if end == -1:
+                self.pos = start
+                return rows
+            fields = parse_fields(buffer, start + 1, end - 1)
+            if fields is not None:
+                rows.append(fields)
+            pos = end
+
+
+class ItemsDump:
+    """Iterate the field lists of every `items` tuple in a Quarm SQL dump.
+
+    Mirrors the line-oriented statement handling of mysqldump output: an
+    `INSERT INTO \`items\` VALUES` line starts a statement, continuation
+    lines are stripped and appended, and a new statement or a table, lock or
+    comment line ends it (an unfinished tuple is discarded). The file is read
+    in blocks of whole lines of about chunk_size characters.
     """
-    tuples = []
-    while buffer:
-        start = buffer.find('(')
-        if start == -1:
-            buffer = ""
-            break
-
-        i = start + 1
-        depth = 1
-        in_quote = False
-        escaped = False
-        while i < len(buffer) and depth > 0:
-            c = buffer[i]
-            if escaped:
-                escaped = False
-            elif c == '\\':
-                escaped = True
-            elif c == "'" and not in_quote:
-                in_quote = True
-            elif c == "'" and in_quote:
-                in_quote = False
-            elif not in_quote:
-                if c == '(':
-                    depth += 1
-                elif c == ')':
-                    depth -= 1
-            i += 1
-
-        if depth > 0:
-            break  # incomplete tuple, need more data
-
-        tuples.append(buffer[start + 1:i - 1])
-        buffer = buffer[i:].lstrip(' ,;\n\r')
-
-    return tuples, buffer
+
+    PREFIX = "INSERT INTO `items` VALUES"
+    ENDERS = ("INSERT INTO", "CREATE TABLE", "LOCK TABLES", "UNLOCK TABLES", "/*!", "--")
+
+    def __init__(self, path, chunk_size=READ_CHUNK):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.insert_count = 0
+
+    def __iter__(self):
+        reader = None
+        with open(self.path, 'r', encoding='utf-8', errors='replace', buffering=self.chunk_size) as f:
+            while True:
+                lines = f.readlines(self.chunk_size)
+                if not lines:
+                    break
+                for line in lines:
+                    if line.startswith(self.PREFIX):
+                        self.insert_count += 1
+                        reader = ItemsTupleReader(line[len(self.PREFIX):].strip())
+                        rows = reader.drain()
+                    elif reader is None:
+                        continue
+                    elif line.startswith(self.ENDERS):
+                        reader = None
+                        continue
+                    else:
+                        rows = reader.feed(line.strip())
+                    yield from rows
 
 
 def extract_item(fields):
@@ -259,51 +373,16 @@ def main():
     print(f"  Size: {os.path.getsize(SQL_FILE) / 1_000_000:.1f} MB")
     print(f"Output: {CSV_OUT}")
     print(f"        {JSON_OUT}")
+    print(f"        {NPZ_OUT}")
     print()
 
     items = []
-    in_items = False
-    buffer = ""
-    insert_count = 0
-
-    with open(SQL_FILE, 'r', encoding='utf-8', errors='replace') as f:
-        for line in f:
-            if line.startswith("INSERT INTO `items` VALUES"):
-                in_items = True
-                insert_count += 1
-                buffer = line[len("INSERT INTO `items` VALUES"):].strip()
-            elif in_items:
-                if (line.startswith("INSERT INTO") or line.startswith("CREATE TABLE")
-                        or line.startswith("LOCK TABLES") or line.startswith("UNLOCK TABLES")
-                        or line.startswith("/*!") or line.startswith("--")):
-                    # Process remaining buffer
-                    if buffer:
-                        tuples, _ = extract_tuples(buffer)
-                        for t in tuples:
-                            item = extract_item(parse_row(t))
-                            if item:
-                                items.append(item)
-                    in_items = False
-                    buffer = ""
-                    continue
-                buffer += line.strip()
-
-            if not in_items or not buffer:
-                continue
-
-            tuples, buffer = extract_tuples(buffer)
-            for t in tuples:
-                item = extract_item(parse_row(t))
-                if item:
-                    items.append(item)
-
-    # Flush remaining
-    if buffer:
-        tuples, _ = extract_tuples(buffer)
-        for t in tuples:
-            item = extract_item(parse_row(t))
-            if item:
-                items.append(item)
+    dump = ItemsDump(SQL_FILE)
+    for fields in dump:
+        item = extract_item(fields)
+        if item:
+            items.append(item)
+    insert_count = dump.insert_count
 
     print(f"Processed {insert_count} INSERT statements")
     print(f"Total items extracted: {len(items)}")
@@ -329,12 +408,19 @@ def main():
         'idfile', 'lore',
     ]
 
+    sorted_items = sorted(items, key=lambda x: (x['icon'], x['id']))
     with open(CSV_OUT, 'w', newline='', encoding='utf-8') as f:
         writer = csv.DictWriter(f, fieldnames=csv_fields, extrasaction='ignore')
         writer.writeheader()
-        for item in sorted(items, key=lambda x: (x['icon'], x['id'])):
+        for item in sorted_items:
             writer.writerow(item)
 
+    # ============================================================
+    # WRITE NPZ (typed columns + slot/class bit indexes, same row order)
+    # ============================================================
+    # Written after the CSV so its mtime marks it as current for load_items()
+    eq_items_store.write_store(sorted_items, csv_fields, NPZ_OUT)
+
     # ============================================================
     # WRITE JSON (organized by icon for programmatic access)
     # ============================================================
@@ -366,8 +452,10 @@ def main():
 
     csv_size = os.path.getsize(CSV_OUT)
     json_size = os.path.getsize(JSON_OUT)
+    npz_size = os.path.getsize(NPZ_OUT)
     print(f"\nWrote {CSV_OUT} ({csv_size / 1_000_000:.1f} MB)")
     print(f"Wrote {JSON_OUT} ({json_size / 1_000_000:.1f} MB)")
+    print(f"Wrote {NPZ_OUT} ({npz_size / 1_000_000:.1f} MB)")
 
     # ============================================================
     # SUMMARY STATS
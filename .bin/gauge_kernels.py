@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+Array-backed pixel kernels for regen_gauges.py.
+
+Each function here is a whole-image NumPy implementation of one of the
+per-pixel loops in GaugeGenerator. They take and return PIL images so the
+generator can swap them in stage-by-stage, and every kernel is written to be
+byte-identical with its loop counterpart:
+
+  - float math mirrors the Python expressions (float64, same operation order)
+  - int() truncation is reproduced with np.trunc on non-negative values
+  - round() is reproduced with np.rint (both round half to even)
+  - order-dependent passes (neighbor darkening) are replayed in the same
+    per-pixel order the loops use
+
+The loop implementations remain in regen_gauges.py as the reference path
+(`--no-numpy`) and as the fallback when NumPy is not installed.
+"""
+
+import numpy as np
+from PIL import Image
+
+
+# ============================================================================
+# Conversion helpers
+# ============================================================================
+
+
+def to_rgba_array(image):
+    """Return an (H, W, 4) uint8 copy of an RGBA image."""
+    return np.array(image.convert("RGBA"), dtype=np.uint8)
+
+
+def from_rgba_array(arr):
+    """Wrap an (H, W, 4) uint8 array as an RGBA image."""
+    return Image.fromarray(np.ascontiguousarray(arr, dtype=np.uint8))
+
+
+def black_pixels(arr, threshold):
+    """Boolean (H, W) mask of visible pixels whose RGB are all <= threshold."""
+    return (arr[..., 3] > 0) & (arr[..., 0] <= threshold) & (arr[..., 1] <= threshold) & (arr[..., 2] <= threshold)
+
+
+# ============================================================================
+# Masks and overlays
+# ============================================================================
+
+
+def build_black_mask(source, threshold):
+    """L-mode mask, 255 where source is black (see GaugeGenerator._build_black_mask)."""
+    arr = to_rgba_array(source)
+    mask = np.where(black_pixels(arr, threshold), 255, 0).astype(np.uint8)
+    return Image.fromarray(mask)
+
+
+def apply_black_mask_overlay(target, black_mask):
+    """Stamp opaque black onto target wherever black_mask is set."""
+    if target.size != black_mask.size:
+        return target
+    arr = to_rgba_array(target)
+    mask = np.array(black_mask, dtype=np.uint8) > 0
+    arr[mask] = (0, 0, 0, 255)
+    return from_rgba_array(arr)
+
+
+def extract_overlay(bg_section, threshold, interior_only=False):
+    """Copy black Background pixels onto a transparent canvas at full opacity."""
+    src = to_rgba_array(bg_section)
+    sel = black_pixels(src, threshold)
+    if interior_only:
+        interior = np.zeros_like(sel)
+        interior[1:-1, 1:-1] = True
+        sel &= interior
+    out = np.zeros_like(src)
+    out[sel, :3] = src[sel, :3]
+    out[sel, 3] = 255
+    return from_rgba_array(out)
+
+
+def recolor_marks(overlay, gray_level):
+    """Set RGB of every visible overlay pixel to gray_level, keeping alpha."""
+    arr = to_rgba_array(overlay)
+    arr[arr[..., 3] > 0, :3] = gray_level
+    return from_rgba_array(arr)
+
+
+def clear_edge_columns(image):
+    """Make the first and last columns fully transparent."""
+    arr = to_rgba_array(image)
+    arr[:, 0] = 0
+    arr[:, -1] = 0
+    return from_rgba_array(arr)
+
+
+# ============================================================================
+# Proportional black-mask scaling
+# ============================================================================
+
+
+def _scale_runs(mask, target_width):
+    """Map each horizontal black run in mask onto a row of target_width pixels.
+
+    Row-wise vectorization of the run walk in
+    GaugeGenerator._scale_black_mask_horizontal. Single-pixel runs and
+    multi-pixel runs share one formula: for a single pixel start == end, so
+    the clamped end collapses onto the clamped start.
+    """
+    src_h, src_w = mask.shape
+    out = np.zeros((src_h, target_width), dtype=np.uint8)
+    if src_w <= 1 or not mask.any():
+        return out
+
+    scale = (target_width - 1) / (src_w - 1)
+    padded = np.zeros((src_h, src_w + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    start_rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    ends = ends - 1  # inclusive
+
+    t_start = np.clip(np.rint(starts * scale).astype(np.int64), 0, target_width - 1)
+    t_end = np.minimum(target_width - 1, np.rint(ends * scale).astype(np.int64))
+    t_end = np.maximum(t_start, t_end)
+
+    # Paint the [t_start, t_end] spans with a per-row difference array
+    spans = np.zeros((src_h, target_width + 1), dtype=np.int32)
+    np.add.at(spans, (start_rows, t_start), 1)
+    np.add.at(spans, (start_rows, t_end + 1), -1)
+    covered = np.cumsum(spans[:, :-1], axis=1) > 0
+    out[covered] = 255
+    return out
+
+
+def scale_black_mask_horizontal(source, target_width, threshold):
+    """Target-width black mask by proportional run mapping (per row)."""
+    mask = black_pixels(to_rgba_array(source), threshold)
+    return Image.fromarray(_scale_runs(mask, target_width))
+
+
+def scale_black_mask_vertical(source, target_height, threshold):
+    """Target-height black mask by proportional run mapping (per column)."""
+    mask = black_pixels(to_rgba_array(source), threshold)
+    scaled = _scale_runs(mask.T, target_height).T
+    return Image.fromarray(np.ascontiguousarray(scaled))
+
+
+# ============================================================================
+# Column snapping
+# ============================================================================
+
+
+def _neighbor_source_columns(cols, flagged, w):
+    """For each flagged column pick its unflagged left neighbor, else right, else -1."""
+    left = cols - 1
+    right = cols + 1
+    left_ok = (left >= 1) & ~flagged[np.clip(left, 0, w - 1)]
+    right_ok = (right < w - 1) & ~flagged[np.clip(right, 0, w - 1)]
+    return np.where(left_ok, left, np.where(right_ok, right, -1))
+
+
+def snap_dark_columns(section, threshold, snap_positions):
+    """Vectorized GaugeGenerator._snap_dark_columns.
+
+    Returns (image, snapped_from) where snapped_from is the sorted list of
+    detected dark columns, or (section, None) when there is nothing to snap.
+    Dark columns never read from other dark columns, so every replacement
+    can be gathered from the untouched source in one step.
+    """
+    arr = to_rgba_array(section)
+    h, w = arr.shape[:2]
+    dark = black_pixels(arr, threshold)
+
+    is_dark_col = np.zeros(w, dtype=bool)
+    if h > 2 and w > 2:
+        is_dark_col[1 : w - 1] = dark[1 : h - 1, 1 : w - 1].any(axis=0)
+    dark_cols = np.flatnonzero(is_dark_col)
+    if dark_cols.size == 0:
+        return section, None
+
+    # Background sample: first non-dark interior column visible at mid row
+    bg_sample = None
+    mid_y = h // 2
+    for x in np.flatnonzero(~is_dark_col[1 : w - 1]) + 1:
+        if arr[mid_y, x, 3] > 0:
+            bg_sample = arr[mid_y, x].copy()
+            break
+
+    src_cols = _neighbor_source_columns(dark_cols, is_dark_col, w)
+    fallback = bg_sample if bg_sample is not None else np.zeros(4, dtype=np.uint8)
+    rows = slice(1, h - 1)
+    replacement = np.where(
+        (src_cols >= 0)[None, :, None],
+        arr[rows][:, np.clip(src_cols, 0, w - 1)],
+        fallback[None, None, :],
+    )
+    block = arr[rows][:, dark_cols]
+    hit = dark[rows][:, dark_cols]
+    block[hit] = replacement[hit]
+    arr[rows, dark_cols] = block
+
+    for target_x in snap_positions:
+        if 1 <= target_x < w - 1:
+            arr[1 : h - 1, target_x] = (0, 0, 0, 255)
+
+    return from_rgba_array(arr), [int(x) for x in dark_cols]
+
+
+def snap_fill_gaps(fill_section, snap_positions):
+    """Vectorized GaugeGenerator._snap_fill_gaps.
+
+    Returns (image, snapped_from), or (fill_section, None) when no gap
+    columns are detected.
+    """
+    arr = to_rgba_array(fill_section)
+    h, w = arr.shape[:2]
+
+    is_gap_col = np.zeros(w, dtype=bool)
+    if h > 2 and w > 2:
+        interior_alpha = arr[1 : h - 1, 1 : w - 1, 3]
+        transparent = (interior_alpha < 128).sum(axis=0)
+        is_gap_col[1 : w - 1] = transparent > (h - 2) * 0.5
+    gap_cols = np.flatnonzero(is_gap_col)
+    if gap_cols.size == 0:
+        return fill_section, None
+
+    src_cols = _neighbor_source_columns(gap_cols, is_gap_col, w)
+    rows = slice(1, h - 1)
+    block = arr[rows][:, gap_cols]
+    hit = (block[..., 3] < 255) & (src_cols >= 0)[None, :]
+    replacement = arr[rows][:, np.clip(src_cols, 0, w - 1)]
+    block[hit] = replacement[hit]
+    arr[rows, gap_cols] = block
+
+    for target_x in snap_positions:
+        if 1 <= target_x < w - 1:
+            arr[1 : h - 1, target_x] = 0
+
+    return from_rgba_array(arr), [int(x) for x in gap_cols]
+
+
+# ============================================================================
+# Composite rows
+# ============================================================================
+
+
+def fill_transparent_gaps(fill_section):
+    """Vectorized SolidFill gap filling (GaugeGenerator._generate_solidfill).
+
+    Every non-opaque pixel takes the color of its nearest fully opaque
+    neighbors in the same row: a linear interpolation when both sides exist,
+    otherwise a copy of the one side. Rows with no opaque pixel are untouched.
+    """
+    arr = to_rgba_array(fill_section)
+    h, w = arr.shape[:2]
+    opaque = arr[..., 3] == 255
+    cols = np.broadcast_to(np.arange(w), (h, w))
+
+    left_idx = np.maximum.accumulate(np.where(opaque, cols, -1), axis=1)
+    right_idx = np.minimum.accumulate(np.where(opaque, cols, w)[:, ::-1], axis=1)[:, ::-1]
+    has_left = left_idx >= 0
+    has_right = right_idx < w
+    target = ~opaque & (has_left | has_right)
+    if not target.any():
+        return from_rgba_array(arr)
+
+    row_idx = np.broadcast_to(np.arange(h)[:, None], (h, w))
+    left_rgb = arr[row_idx, np.clip(left_idx, 0, w - 1), :3].astype(np.float64)
+    right_rgb = arr[row_idx, np.clip(right_idx, 0, w - 1), :3].astype(np.float64)
+
+    # Opaque pixels are their own neighbors (span 0); they are never written
+    span = np.where(has_left & has_right, np.maximum(right_idx - left_idx, 1), 1)
+    t = (cols - left_idx) / span
+    blended = np.trunc(left_rgb + (right_rgb - left_rgb) * t[..., None])
+
+    rgb = np.where(
+        (has_left & has_right)[..., None],
+        blended,
+        np.where(has_left[..., None], left_rgb, right_rgb),
+    ).astype(np.uint8)
+
+    arr[target, :3] = rgb[target]
+    arr[target, 3] = 255
+    return from_rgba_array(arr)
+
+
+def blend_overlay_into_fill(solidfill, overlay, spread=1, darken=0.15):
+    """Vectorized GaugeGenerator._blend_overlay_into_fill.
+
+    The loop visits marks in row-major order and darkens every neighbor in
+    the (2*spread+1)^2 window, truncating to int after each multiply. For a
+    fixed pixel, marks earlier in row-major order sit at lexicographically
+    *larger* (dy, dx) offsets, so replaying offsets from (+spread, +spread)
+    down to (-spread, -spread) applies the same factors in the same order
+    to every pixel at once.
+    """
+    arr = to_rgba_array(solidfill)
+    marks = to_rgba_array(overlay)[..., 3] > 0
+    if not marks.any():
+        return from_rgba_array(arr)
+
+    h, w = marks.shape
+    visible = arr[..., 3] != 0
+    rgb = arr[..., :3].astype(np.float64)
+
+    for dy in range(spread, -spread - 1, -1):
+        for dx in range(spread, -spread - 1, -1):
+            if dx == 0 and dy == 0:
+                continue
+            if abs(dy) >= h or abs(dx) >= w:
+                continue  # no mark can reach a pixel this far away (spread larger than the image)
+            dist = max(abs(dx), abs(dy))
+            factor = 1.0 - darken * (1.0 - (dist - 1) / spread)
+            factor = max(0.0, min(1.0, factor))
+
+            # hit[y, x] is True when the pixel at (x, y) has a mark at (x - dx, y - dy)
+            hit = np.zeros((h, w), dtype=bool)
+            ys = slice(max(0, dy), min(h, h + dy))
+            xs = slice(max(0, dx), min(w, w + dx))
+            ms_y = slice(max(0, -dy), min(h, h - dy))
+            ms_x = slice(max(0, -dx), min(w, w - dx))
+            hit[ys, xs] = marks[ms_y, ms_x]
+            hit &= visible
+            rgb[hit] = np.trunc(rgb[hit] * factor)
+
+    arr[..., :3] = rgb.astype(np.uint8)
+    return Image.alpha_composite(from_rgba_array(arr), overlay)
+
+
+# ============================================================================
+# Black-free color layer
+# ============================================================================
+
+
+def chessboard_distance(blocked):
+    """Chebyshev distance from every pixel to the nearest unblocked pixel.
+
+    Two-pass chamfer transform (Rosenfeld-Pfaltz 3x3 chessboard masks),
+    exact for the L-infinity metric. Each pass walks rows in order; the
+    in-row dependency on the left (or right) neighbor is resolved with a
+    running minimum, so every row is one vector step. Pixels with no
+    unblocked pixel anywhere get a distance larger than the image.
+    """
+    h, w = blocked.shape
+    inf = h + w + 1
+    dist = np.where(blocked, inf, 0).astype(np.int64)
+    idx = np.arange(w)
+
+    for y in range(h):
+        row = dist[y]
+        if y > 0:
+            above = dist[y - 1] + 1
+            row = np.minimum(row, above)
+            row[1:] = np.minimum(row[1:], above[:-1])
+            row[:-1] = np.minimum(row[:-1], above[1:])
+        dist[y] = np.minimum.accumulate(row - idx) + idx
+
+    for y in range(h - 1, -1, -1):
+        row = dist[y]
+        if y < h - 1:
+            below = dist[y + 1] + 1
+            row = np.minimum(row, below)
+            row[1:] = np.minimum(row[1:], below[:-1])
+            row[:-1] = np.minimum(row[:-1], below[1:])
+        dist[y] = np.minimum.accumulate((row + idx)[::-1])[::-1] - idx
+
+    return dist
+
+
+def _next_open_index(open_mask, axis):
+    """First index >= i along axis where open_mask is True (size along axis if none).
+
+    The result is padded by one slot along axis so callers can look up
+    position size without bounds checks.
+    """
+    size = open_mask.shape[axis]
+    positions = np.arange(size).reshape([-1 if a == axis else 1 for a in range(open_mask.ndim)])
+    candidates = np.where(open_mask, positions, size)
+    candidates = np.flip(np.minimum.accumulate(np.flip(candidates, axis), axis=axis), axis)
+    pad = [(0, 1) if a == axis else (0, 0) for a in range(open_mask.ndim)]
+    return np.pad(candidates, pad, constant_values=size)
+
+
+def fill_black_from_nearest(source, threshold):
+    """Replace each black pixel with its nearest non-black pixel (Chebyshev metric).
+
+    Array replacement for the expanding-ring search in
+    GaugeGenerator._find_nearest_non_black_pixel, with the same answer for
+    every pixel. The ring search returns the first non-black pixel of the
+    first ring (radius D) that holds one, scanning in this order:
+
+      1. top and bottom rows of the ring, x ascending, top before bottom
+      2. left and right columns (corners excluded), y ascending, left first
+
+    Ring bounds are clamped to the image, and every pixel nearer than D is
+    black, so the first non-black pixel of a clamped row or column is always
+    at distance D. That makes the tie-break a lookup: D comes from the
+    chessboard distance transform, and "first non-black at or after i" tables
+    for rows and columns answer each of the four ring edges in O(1).
+
+    Black pixels in an image with no non-black pixel become fully
+    transparent.
+    """
+    arr = to_rgba_array(source)
+    h, w = arr.shape[:2]
+    black = black_pixels(arr, threshold)
+    out = arr.copy()
+    if not black.any():
+        return from_rgba_array(out)
+    if black.all():
+        out[black] = 0
+        return from_rgba_array(out)
+
+    dist = chessboard_distance(black)
+    open_mask = ~black
+    row_next = _next_open_index(open_mask, axis=1)  # (h, w + 1): next open x in row
+    col_next = _next_open_index(open_mask, axis=0)  # (h + 1, w): next open y in column
+
+    ys, xs = np.nonzero(black)
+    d = dist[ys, xs]
+    x_min = np.maximum(0, xs - d)
+    x_max = np.minimum(w - 1, xs + d)
+    y_min = np.maximum(0, ys - d)
+    y_max = np.minimum(h - 1, ys + d)
+
+    # 1. Top/bottom rows: smallest x wins, top row wins ties
+    top_x = row_next[y_min, x_min]
+    bot_x = row_next[y_max, x_min]
+    top_ok = top_x <= x_max
+    bot_ok = bot_x <= x_max
+    use_top = top_ok & (~bot_ok | (top_x <= bot_x))
+    use_bot = ~use_top & bot_ok
+
+    # 2. Left/right columns between the rows: smallest y wins, left wins ties
+    inner = np.minimum(y_min + 1, h)
+    left_y = col_next[inner, x_min]
+    right_y = col_next[inner, x_max]
+    left_ok = left_y <= y_max - 1
+    right_ok = right_y <= y_max - 1
+    use_left = ~(use_top | use_bot) & left_ok & (~right_ok | (left_y <= right_y))
+
+    src_x = np.where(use_top, top_x, np.where(use_bot, bot_x, np.where(use_left, x_min, x_max)))
+    src_y = np.where(use_top, y_min, np.where(use_bot, y_max, np.where(use_left, left_y, right_y)))
+    out[ys, xs] = arr[src_y, src_x]
+    return from_rgba_array(out)
+
+
+# ============================================================================
+# Column detection
+# ============================================================================
+
+
+def transparent_columns(section):
+    """Interior columns whose interior rows are all fully transparent."""
+    alpha = to_rgba_array(section)[..., 3]
+    h, w = alpha.shape
+    if w <= 2:
+        return []
+    interior = alpha[1 : h - 1, 1 : w - 1]
+    return [int(x) + 1 for x in np.flatnonzero(~(interior > 0).any(axis=0))]
+
+
+def dark_columns(section, threshold):
+    """Sorted interior columns containing at least one black interior pixel."""
+    dark = black_pixels(to_rgba_array(section), threshold)
+    h, w = dark.shape
+    if w <= 2:
+        return []
+    return [int(x) + 1 for x in np.flatnonzero(dark[1 : h - 1, 1 : w - 1].any(axis=0))]
@@ -34,7 +34,7 @@ Usage:
     python .bin/generate_catalog.py --force dragitem1  # Re-analyze even high-status items
     python .bin/generate_catalog.py --png            # Extract 40x40 cell PNGs from all TGAs
     python .bin/generate_catalog.py --png dragitem1  # Extract PNGs for one file
-    python .bin/generate_catalog.py --html           # Generate HTML contact sheets (all)
+    python .bin/generate_catalog.py --html           # Generate HTML contact sheets (all) + index
     python .bin/generate_catalog.py --html dragitem1 # Generate HTML contact sheet (one)
 
 Status Levels:
@@ -46,25 +46,31 @@ Files:
     .master/items/item_catalog.json     — Source of truth (compact, one item/line)
     .master/items/item_catalog.md       — Regenerated readable view
     .master/items/.cache/               — Feature cache and ASCII renders
+    .master/items/.cache/reference_index.npz — Stacked confirmed references (rebuilt when stale)
     .master/items/.cache/dragitemN/     — Per-file extracted cell PNGs
     .master/items/.cache/dragitemN.html — Per-file visual contact sheet
+    .master/items/.cache/dragitemN_sprite.png — Sheet sprite used by the contact sheets
+    .master/items/.cache/index.html     — Combined contact sheet, paginated (index-2.html, ...)
 """
 from __future__ import annotations
 
 import argparse
-import base64
-import io
 import json
 import math
 import sys
 import textwrap
+import time
 from collections import defaultdict
 from datetime import datetime
+from html import escape
 from pathlib import Path
 
 import numpy as np
 from PIL import Image
 
+import imagecache
+from reference_index import ReferenceIndex, source_key
+
 # ─── Paths ───────────────────────────────────────────────────────────
 
 REPO = Path(__file__).resolve().parent.parent
@@ -177,15 +183,7 @@ def get_features(cell: np.ndarray) -> dict | None:
     hollow = max(0, ef - cf) if ef > 0 else 0
 
     # Principal axis angle
-    if opaque > 10:
-        xs_c = xs - xs.mean()
-        ys_c = ys - ys.mean()
-        mxx = (xs_c ** 2).mean()
-        myy = (ys_c ** 2).mean()
-        mxy = (xs_c * ys_c).mean()
-        angle = 0.5 * math.degrees(math.atan2(2 * mxy, mxx - myy))
-    else:
-        angle = 0
+    angle = _principal_angle(xs, ys) if opaque > 10 else 0
 
     # Color
     opaque_rgb = rgb[mask]
@@ -227,6 +225,144 @@ def get_features(cell: np.ndarray) -> dict | None:
     }
 
 
+def _principal_angle(xs: np.ndarray, ys: np.ndarray) -> float:
+    """Orientation of the opaque pixels' principal axis, in degrees."""
+    xs_c = xs - xs.mean()
+    ys_c = ys - ys.mean()
+    mxx = (xs_c ** 2).mean()
+    myy = (ys_c ** 2).mean()
+    mxy = (xs_c * ys_c).mean()
+    return 0.5 * math.degrees(math.atan2(2 * mxy, mxx - myy))
+
+
+def sheet_cells(img: Image.Image) -> np.ndarray:
+    """All cells of a sprite sheet as an (N, 40, 40, 4) RGBA array.
+
+    Cell k is [row, col] = [k // GRID + 1, k % GRID + 1], with the same
+    pixels extract_cell() returns (areas outside the image are transparent).
+    """
+    span = GRID * CELL
+    arr = np.asarray(img.convert("RGBA") if img.mode != "RGBA" else img)
+    sheet = np.zeros((span, span, 4), dtype=np.uint8)
+    h, w = min(arr.shape[0], span), min(arr.shape[1], span)
+    sheet[:h, :w] = arr[:h, :w]
+    return sheet.reshape(GRID, CELL, GRID, CELL, 4).swapaxes(1, 2).reshape(GRID * GRID, CELL, CELL, 4)
+
+
+def get_features_batch(cells: np.ndarray) -> list[dict | None]:
+    """get_features() for a stack of cells (N, 40, 40, 4), one sheet or many.
+
+    Masks, moments, symmetry and profiles are computed as integer
+    reductions over the whole stack; only the final rounding into per-cell
+    dicts loops in Python. Every sum is exact, so each dict is identical to
+    get_features() on the same cell. The principal-axis angle comes from
+    exact integer central moments; cells where get_features' floating
+    point could round differently (zero cross moment, or an angle on a
+    rounding boundary) are recomputed with the per-cell formula.
+    """
+    n = len(cells)
+    if n == 0:
+        return []
+    total = CELL * CELL
+    half = CELL // 2
+    mask = cells[..., 3] >= ALPHA_THRESH                       # (N, 40, 40)
+    # float32 sums are exact here: every count and moment stays below 2**24
+    maskf = mask.astype(np.float32)
+    idx = np.arange(CELL, dtype=np.float32)
+    row_counts = np.count_nonzero(mask, axis=2)                 # opaque pixels per row
+    col_counts = np.count_nonzero(mask, axis=1)                 # ... per column
+    opaque = row_counts.sum(axis=1)
+
+    rows_any = row_counts > 0
+    cols_any = col_counts > 0
+    rmin = rows_any.argmax(axis=1)
+    rmax = CELL - 1 - rows_any[:, ::-1].argmax(axis=1)
+    cmin = cols_any.argmax(axis=1)
+    cmax = CELL - 1 - cols_any[:, ::-1].argmax(axis=1)
+
+    # Raw moments (exact integers)
+    sx = (col_counts @ idx).astype(np.int64)
+    sy = (row_counts @ idx).astype(np.int64)
+    sxx = (col_counts @ (idx * idx)).astype(np.int64)
+    syy = (row_counts @ (idx * idx)).astype(np.int64)
+    sxy = ((maskf @ idx) @ idx).astype(np.int64)
+
+    quads = np.stack([
+        np.count_nonzero(mask[:, :half, :half], axis=(1, 2)),
+        np.count_nonzero(mask[:, :half, half:], axis=(1, 2)),
+        np.count_nonzero(mask[:, half:, :half], axis=(1, 2)),
+        np.count_nonzero(mask[:, half:, half:], axis=(1, 2)),
+    ], axis=1)
+    h_match = np.count_nonzero(mask[:, :, :half] & mask[:, :, CELL - 1:half - 1:-1], axis=(1, 2))
+    v_match = np.count_nonzero(mask[:, :half, :] & mask[:, CELL - 1:half - 1:-1, :], axis=(1, 2))
+    left = col_counts[:, :half].sum(axis=1)
+    top = row_counts[:, :half].sum(axis=1)
+    center = np.count_nonzero(mask[:, 10:30, 10:30], axis=(1, 2))
+    rgb = cells[..., :3].reshape(n, total, 3).astype(np.float32)
+    rgb_sum = (maskf.reshape(n, 1, total) @ rgb).reshape(n, 3).astype(np.int64)
+    zones = row_counts.reshape(n, 5, 8).sum(axis=2)
+    bands = [(row_counts[:, a:b].sum(axis=1), rows_any[:, a:b].sum(axis=1)) for a, b in ((0, 10), (15, 25), (30, CELL))]
+    edge = (col_counts[:, :5].sum(axis=1) + col_counts[:, 35:].sum(axis=1)
+            + row_counts[:, :5].sum(axis=1) + row_counts[:, 35:].sum(axis=1))
+
+    # Principal axis: atan2 is scale-invariant, so the n^2-scaled central
+    # moments (exact integers) give the angle with a single rounding
+    num_xx = opaque * sxx - sx * sx
+    num_yy = opaque * syy - sy * sy
+    num_xy = opaque * sxy - sx * sy
+    angles = 0.5 * np.degrees(np.arctan2(2.0 * num_xy, (num_xx - num_yy).astype(np.float64)))
+    tenths = np.abs(angles * 10.0)
+    exact_angle = (num_xy != 0) & (np.abs(tenths - np.floor(tenths) - 0.5) > 1e-6)
+
+    # Features get_features() rounds as numpy scalars are rounded here in one
+    # pass (np.round is what round() does for a numpy float)
+    safe = np.maximum(opaque, 1)
+    qn = quads / safe[:, None]
+    diag = np.round((qn[:, 0] + qn[:, 3]) - (qn[:, 1] + qn[:, 2]), 2)
+    h_sym = h_match / np.maximum(left, 1)
+    v_sym = v_match / np.maximum(top, 1)
+    ef = (opaque - center) / (total - 400)
+    hollow_raw = ef - center / 400
+    hollow = np.round(hollow_raw, 2)
+    vp = np.round(zones / (8 * CELL), 2)
+    widths = [np.round(band / np.maximum(rows * CELL, 1), 2) for band, rows in bands]
+    edge_ratio = np.round(edge / safe, 2)
+    avgs = (rgb_sum / safe[:, None]).astype(int).tolist()
+    mean_x = sx / safe
+    mean_y = sy / safe
+
+    results: list[dict | None] = []
+    for k in range(n):
+        n_opaque = int(opaque[k])
+        if n_opaque < total * 0.02:
+            results.append(None)
+            continue
+        bh = int(rmax[k] - rmin[k] + 1)
+        bw = int(cmax[k] - cmin[k] + 1)
+        if n_opaque <= 10:
+            angle = 0
+        elif exact_angle[k]:
+            angle = float(angles[k])
+        else:
+            ys, xs = np.where(mask[k])
+            angle = _principal_angle(xs, ys)
+        avg = avgs[k]
+        max_c = max(avg)
+        min_c = min(avg)
+        results.append({
+            "fill": round(n_opaque / total, 3), "bw": bw, "bh": bh, "aspect": round(bw / max(bh, 1), 2),
+            "cx": round(float(mean_x[k]) / CELL, 2), "cy": round(float(mean_y[k]) / CELL, 2),
+            "diag": diag[k], "hollow": hollow[k] if ef[k] > 0 and hollow_raw[k] > 0 else 0,
+            "h_sym": round(float(h_sym[k]), 2), "v_sym": round(float(v_sym[k]), 2),
+            "angle": round(angle, 1),
+            "rgb": avg, "brightness": round(sum(avg) / 3, 1), "sat": round((max_c - min_c) / max(max_c, 1), 2),
+            "vp": list(vp[k]),
+            "top_w": widths[0][k], "mid_w": widths[1][k], "bot_w": widths[2][k],
+            "edge_ratio": edge_ratio[k],
+        })
+    return results
+
+
 def feature_vector(f: dict) -> list[float]:
     """Convert features dict to a numeric vector for similarity comparison."""
     return [
@@ -257,6 +393,21 @@ def render_ascii(cell: np.ndarray) -> list[str]:
     return lines
 
 
+def render_ascii_batch(cells: np.ndarray) -> list[list[str]]:
+    """render_ascii() for a stack of cells (N, 40, 40, 4), block means vectorized."""
+    chars = " .:-=+*#%@"
+    n = len(cells)
+    side = CELL // 4
+    blocks = cells.reshape(n, side, 4, side, 4, 4).astype(np.uint16)
+    alpha_sum = blocks[..., 3].sum(axis=(2, 4))                 # 16 pixels per block
+    bright = blocks[..., :3].sum(axis=(2, 4, 5)) / 48           # same mean as render_ascii
+    idx = np.minimum((bright / 256 * len(chars)).astype(int), len(chars) - 1)
+    table = np.frombuffer(chars.encode("ascii"), dtype=np.uint8)
+    codes = np.where(alpha_sum < ALPHA_THRESH * 16, ord(" "), table[idx]).astype(np.uint8)
+    text = codes.tobytes().decode("ascii")
+    return [[text[(k * side + r) * side:(k * side + r + 1) * side] for r in range(side)] for k in range(n)]
+
+
 # ─── Heuristic Classifier ───────────────────────────────────────────
 
 def classify_heuristic(f: dict) -> tuple[str, str, str]:
@@ -404,38 +555,54 @@ def build_references(catalog: dict) -> dict[str, list[list[float]]]:
     return dict(refs)
 
 
-def classify_by_reference(fvec: list[float], refs: dict) -> tuple[str, str, float] | None:
-    """Classify a feature vector by similarity to confirmed references.
+def build_reference_index(catalog: dict) -> ReferenceIndex:
+    """Stacked reference index over confirmed items.
 
-    Returns (cat, sub, similarity) or None if no references exist.
+    Reuses .cache/reference_index.npz when the confirmed items and the
+    feature cache file are unchanged since it was saved.
     """
-    if not refs:
-        return None
+    confirmed = sorted(
+        (f"{file_key}/{cell_key}", f"{entry['cat']}/{entry['sub']}")
+        for file_key, cells in catalog.items() if not file_key.startswith("_")
+        for cell_key, entry in cells.items() if entry.get("status") == "confirmed"
+    )
+    path = feature_cache_path()
+    st = path.stat() if path.exists() else None
+    source = source_key(confirmed, [st.st_size, st.st_mtime_ns] if st else None)
 
-    best_cat_sub = None
-    best_sim = -1.0
+    index = ReferenceIndex.load(reference_index_path(), source)
+    if index is None:
+        index = ReferenceIndex.from_refs(build_references(catalog), source)
+        index.save(reference_index_path())
+    return index
 
-    fv = np.array(fvec)
-    fv_norm = np.linalg.norm(fv)
-    if fv_norm < 1e-6:
-        return None
 
-    for cat_sub, ref_vectors in refs.items():
-        for rv in ref_vectors:
-            rv = np.array(rv)
-            rv_norm = np.linalg.norm(rv)
-            if rv_norm < 1e-6:
-                continue
-            sim = float(np.dot(fv, rv) / (fv_norm * rv_norm))
-            if sim > best_sim:
-                best_sim = sim
-                best_cat_sub = cat_sub
-
-    if best_cat_sub and best_sim > 0.90:
-        cat, sub = best_cat_sub.split("/", 1)
-        return (cat, sub, best_sim)
+def classify_by_reference(fvec: list[float], refs: ReferenceIndex | dict) -> tuple[str, str, float] | None:
+    """Classify a feature vector by similarity to confirmed references.
 
-    return None
+    Returns (cat, sub, similarity) or None if no references exist.
+    """
+    return classify_batch_by_reference([fvec], refs)[0]
+
+
+def classify_batch_by_reference(
+    fvecs: list[list[float]],
+    refs: ReferenceIndex | dict,
+) -> list[tuple[str, str, float] | None]:
+    """classify_by_reference() for many vectors, scored with one matrix multiply."""
+    if isinstance(refs, dict):
+        refs = ReferenceIndex.from_refs(refs)
+    if not refs or not fvecs:
+        return [None] * len(fvecs)
+
+    results = []
+    for match in refs.query(fvecs, k=2):
+        if match and match.score > 0.90:
+            cat, sub = match.label.split("/", 1)
+            results.append((cat, sub, match.score))
+        else:
+            results.append(None)
+    return results
 
 
 # ─── Feature Cache ───────────────────────────────────────────────────
@@ -453,6 +620,10 @@ def load_feature_cache() -> dict[str, list[float]]:
     return {}
 
 
+def reference_index_path() -> Path:
+    return CACHE_DIR / "reference_index.npz"
+
+
 def save_feature_cache(cache: dict[str, list[float]]) -> None:
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
     with open(feature_cache_path(), "w", encoding="utf-8") as f:
@@ -646,18 +817,34 @@ def analyze_file(
     file_num: int,
     catalog: dict,
     feature_cache: dict,
-    refs: dict,
+    refs: ReferenceIndex | None,
     force: bool = False,
+    cells: np.ndarray | None = None,
+    features: list[dict | None] | None = None,
 ) -> int:
-    """Analyze a single dragitem file. Returns count of cells processed."""
+    """Analyze a single dragitem file. Returns count of cells processed.
+
+    cells/features are the sheet's sheet_cells() stack and its
+    get_features_batch() results, when the caller has already extracted
+    them (cmd_analyze --all extracts every sheet in one batch).
+    """
     fname = f"dragitem{file_num}"
     tga_path = ITEMS_DIR / f"{fname}.tga"
 
-    if not tga_path.exists():
-        print(f"  SKIP: {tga_path} not found")
-        return 0
-
-    img = Image.open(tga_path)
+    if cells is None:
+        if not tga_path.exists():
+            print(f"  SKIP: {tga_path} not found")
+            return 0
+        cells = sheet_cells(imagecache.load_rgba(tga_path, shared=True))
+    if features is None:
+        features = get_features_batch(cells)
+    arts = None  # rendered on the first cell that needs ASCII
+
+    # Classify every non-empty cell against the references in one batch
+    fvecs = {i: feature_vector(f) for i, f in enumerate(features) if f is not None}
+    ref_results = {}
+    if refs and fvecs:
+        ref_results = dict(zip(fvecs, classify_batch_by_reference(list(fvecs.values()), refs)))
     file_data = catalog.get(fname, {})
     processed = 0
     ascii_lines = []
@@ -680,9 +867,8 @@ def analyze_file(
                 if status == "high" and not force:
                     continue
 
-            # Extract features
-            cell = extract_cell(img, row, col)
-            feats = get_features(cell)
+            index = (row - 1) * GRID + (col - 1)
+            feats = features[index]
 
             if feats is None:
                 file_data[ck] = {
@@ -693,12 +879,11 @@ def analyze_file(
                 continue
 
             # Cache feature vector
-            fvec = feature_vector(feats)
             cache_key = f"{fname}/{ck}"
-            feature_cache[cache_key] = fvec
+            feature_cache[cache_key] = fvecs[index]
 
             # Classify: try reference-based first, fall back to heuristic
-            ref_result = classify_by_reference(fvec, refs) if refs else None
+            ref_result = ref_results.get(index)
             if ref_result:
                 cat, sub, sim = ref_result
                 notes = f"ref-match ({sim:.2f})"
@@ -717,7 +902,9 @@ def analyze_file(
             processed += 1
 
             # Generate ASCII for this cell
-            art = render_ascii(cell)
+            if arts is None:
+                arts = render_ascii_batch(cells)
+            art = arts[index]
             r, g, b = feats["rgb"]
             color = _color_name(r, g, b, feats["sat"])
             ascii_lines.append(f"  {ck}  {cat}/{sub}  [{status}]  fill={feats['fill']:.2f}  {color}  br={feats['brightness']:.0f}")
@@ -764,10 +951,9 @@ def cmd_analyze(args):
     feature_cache = load_feature_cache()
 
     # Build references from confirmed items
-    refs = build_references(catalog) if not args.force else {}
+    refs = build_reference_index(catalog) if not args.force else None
     if refs:
-        total_refs = sum(len(v) for v in refs.values())
-        print(f"  References: {total_refs} confirmed items across {len(refs)} types")
+        print(f"  References: {len(refs)} confirmed items across {len(refs.labels)} types")
 
     total = 0
     if args.all:
@@ -775,9 +961,17 @@ def cmd_analyze(args):
             ITEMS_DIR.glob("dragitem*.tga"),
             key=lambda p: int(p.stem.replace("dragitem", "")),
         )
-        for fpath in files:
+        # Extract every sheet's features in one batch (36 cells per sheet)
+        start = time.perf_counter()
+        sheets = [sheet_cells(imagecache.load_rgba(fpath, shared=True)) for fpath in files]
+        all_features = get_features_batch(np.concatenate(sheets)) if sheets else []
+        print(f"  Features: {len(all_features)} cells from {len(sheets)} sheets "
+              f"({time.perf_counter() - start:.2f}s)")
+        per_sheet = GRID * GRID
+        for i, fpath in enumerate(files):
             fnum = int(fpath.stem.replace("dragitem", ""))
-            n = analyze_file(fnum, catalog, feature_cache, refs, args.force)
+            n = analyze_file(fnum, catalog, feature_cache, refs, args.force,
+                             cells=sheets[i], features=all_features[i * per_sheet:(i + 1) * per_sheet])
             total += n
             if n > 0:
                 print(f"  {fpath.name}: {n} cells analyzed")
@@ -804,16 +998,15 @@ def cmd_learn(args):
     """Re-score unconfirmed items using confirmed references."""
     catalog = load_catalog()
     feature_cache = load_feature_cache()
-    refs = build_references(catalog)
+    refs = build_reference_index(catalog)
 
     if not refs:
         print("  No confirmed items to learn from yet.")
         return
 
-    total_refs = sum(len(v) for v in refs.values())
-    print(f"  Learning from {total_refs} confirmed items across {len(refs)} types")
+    print(f"  Learning from {len(refs)} confirmed items across {len(refs.labels)} types")
 
-    updated = 0
+    pending = []
     for file_key in sorted(k for k in catalog if not k.startswith("_")):
         cells = catalog[file_key]
         for ck, entry in cells.items():
@@ -824,20 +1017,25 @@ def cmd_learn(args):
             fvec = feature_cache.get(cache_key)
             if fvec is None:
                 continue
+            pending.append((entry, fvec))
 
-            result = classify_by_reference(fvec, refs)
-            if result:
-                cat, sub, sim = result
-                old_cat = entry["cat"]
-                old_sub = entry["sub"]
-                if cat != old_cat or sub != old_sub:
-                    entry["cat"] = cat
-                    entry["sub"] = sub
-                    entry["notes"] = f"ref-match ({sim:.2f})"
-                    # desc is never overwritten by learning
-                    if sim > 0.95:
-                        entry["status"] = "high"
-                    updated += 1
+    # Score every unconfirmed cell in one batch
+    results = classify_batch_by_reference([fvec for _, fvec in pending], refs)
+
+    updated = 0
+    for (entry, _), result in zip(pending, results):
+        if result:
+            cat, sub, sim = result
+            old_cat = entry["cat"]
+            old_sub = entry["sub"]
+            if cat != old_cat or sub != old_sub:
+                entry["cat"] = cat
+                entry["sub"] = sub
+                entry["notes"] = f"ref-match ({sim:.2f})"
+                # desc is never overwritten by learning
+                if sim > 0.95:
+                    entry["status"] = "high"
+                updated += 1
 
     if updated > 0:
         save_catalog(catalog)
@@ -906,7 +1104,7 @@ def extract_pngs(file_num: int) -> int:
     out_dir = CACHE_DIR / fname
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    img = Image.open(tga_path).convert("RGBA")
+    img = imagecache.load_rgba(tga_path, shared=True)
     count = 0
     for row in range(1, GRID + 1):
         for col in range(1, GRID + 1):
@@ -952,71 +1150,109 @@ STATUS_COLORS = {
     "guess": "#ff8787",
 }
 
+SPRITE_SCALE = 2        # contact sheets show cells at 2x (80px)
+INDEX_PAGE_SHEETS = 6   # sheets per page of the combined index
+
+HTML_STYLE = """\
+  body { font-family: 'Segoe UI', sans-serif; background: #1a1a2e; color: #e0e0e0;
+         margin: 20px; }
+  h1 { color: #c9a84c; border-bottom: 2px solid #c9a84c; padding-bottom: 8px; }
+  h2 { color: #c9a84c; font-size: 16px; margin: 24px 0 8px 0; }
+  a { color: #c9a84c; }
+  .grid { display: grid; grid-template-columns: repeat(6, 1fr); gap: 6px;
+          max-width: 960px; }
+  .cell { background: #16213e; border: 2px solid #333; border-radius: 6px;
+          padding: 6px; text-align: center; }
+  .cell:hover { border-color: #c9a84c; }
+  .icon { width: 80px; height: 80px; image-rendering: pixelated;
+          background-color: #000; background-repeat: no-repeat;
+          border: 1px solid #444;
+          margin: 0 auto 4px auto; }
+  .coord { font-size: 11px; color: #888; font-family: monospace; }
+  .cat { font-size: 12px; font-weight: bold; margin: 2px 0; }
+  .status { font-size: 10px; font-weight: bold; padding: 1px 6px;
+            border-radius: 3px; display: inline-block; }
+  .name { font-size: 11px; color: #aaa; font-style: italic; }
+  .notes { font-size: 10px; color: #666; }
+  .legend { margin: 12px 0; font-size: 13px; }
+  .legend span { padding: 2px 8px; border-radius: 3px; margin-right: 10px; }
+  .empty-cell { opacity: 0.3; }
+  .pages { margin: 12px 0; font-size: 13px; }
+  .pages a, .pages b { margin-right: 8px; }
+  .mini { display: grid; grid-template-columns: repeat(6, 94px); gap: 4px; }
+  .mini .cell { padding: 2px; border-width: 3px; }
+  .mini .cat { font-size: 10px; font-weight: normal; overflow: hidden;
+               white-space: nowrap; text-overflow: ellipsis; }
+"""
 
-def _cell_png_to_data_uri(file_num: int, row: int, col: int) -> str:
-    """Get a base64 data URI for a cell PNG, extracting on-the-fly if needed."""
-    fname = f"dragitem{file_num}"
-    png_path = CACHE_DIR / fname / f"r{row}c{col}.png"
+HTML_LEGEND = """<div class="legend">
+  <span style="background:#69db7c;color:#000">confirmed</span>
+  <span style="background:#ffd43b;color:#000">high</span>
+  <span style="background:#ff8787;color:#000">guess</span>
+</div>"""
+
+
+def sprite_path(file_num: int) -> Path:
+    return CACHE_DIR / f"dragitem{file_num}_sprite.png"
 
-    if png_path.exists():
-        data = png_path.read_bytes()
-    else:
-        # Extract directly from TGA
-        tga_path = ITEMS_DIR / f"{fname}.tga"
-        if not tga_path.exists():
-            return ""
-        img = Image.open(tga_path).convert("RGBA")
-        x0 = (col - 1) * CELL
-        y0 = (row - 1) * CELL
-        cell = img.crop((x0, y0, x0 + CELL, y0 + CELL))
-        buf = io.BytesIO()
-        cell.save(buf, "PNG")
-        data = buf.getvalue()
 
-    b64 = base64.b64encode(data).decode("ascii")
-    return f"data:image/png;base64,{b64}"
+def write_sprite(file_num: int) -> Path | None:
+    """Write the sheet's 6x6 grid as one PNG (skipped if newer than the TGA).
+
+    Returns the sprite path, or None if the TGA does not exist.
+    """
+    tga_path = ITEMS_DIR / f"dragitem{file_num}.tga"
+    if not tga_path.exists():
+        return None
+    path = sprite_path(file_num)
+    if path.exists() and path.stat().st_mtime_ns >= tga_path.stat().st_mtime_ns:
+        return path
+
+    img = imagecache.load_rgba(tga_path, shared=True)
+    sprite = img.crop((0, 0, GRID * CELL, GRID * CELL))  # pads short sheets with transparency
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.stem}.tmp.png")
+    sprite.save(tmp_path, "PNG")
+    tmp_path.replace(path)
+    return path
+
+
+def _icon_html(sprite: Path | None, row: int, col: int, ck: str) -> str:
+    """A sprite cell shown via CSS background offset (empty string without a sprite)."""
+    if sprite is None:
+        return ""
+    size = CELL * SPRITE_SCALE
+    x, y = (col - 1) * size, (row - 1) * size
+    return (f'<div class="icon" title="{ck}" style="background-image:url({sprite.name});'
+            f'background-size:{GRID * size}px;background-position:{-x}px {-y}px"></div>')
+
+
+def _html_page(title: str, heading: str, body: list[str]) -> str:
+    return "\n".join([
+        "<!DOCTYPE html>",
+        '<html><head><meta charset="utf-8">',
+        f"<title>{escape(title)}</title>",
+        f"<style>\n{HTML_STYLE}</style></head><body>",
+        f"<h1>{heading}</h1>",
+        HTML_LEGEND,
+        *body,
+        "</body></html>",
+    ])
 
 
 def generate_html(file_num: int, catalog: dict) -> Path:
-    """Generate an HTML contact sheet for one dragitem file."""
+    """Generate an HTML contact sheet for one dragitem file.
+
+    Cells are drawn from the sheet's sprite PNG (written next to the page)
+    with CSS background offsets, so the page is small and the sheet is
+    decoded at most once.
+    """
     fname = f"dragitem{file_num}"
     cells = catalog.get(fname, {})
     html_path = CACHE_DIR / f"{fname}.html"
+    sprite = write_sprite(file_num)
 
-    parts = [f"""<!DOCTYPE html>
-<html><head><meta charset="utf-8">
-<title>{fname}.tga — Thorne UI Icon Catalog</title>
-<style>
-  body {{ font-family: 'Segoe UI', sans-serif; background: #1a1a2e; color: #e0e0e0;
-         margin: 20px; }}
-  h1 {{ color: #c9a84c; border-bottom: 2px solid #c9a84c; padding-bottom: 8px; }}
-  .grid {{ display: grid; grid-template-columns: repeat(6, 1fr); gap: 6px;
-           max-width: 960px; }}
-  .cell {{ background: #16213e; border: 2px solid #333; border-radius: 6px;
-           padding: 6px; text-align: center; }}
-  .cell:hover {{ border-color: #c9a84c; }}
-  .cell img {{ width: 80px; height: 80px; image-rendering: pixelated;
-              border: 1px solid #444; background: #000; display: block;
-              margin: 0 auto 4px auto; }}
-  .coord {{ font-size: 11px; color: #888; font-family: monospace; }}
-  .cat {{ font-size: 12px; font-weight: bold; margin: 2px 0; }}
-  .status {{ font-size: 10px; font-weight: bold; padding: 1px 6px;
-            border-radius: 3px; display: inline-block; }}
-  .name {{ font-size: 11px; color: #aaa; font-style: italic; }}
-  .notes {{ font-size: 10px; color: #666; }}
-  .legend {{ margin: 12px 0; font-size: 13px; }}
-  .legend span {{ padding: 2px 8px; border-radius: 3px; margin-right: 10px; }}
-  .empty-cell {{ opacity: 0.3; }}
-</style></head><body>
-<h1>{fname}.tga</h1>
-<div class="legend">
-  <span style="background:#69db7c;color:#000">confirmed</span>
-  <span style="background:#ffd43b;color:#000">high</span>
-  <span style="background:#ff8787;color:#000">guess</span>
-</div>
-<div class="grid">
-"""]
-
+    parts = ['<div class="grid">']
     for row in range(1, GRID + 1):
         for col in range(1, GRID + 1):
             ck = f"[{row},{col}]"
@@ -1028,32 +1264,89 @@ def generate_html(file_num: int, catalog: dict) -> Path:
             notes = entry.get("notes", "")
             is_empty = cat == "empty"
 
-            data_uri = _cell_png_to_data_uri(file_num, row, col)
             scolor = STATUS_COLORS.get(status, "#888")
             empty_cls = ' class="cell empty-cell"' if is_empty else ' class="cell"'
 
             parts.append(f'<div{empty_cls}>')
-            if data_uri:
-                parts.append(f'  <img src="{data_uri}" alt="{ck}">')
+            icon = _icon_html(sprite, row, col, ck)
+            if icon:
+                parts.append(f"  {icon}")
             parts.append(f'  <div class="coord">{ck}</div>')
-            parts.append(f'  <div class="cat">{cat}/{sub}</div>')
-            parts.append(f'  <span class="status" style="background:{scolor};color:#000">{status}</span>')
+            parts.append(f'  <div class="cat">{escape(cat)}/{escape(sub)}</div>')
+            parts.append(f'  <span class="status" style="background:{scolor};color:#000">{escape(status)}</span>')
             if desc:
-                parts.append(f'  <div class="name">{desc}</div>')
+                parts.append(f'  <div class="name">{escape(desc)}</div>')
             if notes and not is_empty:
-                parts.append(f'  <div class="notes">{notes}</div>')
+                parts.append(f'  <div class="notes">{escape(notes)}</div>')
             parts.append('</div>')
-
-    parts.append("</div></body></html>")
+    parts.append("</div>")
 
     html_path.parent.mkdir(parents=True, exist_ok=True)
     with open(html_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(parts))
+        f.write(_html_page(f"{fname}.tga — Thorne UI Icon Catalog", f"{fname}.tga", parts))
 
     print(f"  {fname}.html → {html_path}")
     return html_path
 
 
+def index_page_path(page: int) -> Path:
+    return CACHE_DIR / ("index.html" if page == 1 else f"index-{page}.html")
+
+
+def generate_index(file_nums: list[int], catalog: dict) -> list[Path]:
+    """Combined contact sheet across all dragitem files, INDEX_PAGE_SHEETS per page.
+
+    Shares the per-sheet sprites with generate_html(); each sheet links to
+    its full per-file page.
+    """
+    pages = [file_nums[i:i + INDEX_PAGE_SHEETS] for i in range(0, len(file_nums), INDEX_PAGE_SHEETS)]
+    paths = []
+    for page, page_files in enumerate(pages, 1):
+        nav = ['<div class="pages">Page:']
+        for other in range(1, len(pages) + 1):
+            first, last = pages[other - 1][0], pages[other - 1][-1]
+            label = f"{other} ({first}–{last})"
+            if other == page:
+                nav.append(f"  <b>{label}</b>")
+            else:
+                nav.append(f'  <a href="{index_page_path(other).name}">{label}</a>')
+        nav.append("</div>")
+
+        parts = list(nav)
+        for file_num in page_files:
+            fname = f"dragitem{file_num}"
+            cells = catalog.get(fname, {})
+            sprite = write_sprite(file_num)
+            parts.append(f'<h2><a href="{fname}.html">{fname}.tga</a></h2>')
+            parts.append('<div class="mini">')
+            for row in range(1, GRID + 1):
+                for col in range(1, GRID + 1):
+                    ck = f"[{row},{col}]"
+                    entry = cells.get(ck, {})
+                    cat = entry.get("cat", "?")
+                    sub = entry.get("sub", "?")
+                    status = entry.get("status", "guess")
+                    scolor = STATUS_COLORS.get(status, "#888")
+                    empty_cls = "cell empty-cell" if cat == "empty" else "cell"
+                    tip = f"{ck} {cat}/{sub} [{status}] {entry.get('desc', '')}".strip()
+                    parts.append(
+                        f'<div class="{empty_cls}" style="border-color:{scolor}" title="{escape(tip)}">'
+                        f'{_icon_html(sprite, row, col, ck)}<div class="cat">{escape(sub)}</div></div>'
+                    )
+            parts.append("</div>")
+        parts.extend(nav)
+
+        path = index_page_path(page)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_html_page("Thorne UI Icon Catalog", f"Icon Catalog — page {page} of {len(pages)}", parts))
+        paths.append(path)
+
+    if paths:
+        print(f"  index: {len(paths)} pages → {paths[0]}")
+    return paths
+
+
 def cmd_html(args):
     """Generate HTML contact sheets for visual review."""
     catalog = load_catalog()
@@ -1072,9 +1365,10 @@ def cmd_html(args):
             ITEMS_DIR.glob("dragitem*.tga"),
             key=lambda p: int(p.stem.replace("dragitem", "")),
         )
-        for fpath in files:
-            fnum = int(fpath.stem.replace("dragitem", ""))
+        file_nums = [int(fpath.stem.replace("dragitem", "")) for fpath in files]
+        for fnum in file_nums:
             paths.append(generate_html(fnum, catalog))
+        generate_index(file_nums, catalog)
 
     print(f"\n  Done: {len(paths)} HTML contact sheets generated")
 
@@ -1095,7 +1389,7 @@ def main():
               python .bin/generate_catalog.py --force dragitem1  Force re-analyze
               python .bin/generate_catalog.py --png            Extract all cell PNGs
               python .bin/generate_catalog.py --png dragitem1  Extract PNGs for one file
-              python .bin/generate_catalog.py --html           HTML sheets for all files
+              python .bin/generate_catalog.py --html           HTML sheets for all files + index
               python .bin/generate_catalog.py --html dragitem1 HTML sheet for one file
         """),
     )
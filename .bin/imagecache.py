@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Shared decoded-image cache for the .bin texture scripts.
+
+Every regen/catalog script used to call Image.open(path).convert("RGBA") on
+the same atlases (spells*.tga, gemicons*.tga, dragitem*.tga, item atlases),
+often several times per run. load_rgba() replaces that call with two layers:
+
+    - in-process LRU of decoded images, keyed by resolved path + size + mtime
+      (bounded by LRU_MAX_BYTES of pixel data)
+    - on-disk raw RGBA cache under .tmp/image-cache/ (one file per source
+      path: a small header with the source size/mtime and image size,
+      followed by the raw pixels), memory-mapped on read, so chained runs
+      (regen_thorne -> regen_slots, regen_gems -> regen_icons, ...) skip the
+      TGA decode entirely
+
+A stale entry (source size or mtime changed) is simply re-decoded and
+overwritten. The pixels returned are exactly what
+Image.open(path).convert("RGBA") produces.
+
+Usage:
+    img = imagecache.load_rgba(path)               # private copy, safe to edit
+    img = imagecache.load_rgba(path, shared=True)  # cached image, read-only use (crop etc.)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+from collections import OrderedDict
+from pathlib import Path
+
+from PIL import Image
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".tmp" / "image-cache"
+LRU_MAX_BYTES = 256 * 1024 * 1024
+
+# magic, source size, source mtime_ns, width, height
+_HEADER = struct.Struct("<8sQqII")
+_MAGIC = b"RGBACAC1"
+
+_lru: OrderedDict[tuple, Image.Image] = OrderedDict()
+_lru_bytes = 0
+
+# Set to False (e.g. from tests or one-off tools) to skip the on-disk layer
+disk_cache_enabled = os.environ.get("THORNE_IMAGE_CACHE", "1") != "0"
+
+
+def _disk_path(path: Path) -> Path:
+    digest = hashlib.sha1(path.as_posix().encode("utf-8")).hexdigest()[:20]
+    return CACHE_DIR / f"{path.stem}-{digest}.rgba"
+
+
+def _read_disk(cache_file: Path, size: int, mtime_ns: int) -> Image.Image | None:
+    """Map a cached raw RGBA file; None if missing, stale or malformed."""
+    try:
+        with open(cache_file, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(mapped) < _HEADER.size:
+        mapped.close()
+        return None
+    magic, src_size, src_mtime, width, height = _HEADER.unpack_from(mapped)
+    if magic != _MAGIC or src_size != size or src_mtime != mtime_ns or len(mapped) != _HEADER.size + width * height * 4:
+        mapped.close()
+        return None
+    # Zero-copy view over the mapping (the image keeps the mapping alive)
+    return Image.frombuffer("RGBA", (width, height), memoryview(mapped)[_HEADER.size :], "raw", "RGBA", 0, 1)
+
+
+def _write_disk(cache_file: Path, img: Image.Image, size: int, mtime_ns: int) -> None:
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, size, mtime_ns, img.width, img.height))
+            f.write(img.tobytes())
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Read-only checkout or a mapped file that cannot be replaced (Windows):
+        # the decoded image is still returned, only persistence is skipped
+        pass
+
+
+def _remember(key: tuple, img: Image.Image) -> None:
+    global _lru_bytes
+    _lru[key] = img
+    _lru_bytes += img.width * img.height * 4
+    while _lru_bytes > LRU_MAX_BYTES and len(_lru) > 1:
+        _, old = _lru.popitem(last=False)
+        _lru_bytes -= old.width * old.height * 4
+
+
+def load_rgba(path: str | Path, shared: bool = False) -> Image.Image:
+    """Decode an image file to RGBA through the memory and disk caches.
+
+    Args:
+        path: Source image (TGA/PNG/...)
+        shared: Return the cached image itself instead of a copy. Only for
+                read-only use (crop, resize, tobytes, numpy conversion).
+
+    Raises the same errors as Image.open() for missing or undecodable files.
+    """
+    path = Path(path).resolve()
+    st = path.stat()
+    key = (path, st.st_size, st.st_mtime_ns)
+
+    img = _lru.get(key)
+    if img is not None:
+        _lru.move_to_end(key)
+    else:
+        cache_file = _disk_path(path)
+        img = _read_disk(cache_file, st.st_size, st.st_mtime_ns) if disk_cache_enabled else None
+        if img is None:
+            with Image.open(path) as src:
+                img = src.convert("RGBA")
+            if disk_cache_enabled:
+                _write_disk(cache_file, img, st.st_size, st.st_mtime_ns)
+        _remember(key, img)
+
+    return img if shared else img.copy()
+
+
+def remember(path: str | Path, img: Image.Image) -> None:
+    """Register an image that was just saved losslessly to path (e.g. a TGA).
+
+    Later load_rgba(path) calls in this process (and the build cache digest)
+    reuse img instead of decoding the file again; the on-disk entry is
+    written as well. img must be RGBA and must not be modified afterwards.
+    """
+    path = Path(path).resolve()
+    st = path.stat()
+    if disk_cache_enabled:
+        _write_disk(_disk_path(path), img, st.st_size, st.st_mtime_ns)
+    _remember((path, st.st_size, st.st_mtime_ns), img)
+
+
+def clear_memory() -> None:
+    """Drop the in-process LRU (the disk cache is kept)."""
+    global _lru_bytes
+    _lru.clear()
+    _lru_bytes = 0
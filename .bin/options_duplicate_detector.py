@@ -9,8 +9,9 @@ Scans all variants within each window directory to find:
 4. Variants that could be removed/archived
 
 Compares files using:
-- MD5 checksum for exact matches
-- Line-by-line diff for similarity detection
+- Content hash (shared Options manifest) for exact matches
+- MinHash sketches + LSH banding to find candidate pairs, then a
+  line-by-line diff (difflib) on the candidates only
 
 Usage:
     python duplicate_detector.py [--similarity PERCENT] [--detailed] [--remove-candidates]
@@ -19,21 +20,159 @@ Options:
     --similarity N   Set similarity threshold 0-100 (default 95)
     --detailed       Show detailed diff information
     --remove-candidates  List variants recommended for removal
+    --cross-window   Also find near-duplicates between different windows/files
+    --exhaustive     Diff every pair (no LSH; for checking candidate recall)
 """
 
 import os
 import sys
 import json
+import time
 import hashlib
 from pathlib import Path
 from collections import defaultdict
 from datetime import datetime
 import difflib
 
+import options_manifest
+
+# MinHash sketch: every line (whitespace-stripped, numbered by occurrence so
+# repeated lines count) is one shingle. Matched lines in a diff are shared
+# shingles, so a pair with diff ratio r has multiset Jaccard >= r / (2 - r);
+# LSH bands are sized to catch that Jaccard with RECALL_TARGET probability.
+NUM_PERM = 128
+RECALL_TARGET = 0.99
+SKETCH_CACHE = Path(__file__).resolve().parent.parent / ".tmp" / "options-minhash-cache.json"
+SKETCH_FORMAT = 1
+_HASH_MAX = (1 << 64) - 1
+
+
+def minhash_sketch(lines, num_perm=NUM_PERM):
+    """One-permutation MinHash of a file's line multiset (densified, num_perm values)."""
+    if not lines:
+        return None
+    bins = [None] * num_perm
+    seen = defaultdict(int)
+    for line in lines:
+        text = line.strip()
+        seen[text] += 1
+        h = int.from_bytes(
+            hashlib.blake2b(f"{seen[text]}\x00{text}".encode("utf-8"), digest_size=8).digest(), "little"
+        )
+        b = h % num_perm
+        v = h // num_perm
+        if bins[b] is None or v < bins[b]:
+            bins[b] = v
+    # Densify: an empty bin borrows the next non-empty bin's value (circularly),
+    # offset by the distance so borrowed values stay distinguishable
+    filled = {i for i, v in enumerate(bins) if v is not None}
+    if len(filled) < num_perm:
+        for i in range(num_perm):
+            if bins[i] is None:
+                for step in range(1, num_perm):
+                    j = (i + step) % num_perm
+                    if j in filled:
+                        bins[i] = (bins[j] + step * 0x9E3779B97F4A7C15) & _HASH_MAX
+                        break
+    return bins
+
+
+def lsh_params(similarity, num_perm=NUM_PERM, recall=RECALL_TARGET):
+    """(bands, rows) for a similarity threshold in percent.
+
+    Picks the most selective banding (most rows per band) that still makes a
+    pair at the threshold's minimum Jaccard a candidate with `recall` probability.
+    """
+    r = max(similarity, 1) / 100.0
+    jaccard = r / (2.0 - r)
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if 1.0 - (1.0 - jaccard ** rows) ** bands >= recall:
+            best = (bands, rows)
+    return best
+
+
+def lsh_candidates(sketches, bands, rows):
+    """Index pairs (i < j) whose sketches agree on at least one band."""
+    pairs = set()
+    for band in range(bands):
+        buckets = defaultdict(list)
+        for index, sketch in enumerate(sketches):
+            if sketch is not None:
+                buckets[tuple(sketch[band * rows:(band + 1) * rows])].append(index)
+        for members in buckets.values():
+            for a in range(len(members)):
+                for b in range(a + 1, len(members)):
+                    pairs.add((members[a], members[b]))
+    return pairs
+
+
+class SketchCache:
+    """MinHash sketches on disk, keyed by file content hash."""
+
+    def __init__(self, path=SKETCH_CACHE):
+        self.path = Path(path) if path else None
+        self.sketches = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        if not self.path:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("format") == SKETCH_FORMAT and data.get("num_perm") == NUM_PERM:
+            self.sketches = data.get("sketches", {})
+
+    def get(self, checksum, lines_loader):
+        if checksum and checksum in self.sketches:
+            self.hits += 1
+            return self.sketches[checksum]
+        self.misses += 1
+        sketch = minhash_sketch(lines_loader())
+        if checksum and sketch is not None:
+            self.sketches[checksum] = sketch
+            self._dirty = True
+        return sketch
+
+    def save(self, keep=None):
+        """Write the cache, dropping sketches of checksums not in `keep`."""
+        if not self.path:
+            return
+        if keep is not None:
+            stale = set(self.sketches) - set(keep)
+            for checksum in stale:
+                del self.sketches[checksum]
+            self._dirty = self._dirty or bool(stale)
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            data = {"format": SKETCH_FORMAT, "num_perm": NUM_PERM, "sketches": self.sketches}
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+
 class DuplicateDetector:
-    def __init__(self, options_root, similarity_threshold=95):
+    def __init__(self, options_root, similarity_threshold=95, cross_window=False,
+                 exhaustive=False, sketch_cache=SKETCH_CACHE):
         self.options_root = Path(options_root)
         self.similarity_threshold = similarity_threshold
+        self.cross_window = cross_window
+        self.exhaustive = exhaustive
+        self.sketch_cache = SketchCache(sketch_cache)
+        self.manifest = options_manifest.load(self.options_root)
+        self.bands, self.rows = lsh_params(similarity_threshold)
+        self._lines = {}
+        self._sketches = {}
+        self.stats = defaultdict(int, pairs_total=0, candidate_pairs=0, diffed=0, files=0)
         self.results = {
             "scan_timestamp": datetime.now().isoformat(),
             "windows": {},
@@ -41,17 +180,12 @@ class DuplicateDetector:
             "similar_sets": 0,
             "candidates_for_removal": []
         }
+        if cross_window:
+            self.results["cross_window"] = []
     
     def calculate_checksum(self, file_path):
-        """Calculate MD5 checksum of file."""
-        try:
-            md5 = hashlib.md5()
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b''):
-                    md5.update(chunk)
-            return md5.hexdigest()
-        except:
-            return None
+        """sha256 checksum of file (shared Options manifest; hashed once per change)."""
+        return self.manifest.file_hash(file_path)
     
     def read_file_lines(self, file_path):
         """Read file into list of lines."""
@@ -61,27 +195,76 @@ class DuplicateDetector:
         except:
             return []
     
-    def calculate_similarity(self, lines1, lines2):
-        """Calculate similarity percentage between two file line lists."""
+    def file_lines(self, file_path):
+        """read_file_lines() memoized for the scan (a file is read at most once)."""
+        key = str(file_path)
+        if key not in self._lines:
+            self._lines[key] = self.read_file_lines(file_path)
+        return self._lines[key]
+
+    def sketch(self, loc):
+        """MinHash sketch of a file location (from the checksum-keyed cache)."""
+        key = str(loc['path'])
+        if key not in self._sketches:
+            self._sketches[key] = self.sketch_cache.get(loc['checksum'], lambda: self.file_lines(loc['path']))
+        return self._sketches[key]
+
+    def similar_pairs(self, locations):
+        """Pairs (i, j, similarity) of locations at or above the threshold.
+
+        Only LSH candidate pairs are diffed (every pair with --exhaustive).
+        """
+        count = len(locations)
+        self.stats["pairs_total"] += count * (count - 1) // 2
+        if self.exhaustive:
+            candidates = {(i, j) for i in range(count) for j in range(i + 1, count)}
+        else:
+            sketches = [self.sketch(loc) for loc in locations]
+            candidates = lsh_candidates(sketches, self.bands, self.rows)
+        self.stats["candidate_pairs"] += len(candidates)
+
+        pairs = []
+        for i, j in sorted(candidates):
+            loc1, loc2 = locations[i], locations[j]
+            if loc1['path'] == loc2['path']:
+                continue
+            if loc1['checksum'] and loc1['checksum'] == loc2['checksum']:
+                similarity = 100
+            else:
+                self.stats["diffed"] += 1
+                similarity = self.calculate_similarity(self.file_lines(loc1['path']), self.file_lines(loc2['path']),
+                                                       self.similarity_threshold)
+            if similarity >= self.similarity_threshold:
+                pairs.append((i, j, similarity))
+        return pairs
+
+    def calculate_similarity(self, lines1, lines2, threshold=0):
+        """Calculate similarity percentage between two file line lists.
+        
+        With a threshold, difflib's cheap upper bounds are checked first and
+        0 is returned when they already rule the pair out.
+        """
         if not lines1 or not lines2:
             return 0
         
         matcher = difflib.SequenceMatcher(None, lines1, lines2)
+        if threshold and (int(matcher.real_quick_ratio() * 100) < threshold
+                          or int(matcher.quick_ratio() * 100) < threshold):
+            return 0
         ratio = matcher.ratio()
         return int(ratio * 100)
     
     def get_xml_files(self, directory):
         """Get all EQUI_*.xml files in directory."""
         xml_files = {}
-        for file in directory.iterdir():
-            if file.name.startswith('EQUI') and file.suffix == '.xml':
-                checksum = self.calculate_checksum(file)
-                xml_files[file.name] = {
-                    "path": file,
-                    "checksum": checksum,
-                    "size": file.stat().st_size,
-                    "mtime": file.stat().st_mtime
-                }
+        for file in self.manifest.files("EQUI*.xml", under=directory, recursive=False):
+            checksum = self.calculate_checksum(file)
+            xml_files[file.name] = {
+                "path": file,
+                "checksum": checksum,
+                "size": self.manifest.size(file),
+                "mtime": self.manifest.mtime(file)
+            }
         return xml_files
     
     def scan_window(self, window_dir):
@@ -98,7 +281,9 @@ class DuplicateDetector:
                     for xml_name, xml_info in xml_files.items():
                         variants[xml_name].append({
                             "variant": variant_name,
-                            "path": item,
+                            "window": window_name,
+                            "xml_file": xml_name,
+                            "variant_dir": item,
                             **xml_info
                         })
         
@@ -106,10 +291,13 @@ class DuplicateDetector:
         window_results = {
             "exact_duplicates": [],
             "similar_groups": [],
-            "total_variants": len(list(window_dir.glob('*/**/EQUI*.xml')))
+            "total_variants": sum(1 for f in self.manifest.files("EQUI*.xml", under=window_dir)
+                                  if len(f.relative_to(window_dir).parts) > 1)
         }
         
         for xml_name, locations in variants.items():
+            self.stats["files"] += len(locations)
+            self._all_locations.extend(locations)
             if len(locations) <= 1:
                 continue
             
@@ -132,39 +320,35 @@ class DuplicateDetector:
                         "size": dupes[0]['size']
                     })
             
-            # Check for similar variants
-            if len(locations) > 1:
-                lines_cache = {}
-                for i, loc1 in enumerate(locations):
-                    for loc2 in locations[i+1:]:
-                        if loc1['path'] == loc2['path']:
-                            continue
-                        
-                        # Get cached lines or read
-                        path1_str = str(loc1['path'] / loc1['path'].name)
-                        path2_str = str(loc2['path'] / loc2['path'].name)
-                        
-                        if path1_str not in lines_cache:
-                            lines_cache[path1_str] = self.read_file_lines(loc1['path'] / xml_name)
-                        if path2_str not in lines_cache:
-                            lines_cache[path2_str] = self.read_file_lines(loc2['path'] / xml_name)
-                        
-                        lines1 = lines_cache[path1_str]
-                        lines2 = lines_cache[path2_str]
-                        similarity = self.calculate_similarity(lines1, lines2)
-                        
-                        if similarity >= self.similarity_threshold:
-                            window_results["similar_groups"].append({
-                                "xml_file": xml_name,
-                                "variant1": loc1['variant'],
-                                "variant2": loc2['variant'],
-                                "similarity": similarity,
-                                "size1": loc1['size'],
-                                "size2": loc2['size']
-                            })
+            # Check for similar variants (LSH candidates, then an exact diff)
+            for i, j, similarity in self.similar_pairs(locations):
+                loc1, loc2 = locations[i], locations[j]
+                window_results["similar_groups"].append({
+                    "xml_file": xml_name,
+                    "variant1": loc1['variant'],
+                    "variant2": loc2['variant'],
+                    "similarity": similarity,
+                    "size1": loc1['size'],
+                    "size2": loc2['size']
+                })
         
         return window_results
     
+    def scan_cross_window(self):
+        """Near-duplicates between different windows or differently named files."""
+        locations = self._all_locations
+        for i, j, similarity in self.similar_pairs(locations):
+            loc1, loc2 = locations[i], locations[j]
+            if loc1['window'] == loc2['window'] and loc1['xml_file'] == loc2['xml_file']:
+                continue  # same window and file: already reported by scan_window
+            self.results["cross_window"].append({
+                "file1": f"{loc1['window']}/{loc1['variant']}/{loc1['xml_file']}",
+                "file2": f"{loc2['window']}/{loc2['variant']}/{loc2['xml_file']}",
+                "similarity": similarity,
+                "size1": loc1['size'],
+                "size2": loc2['size']
+            })
+    
     def scan(self):
         """Scan all windows in Options directory."""
         # Get all window directories
@@ -173,6 +357,8 @@ class DuplicateDetector:
         
         duplicate_count = 0
         similar_count = 0
+        start = time.perf_counter()
+        self._all_locations = []
         
         for window_dir in sorted(window_dirs):
             results = self.scan_window(window_dir)
@@ -181,8 +367,19 @@ class DuplicateDetector:
                 duplicate_count += len(results['exact_duplicates'])
                 similar_count += len(results['similar_groups'])
         
+        if self.cross_window:
+            self.scan_cross_window()
+        
         self.results['duplicates_found'] = duplicate_count
         self.results['similar_sets'] = similar_count
+        self.stats["sketches_computed"] = self.sketch_cache.misses
+        self.stats["sketches_cached"] = self.sketch_cache.hits
+        self.stats["lsh_bands"] = self.bands
+        self.stats["lsh_rows"] = self.rows
+        self.stats["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        self.results['similarity_stats'] = dict(self.stats)
+        self.sketch_cache.save(keep={loc['checksum'] for loc in self._all_locations})
+        self.manifest.save()
     
     def print_report(self, detailed=False, show_removals=False):
         """Print formatted report."""
@@ -191,7 +388,17 @@ class DuplicateDetector:
         print("="*70)
         print(f"Scan Timestamp: {self.results['scan_timestamp']}")
         print(f"Exact Duplicates Found: {self.results['duplicates_found']}")
-        print(f"Similar Sets Found: {self.results['similar_sets']}\n")
+        print(f"Similar Sets Found: {self.results['similar_sets']}")
+        stats = self.results.get('similarity_stats', {})
+        if stats:
+            mode = "every pair" if self.exhaustive else f"LSH {stats['lsh_bands']}x{stats['lsh_rows']}"
+            print(f"Pairs Diffed: {stats['diffed']} of {stats['pairs_total']} "
+                  f"({stats['candidate_pairs']} candidates, {mode}; "
+                  f"{stats['sketches_computed']} sketches computed, {stats['sketches_cached']} cached)")
+        print()
+        
+        if 'cross_window' in self.results:
+            self._print_cross_window()
         
         if not self.results['windows']:
             print("[OK] No duplicates detected!\n")
@@ -242,6 +449,15 @@ class DuplicateDetector:
         
         print("\n" + "="*70 + "\n")
     
+    def _print_cross_window(self):
+        """Print near-duplicates found across windows (--cross-window)."""
+        pairs = self.results['cross_window']
+        print(f"[CROSS] NEAR-DUPLICATES ACROSS WINDOWS/FILES ({len(pairs)})")
+        for pair in pairs:
+            print(f"      {pair['file1']} <-> {pair['file2']}")
+            print(f"        • Similarity: {pair['similarity']}%")
+            print(f"        • Sizes: {pair['size1']} vs {pair['size2']} bytes")
+    
     def _identify_removal_candidates(self):
         """Identify variants that could be safely removed."""
         candidates = {}
@@ -290,6 +506,8 @@ within the same window. Uses similarity threshold for fuzzy matching.
 FEATURES:
   ✓ Exact duplicate detection (100% match)
   ✓ Fuzzy matching with configurable similarity threshold
+    (MinHash/LSH candidate pairs, exact diff only on candidates)
+  ✓ Optional near-duplicate search across windows
   ✓ Window-level analysis with variant grouping
   ✓ Removal candidates report (safe to delete)
   ✓ Detailed hash-based comparison
@@ -310,6 +528,9 @@ EXAMPLES:
   # Custom similarity threshold (85% = more lenient matching)
   python .bin/options_duplicate_detector.py --similarity 85 --detailed
 
+  # Also compare files between different windows
+  python .bin/options_duplicate_detector.py --cross-window --similarity 80
+
 SIMILARITY THRESHOLD:
   - 100 = Exact match only
   - 95  = Allow small differences (default)
@@ -319,6 +540,7 @@ SIMILARITY THRESHOLD:
 OUTPUT:
   - Console: Duplicate report with statistics
   - .reports/duplicate_detection_report.json: Full audit data
+  - .tmp/options-minhash-cache.json: MinHash sketches by file checksum
 """
     )
     
@@ -339,6 +561,16 @@ OUTPUT:
         action="store_true",
         help="Show variants safe to remove (duplicates)"
     )
+    parser.add_argument(
+        "--cross-window",
+        action="store_true",
+        help="Also find near-duplicates between different windows/file names"
+    )
+    parser.add_argument(
+        "--exhaustive",
+        action="store_true",
+        help="Diff every pair instead of LSH candidates only (slow; verifies recall)"
+    )
     
     args = parser.parse_args()
     
@@ -356,7 +588,8 @@ OUTPUT:
         sys.exit(1)
     
     # Run detector
-    detector = DuplicateDetector(options_dir, similarity_threshold=args.similarity)
+    detector = DuplicateDetector(options_dir, similarity_threshold=args.similarity,
+                                 cross_window=args.cross_window, exhaustive=args.exhaustive)
     print(f"Scanning {options_dir}...")
     detector.scan()
     
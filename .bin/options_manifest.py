@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Shared content manifest for thorne_drak/Options.
+
+The Options auditors (options_thorne_compare, options_duplicate_detector,
+options_thorne_sync, options_readme_checker) all need the same facts about
+the same files: which files exist, their size and mtime, and whether two
+files have identical content. The manifest records them once in
+.tmp/options-manifest.json:
+
+    files: relative path -> [size, mtime_ns, sha256 hex digest or null]
+
+refresh() walks the tree once and stat()s every file; an entry whose size
+and mtime are unchanged keeps its hash. Hashes are computed lazily, the
+first time a tool asks for one, and persisted, so running the whole
+Options suite back-to-back hashes each file at most once. file_hash()
+re-stats the file before trusting the record, so a file rewritten during
+the run (e.g. by options_thorne_sync) is re-hashed.
+
+Every tool uses the same sha256 digest: it is the hash
+options_thorne_compare always printed, and the duplicate detector's
+checksums use it too.
+
+Usage:
+    manifest = options_manifest.load()          # refreshed manifest for thorne_drak/Options
+    digest = manifest.file_hash(path)           # cached unless size/mtime changed
+    for path in manifest.files("*.xml", under=window_dir):
+        ...
+    manifest.save()
+
+Run directly to refresh the manifest and hash every file:
+    python .bin/options_manifest.py [--verbose]
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+OPTIONS_ROOT = REPO_ROOT / "thorne_drak" / "Options"
+MANIFEST_PATH = REPO_ROOT / ".tmp" / "options-manifest.json"
+MANIFEST_FORMAT = 3
+
+
+def content_hash(path: Path) -> str | None:
+    """sha256 hex digest of a file's bytes (None if unreadable)."""
+    h = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+class OptionsManifest:
+    """Size, mtime and content hash of every file under the Options root."""
+
+    def __init__(self, options_root: Path = OPTIONS_ROOT, path: Path | None = MANIFEST_PATH) -> None:
+        self.root = Path(options_root).resolve()
+        self.path = Path(path) if path else None
+        self.entries: dict[str, list] = {}  # rel path -> [size, mtime_ns, sha256 or None]
+        self.hashed = 0
+        self.reused = 0
+        self._dirty = False
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("format") == MANIFEST_FORMAT and data.get("root") == str(self.root):
+            self.entries = data.get("files", {})
+
+    def refresh(self) -> "OptionsManifest":
+        """Walk the tree once; keep hashes of files whose size and mtime are unchanged."""
+        current: dict[str, list] = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames.sort()
+            base = Path(dirpath)
+            for name in sorted(filenames):
+                try:
+                    st = os.stat(base / name)
+                except OSError:
+                    continue
+                rel = (base / name).relative_to(self.root).as_posix()
+                known = self.entries.get(rel)
+                if known and known[0] == st.st_size and known[1] == st.st_mtime_ns:
+                    current[rel] = known
+                else:
+                    current[rel] = [st.st_size, st.st_mtime_ns, None]
+        if current != self.entries:
+            self._dirty = True
+        self.entries = current
+        return self
+
+    def _key(self, path: Path | str) -> str | None:
+        try:
+            return Path(path).resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return None  # outside the Options tree
+
+    def entry(self, path: Path | str) -> list | None:
+        """[size, mtime_ns, sha256 or None] recorded for a file (from the last refresh)."""
+        key = self._key(path)
+        return self.entries.get(key) if key else None
+
+    def file_hash(self, path: Path | str) -> str | None:
+        """Content hash of a file, computed at most once per content change.
+
+        Files outside the Options tree (e.g. the working copies in
+        thorne_drak/) are hashed directly and not recorded.
+        """
+        key = self._key(path)
+        if key is None:
+            self.hashed += 1
+            return content_hash(Path(path))
+        try:
+            st = os.stat(path)
+        except OSError:
+            if self.entries.pop(key, None) is not None:
+                self._dirty = True
+            return None
+        known = self.entries.get(key)
+        if known and known[0] == st.st_size and known[1] == st.st_mtime_ns and known[2]:
+            self.reused += 1
+            return known[2]
+        digest = content_hash(Path(path))
+        self.hashed += 1
+        self.entries[key] = [st.st_size, st.st_mtime_ns, digest]
+        self._dirty = True
+        return digest
+
+    def size(self, path: Path | str) -> int | None:
+        known = self.entry(path)
+        return known[0] if known else None
+
+    def mtime(self, path: Path | str) -> float | None:
+        """Modification time in seconds (like os.path.getmtime)."""
+        known = self.entry(path)
+        return known[1] / 1e9 if known else None
+
+    def files(self, pattern: str = "*", under: Path | str | None = None, recursive: bool = True) -> list[Path]:
+        """Recorded files whose name matches pattern, optionally below a directory.
+
+        Paths are returned under `under` as given (relative stays relative),
+        else under the resolved Options root.
+        """
+        prefix = ""
+        base = self.root
+        if under is not None:
+            prefix = self._key(under)
+            if prefix is None:
+                return []
+            prefix = "" if prefix == "." else prefix + "/"
+            base = Path(under)
+        result = []
+        for rel in self.entries:
+            if not rel.startswith(prefix):
+                continue
+            rest = rel[len(prefix) :]
+            if not recursive and "/" in rest:
+                continue
+            if fnmatch.fnmatchcase(rest.rpartition("/")[2], pattern):
+                result.append(base / rest)
+        return sorted(result)
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            data = {"format": MANIFEST_FORMAT, "root": str(self.root), "files": self.entries}
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError:
+            pass  # read-only checkout: hashes are recomputed next run
+
+    def summary(self) -> str:
+        return f"manifest: {len(self.entries)} files, {self.hashed} hashed, {self.reused} hashes reused"
+
+
+_shared: dict[str, OptionsManifest] = {}
+
+
+def load(options_root: Path | str = OPTIONS_ROOT, path: Path | None = MANIFEST_PATH) -> OptionsManifest:
+    """Refreshed manifest for an Options root (one instance per root per process)."""
+    key = str(Path(options_root).resolve())
+    manifest = _shared.get(key)
+    if manifest is None:
+        manifest = OptionsManifest(options_root, path).refresh()
+        _shared[key] = manifest
+    return manifest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Refresh the Options content manifest (.tmp/options-manifest.json).")
+    parser.add_argument("--options", default=str(OPTIONS_ROOT), help="Options directory (default: thorne_drak/Options)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="List every file with its hash")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    manifest = load(args.options)
+    for rel in sorted(manifest.entries):
+        digest = manifest.file_hash(manifest.root / rel)
+        if args.verbose:
+            print(f"  {digest or '-':64}  {rel}")
+    manifest.save()
+    print(f"{manifest.summary()} ({time.perf_counter() - start:.2f}s)")
+    print(f"Written: {manifest.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,18 +15,23 @@ Usage:
 Options:
     --fix       Automatically move orphaned READMEs to proper locations
     --verbose   Show detailed file listings
+
+The file listing and modification times come from the shared Options
+manifest (options_manifest.py) instead of a separate directory walk.
 """
 
-import os
 import sys
 import json
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 
+import options_manifest
+
 class OptionsReadmeChecker:
     def __init__(self, options_root, min_readme_lines=80, deep_analysis_threshold=150):
         self.options_root = Path(options_root)
+        self.manifest = options_manifest.load(self.options_root)
         self.min_readme_lines = min_readme_lines
         self.deep_analysis_threshold = deep_analysis_threshold  # Line count below which needs deep analysis
         self.results = {
@@ -45,11 +50,9 @@ class OptionsReadmeChecker:
     def get_readme_files(self):
         """Find all README*.md files in Options directory."""
         readmes = defaultdict(list)
-        for root, dirs, files in os.walk(self.options_root):
-            for file in files:
-                if file.lower().startswith('readme') and file.endswith('.md'):
-                    full_path = Path(root)
-                    readmes[full_path].append(file)
+        for path in self.manifest.files("*.md", under=self.options_root):
+            if path.name.lower().startswith('readme'):
+                readmes[path.parent].append(path.name)
         return readmes
     
     def get_window_directory(self, readme_path):
@@ -67,9 +70,8 @@ class OptionsReadmeChecker:
     
     def find_matching_xml(self, readme_path):
         """Find XML file in same directory as README."""
-        for file in readme_path.iterdir():
-            if file.suffix == '.xml' and file.name.startswith('EQUI'):
-                return file
+        for file in self.manifest.files("EQUI*.xml", under=readme_path, recursive=False):
+            return file
         return None
     
     def count_lines(self, file_path):
@@ -83,8 +85,8 @@ class OptionsReadmeChecker:
     def check_sync_status(self, readme_path, xml_path):
         """Check if README is in sync with XML file."""
         try:
-            readme_mtime = os.path.getmtime(readme_path)
-            xml_mtime = os.path.getmtime(xml_path)
+            readme_mtime = self.manifest.mtime(readme_path)
+            xml_mtime = self.manifest.mtime(xml_path)
             
             readme_time = datetime.fromtimestamp(readme_mtime)
             xml_time = datetime.fromtimestamp(xml_mtime)
@@ -496,6 +498,7 @@ OUTPUT CATEGORIES:
     # Run checker
     checker = OptionsReadmeChecker(options_dir)
     checker.scan()
+    checker.manifest.save()
     
     # Print report
     checker.print_report(verbose=args.verbose)
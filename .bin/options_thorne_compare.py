@@ -16,25 +16,21 @@ Usage:
 Output:
     - Console: Summary or detailed report
     - .reports/options_thorne_compare.json: Full audit data
+
+File hashes come from the shared Options manifest (options_manifest.py).
 """
 
 import json
-import hashlib
 import sys
 from pathlib import Path
 
+import options_manifest
+
 OPTIONS_DIR = Path("thorne_drak/Options")
 
 def get_file_hash(filepath):
-    """Calculate SHA256 hash of a file."""
-    sha256 = hashlib.sha256()
-    try:
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
-    except Exception:
-        return None
+    """SHA-256 of a file (from .tmp/options-manifest.json when unchanged)."""
+    return options_manifest.load(OPTIONS_DIR).file_hash(filepath)
 
 def scan_window(window_name):
     """Scan a single window's Options structure."""
@@ -56,7 +52,7 @@ def scan_window(window_name):
     thorne_path = window_path / "Thorne"
     if thorne_path.exists() and thorne_path.is_dir():
         result["has_thorne"] = True
-        xml_files = list(thorne_path.glob("EQUI_*.xml"))
+        xml_files = options_manifest.load(OPTIONS_DIR).files("EQUI_*.xml", under=thorne_path, recursive=False)
         if xml_files:
             thorne_xml_path = xml_files[0]
             result["thorne_xml"] = thorne_xml_path.name
@@ -73,7 +69,7 @@ def scan_window(window_name):
             variant_name = variant_path.name
             variant_xml_path = variant_path / result["thorne_xml"]
             
-            if not variant_xml_path.exists():
+            if options_manifest.load(OPTIONS_DIR).entry(variant_xml_path) is None:
                 result["variants"].append({
                     "name": variant_name,
                     "status": "missing_xml",
@@ -229,6 +225,7 @@ def main():
     
     args = parser.parse_args()
     results = scan_all_windows()
+    options_manifest.load(OPTIONS_DIR).save()
     
     if args.all:
         args.verbose = True
@@ -27,6 +27,8 @@ import subprocess
 from pathlib import Path
 from datetime import datetime
 
+import options_manifest
+
 # Window configuration - maps window name to one or more EQUI_*.xml files
 WINDOW_MAPPING = {
     "Actions": "EQUI_ActionsWindow.xml",
@@ -59,6 +61,7 @@ class WindowSyncer:
         self.workspace_root = Path(workspace_root)
         self.thorne_drak = self.workspace_root / "thorne_drak"
         self.options_root = self.thorne_drak / "Options"
+        self.manifest = options_manifest.load(self.options_root)
         self.dry_run = dry_run
         self.verbose = verbose
         self.force = force
@@ -288,16 +291,8 @@ See [.sync-status.json](.sync-status.json) for detailed sync metadata including:
                 print(f"    [WARN] Failed to update parent README: {str(e)}")
     
     def _file_hash(self, file_path):
-        """Quick file hash for comparison."""
-        import hashlib
-        md5 = hashlib.md5()
-        try:
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b''):
-                    md5.update(chunk)
-            return md5.hexdigest()
-        except Exception:
-            return None
+        """Content hash for comparison (shared Options manifest)."""
+        return self.manifest.file_hash(file_path)
     
     def sync_window(self, window_name):
         """Sync a specific window."""
@@ -482,6 +477,7 @@ OUTPUT:
         syncer.sync_all()
     else:
         syncer.sync_window(args.window)
+    syncer.manifest.save()
     
     # Print report
     syncer.print_report()
@@ -2,7 +2,7 @@
 """Auto-select the best dragitem icon for each EQ class + equipment slot.
 
 Uses per-class stat priorities to score icons and pick the most representative
-icon per slot. Reads eq_items.csv and outputs recommendations.
+icon per slot. Reads the item store (eq_items.npz) and outputs recommendations.
 
 All 15 EQ classes scored individually:
   Warrior, Rogue, Monk, Paladin, Shadowknight, Bard, Ranger, Shaman,
@@ -34,21 +34,25 @@ Usage:
 """
 import csv
 import json
+import math
 import os
 import sys
-from collections import Counter, defaultdict
+from collections import defaultdict
+
+import numpy as np
+
+import eq_items_store
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
 CACHE_DIR = os.path.join(PROJECT_ROOT, '.master', 'items', '.cache')
 
-CSV_IN = os.path.join(CACHE_DIR, 'eq_items.csv')
 JSON_OUT = os.path.join(CACHE_DIR, 'class_icon_picks.json')
 CSV_OUT = os.path.join(CACHE_DIR, 'class_icon_picks.csv')
 HTML_OUT = os.path.join(CACHE_DIR, 'class_icon_picks.html')
 
-if not os.path.exists(CSV_IN):
-    print("ERROR: eq_items.csv not found. Run extract_eq_items.py first.")
+if not (os.path.exists(eq_items_store.STORE_PATH) or os.path.exists(eq_items_store.CSV_PATH)):
+    print("ERROR: eq_items.npz/csv not found. Run extract_eq_items.py first.")
     sys.exit(1)
 
 # ============================================================
@@ -274,18 +278,8 @@ def class_bitmask(eq_classes):
     return mask
 
 
-def score_item(item, weights):
-    """Score a single item against stat weights."""
-    score = 0.0
-    for stat, weight in weights.items():
-        val = int(item.get(stat, 0))
-        if val > 0:
-            score += val * weight
-    return score
-
-
-def class_specificity(items_for_icon, target_class_bit):
-    """Compute how class-specific the items behind this icon are.
+def class_specificity(n_classes):
+    """Compute how class-specific an item worn by n_classes classes is.
 
     Returns a multiplier (0.5 to 2.0):
     - Items worn by 1 class  → 2.0x  (strongly rewarded)
@@ -294,65 +288,158 @@ def class_specificity(items_for_icon, target_class_bit):
     - Items worn by 15 classes → 0.5x (heavily penalized)
 
     Uses log scaling: mult = 2.0 - 1.5 * log(n)/log(15)
+    An icon's multiplier is the average over its items (items with no
+    classes are skipped; 1.0 if none remain).
     """
-    if not items_for_icon:
-        return 1.0
-    import math
     log15 = math.log(15)
-    specificities = []
-    for item in items_for_icon:
-        class_mask = int(item['classes'])
-        n_classes = bin(class_mask).count('1')
-        if n_classes == 0:
-            continue
-        # 2.0 at n=1, 0.5 at n=15
-        specificities.append(2.0 - 1.5 * math.log(max(n_classes, 1)) / log15)
-    if not specificities:
-        return 1.0
-    return sum(specificities) / len(specificities)  # range: 0.5 to 2.0
+    # 2.0 at n=1, 0.5 at n=15
+    return 2.0 - 1.5 * math.log(max(n_classes, 1)) / log15
+
 
+def score_items(pos_stats, weights):
+    """Score every item against stat weights.
 
-def score_icon_group(items_for_icon, weights, exclusivity=1.0, target_class_bit=0):
+    pos_stats is the (n_items, len(ALL_STATS)) matrix of positive stat
+    values; weights are accumulated in dict order, as a per-item loop would.
+    Returns a list of per-item scores indexed by store row.
+    """
+    scores = np.zeros(len(pos_stats))
+    for stat, weight in weights.items():
+        scores += pos_stats[:, ALL_STATS.index(stat)] * weight
+    return scores.tolist()
+
+
+def score_icon_group(bucket, item_scores, exclusivity=1.0):
     """Score an icon based on the average stat score of its items.
 
     Returns (stat_score, item_count, total_score).
     - stat_score: average per-item score from stat weights
     - item_count: number of items behind this icon
     - total_score: stat_score + count_bonus + exclusivity_bonus
+    - item_scores: per-item scores for the target class (score_items)
     - exclusivity: 0.0-1.0, how exclusive this icon is to this class group
-    - target_class_bit: bitmask for the target class (for specificity bonus)
     """
-    if not items_for_icon:
-        return 0.0, 0, 0.0
+    item_count = bucket.item_count
 
     # Score items that have any stats at all
-    statted_items = [i for i in items_for_icon if any(int(i.get(s, 0)) > 0 for s in ALL_STATS)]
-
-    if not statted_items:
+    if not bucket.statted_rows:
         # No statted items — score by item count alone (very low priority)
-        return 0.0, len(items_for_icon), len(items_for_icon) * 0.5
+        return 0.0, item_count, item_count * 0.5
 
-    scores = [score_item(i, weights) for i in statted_items]
-    avg_score = sum(scores) / len(scores)
+    avg_score = sum(item_scores[r] for r in bucket.statted_rows) / len(bucket.statted_rows)
 
     # Popularity bonus — capped at 20 items (max 10.0 bonus)
-    count_bonus = min(len(items_for_icon), 20) * 0.5
+    count_bonus = min(item_count, 20) * 0.5
 
     # Exclusivity bonus — reward class-distinctive icons
     excl_bonus = avg_score * 0.3 * exclusivity
 
     # Class specificity — reward icons whose items are class-restricted
     # Items usable by 1 class get 2x, items usable by all get ~1.07x
-    spec_mult = class_specificity(items_for_icon, target_class_bit)
+    spec_mult = bucket.spec_sum / bucket.spec_count if bucket.spec_count else 1.0
 
     # Confidence penalty — small samples have volatile averages.
     # Icons backed by 8+ items get full credit; fewer items scale down
     # the stat-derived scoring proportionally (count_bonus unaffected).
     MIN_CONFIDENT_COUNT = 8
-    confidence = min(len(items_for_icon), MIN_CONFIDENT_COUNT) / MIN_CONFIDENT_COUNT
+    confidence = min(item_count, MIN_CONFIDENT_COUNT) / MIN_CONFIDENT_COUNT
 
     total = ((avg_score * spec_mult) + excl_bonus) * confidence + count_bonus
-    return avg_score, len(items_for_icon), total
+    return avg_score, item_count, total
+
+
+# ============================================================
+# CANDIDATE INDEX
+# ============================================================
+
+class IconBucket:
+    """Items behind one icon in a (slot, class) pool, with precomputed aggregates."""
+
+    __slots__ = ('icon', 'rows', 'item_count', 'statted_rows', 'stat_sums',
+                 'stat_counts', 'spec_sum', 'spec_count', 'all_weapon',
+                 'itemtypes', 'example_names')
+
+
+class CandidateIndex:
+    """Common items bucketed once by (slot_bit, class_mask, icon).
+
+    Per-item features (positive stats, statted flag, class specificity,
+    weapon-slot flag) are computed once for the whole store. Each
+    (slot_bit, class_mask) cell then holds:
+      icons      - icons with any common item there (drives exclusivity)
+      scorable   - IconBuckets over non-GM items, in first-seen icon order
+      restricted - IconBuckets over the class-restricted subset of those
+    """
+
+    def __init__(self, store, slot_bits, class_masks):
+        self.store = store
+        common = store['itemclass'] == 0
+        scorable = (
+            common                          # Common items only (not containers/books)
+            & (store['hp'] <= MAX_HP)       # Exclude GM items (Ban Hammer etc.)
+            & (store['mana'] <= MAX_MANA)
+            & (store['ac'] <= MAX_AC)
+        )
+        restricted = scorable & (store.n_classes <= MAX_CLASSES_FOR_RESTRICTED)
+
+        stats = np.stack([store[s] for s in ALL_STATS], axis=1)
+        self.pos_stats = np.where(stats > 0, stats, 0)
+        self.statted = (stats > 0).any(axis=1)
+        spec_by_n = {n: class_specificity(n) for n in set(store.n_classes.tolist())}
+        self.spec = [spec_by_n[n] if n else None for n in store.n_classes.tolist()]
+        self.weapon = (store['slots'] & WEAPON_SLOT_MASK) != 0
+        self.itemtypes = store['itemtype_str'].tolist()
+        self.names = store['Name'].tolist()
+
+        self.cells = {}
+        for slot_bit in slot_bits:
+            slot_items = store.slot_mask(slot_bit)
+            for class_mask in class_masks:
+                cell = slot_items & store.class_mask(class_mask)
+                self.cells[(slot_bit, class_mask)] = {
+                    'icons': np.unique(store['icon'][cell & common]).tolist(),
+                    'scorable': self._buckets(np.flatnonzero(cell & scorable)),
+                    'restricted': self._buckets(np.flatnonzero(cell & restricted)),
+                }
+
+    def _buckets(self, rows):
+        """Group store rows by icon and precompute per-icon aggregates."""
+        if not len(rows):
+            return []
+        icons = self.store['icon'][rows]
+        order = np.argsort(icons, kind='stable')
+        rows, icons = rows[order], icons[order]
+        starts = np.flatnonzero(np.r_[True, icons[1:] != icons[:-1]])
+        ends = np.r_[starts[1:], len(rows)]
+
+        # Non-statted items have no positive stats, so they add nothing here
+        pos = self.pos_stats[rows]
+        stat_sums = np.add.reduceat(pos, starts, axis=0).tolist()
+        stat_counts = np.add.reduceat((pos > 0).astype(np.int64), starts, axis=0).tolist()
+        all_weapon = np.logical_and.reduceat(self.weapon[rows], starts).tolist()
+        statted = self.statted[rows].tolist()
+        rows = rows.tolist()
+        icons = icons.tolist()
+
+        buckets = []
+        for k, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+            b = IconBucket()
+            b.icon = icons[start]
+            b.rows = rows[start:end]
+            b.item_count = end - start
+            b.statted_rows = [r for r, st in zip(b.rows, statted[start:end]) if st]
+            b.stat_sums = stat_sums[k]
+            b.stat_counts = stat_counts[k]
+            specs = [self.spec[r] for r in b.rows if self.spec[r] is not None]
+            b.spec_sum = sum(specs)
+            b.spec_count = len(specs)
+            b.all_weapon = all_weapon[k]
+            b.itemtypes = [self.itemtypes[r] for r in b.rows]
+            b.example_names = [self.names[r] for r in b.rows[:3]]
+            buckets.append(b)
+        # First-seen order, as if grouping the filtered item list by icon
+        buckets.sort(key=lambda b: b.rows[0])
+        return buckets
 
 
 def icon_png_path(icon):
@@ -376,7 +463,7 @@ def icon_png_exists(icon):
     return os.path.exists(path)
 
 
-def compute_exclusivity(items, class_profiles):
+def compute_exclusivity(index, class_profiles):
     """Pre-compute per-icon exclusivity scores for each class group.
 
     For each icon+slot, count how many of the 9 class groups can use it.
@@ -387,16 +474,9 @@ def compute_exclusivity(items, class_profiles):
     icon_slot_classes = defaultdict(set)
     for class_name, profile in class_profiles.items():
         mask = class_bitmask(profile['eq_classes'])
-        for item in items:
-            if int(item['itemclass']) != 0:
-                continue
-            if not (int(item['classes']) & mask):
-                continue
-            icon = int(item['icon'])
-            slot_val = int(item['slots'])
-            for bit, sname in SLOT_BITS.items():
-                if slot_val & bit:
-                    icon_slot_classes[(icon, sname)].add(class_name)
+        for bit, sname in SLOT_BITS.items():
+            for icon in index.cells[(bit, mask)]['icons']:
+                icon_slot_classes[(icon, sname)].add(class_name)
 
     result = {}
     for key, groups in icon_slot_classes.items():
@@ -578,17 +658,18 @@ def write_html(results):
 
 def main():
     # Load items
-    items = []
-    with open(CSV_IN, encoding='utf-8') as f:
-        for row in csv.DictReader(f):
-            items.append(row)
+    store = eq_items_store.load_items()
 
-    print(f"Loaded {len(items)} items from eq_items.csv")
+    print(f"Loaded {len(store)} items from {store.source}")
     print(f"Classes to process: {len(CLASS_PROFILES)}")
 
-    # Pre-compute exclusivity
+    # Bucket items once by (slot, class, icon), then pre-compute exclusivity
+    print("Indexing items by slot/class/icon...")
+    index = CandidateIndex(
+        store, list(SLOT_BITS),
+        [class_bitmask(p['eq_classes']) for p in CLASS_PROFILES.values()])
     print("Computing icon exclusivity...")
-    excl_map = compute_exclusivity(items, CLASS_PROFILES)
+    excl_map = compute_exclusivity(index, CLASS_PROFILES)
     print()
 
     # Results structure
@@ -599,6 +680,7 @@ def main():
         eq_classes = profile['eq_classes']
         weights = profile['weights']
         class_mask = class_bitmask(eq_classes)
+        item_scores = score_items(index.pos_stats, weights)
 
         print(f"  {class_name} ({'/'.join(sorted(eq_classes))})")
 
@@ -615,44 +697,28 @@ def main():
             if slot_bit is None:
                 continue
 
-            # Filter: items usable by this class at this slot
-            slot_items = [
-                i for i in items
-                if int(i['slots']) & slot_bit
-                and int(i['classes']) & class_mask
-                and int(i['itemclass']) == 0  # Common items only (not containers/books)
-                and int(i['hp']) <= MAX_HP     # Exclude GM items (Ban Hammer etc.)
-                and int(i['mana']) <= MAX_MANA
-                and int(i['ac']) <= MAX_AC
-            ]
-
-            if not slot_items:
+            # Candidates: items usable by this class at this slot, by icon
+            candidates = index.cells[(slot_bit, class_mask)]
+            buckets = candidates['scorable']
+
+            if not buckets:
                 continue
 
             # Prefer class-restricted items to drive icon variety across classes.
             # Fall back to the full pool only when the restricted pool is empty
             # or has just 1 icon (which means it can't differentiate this class).
             use_restricted = False
-            restricted = [i for i in slot_items
-                          if bin(int(i['classes'])).count('1') <= MAX_CLASSES_FOR_RESTRICTED]
-            if restricted:
-                icon_counts = Counter(int(i['icon']) for i in restricted)
-                if len(icon_counts) >= 2:
-                    slot_items = restricted
-                    use_restricted = True
-
-            # Group by icon
-            by_icon = defaultdict(list)
-            for item in slot_items:
-                by_icon[int(item['icon'])].append(item)
+            if len(candidates['restricted']) >= 2:
+                buckets = candidates['restricted']
+                use_restricted = True
 
             # Score each icon
             scored = []
-            for icon, icon_items in by_icon.items():
+            for bucket in buckets:
+                icon = bucket.icon
                 excl = excl_map.get((icon, slot_name, class_name), 0.11)
                 stat_score, item_count, total_score = score_icon_group(
-                    icon_items, weights, exclusivity=excl,
-                    target_class_bit=class_mask)
+                    bucket, item_scores, exclusivity=excl)
 
                 adjusted = icon - 500
                 dragitem_file = adjusted // 36 + 1
@@ -662,11 +728,9 @@ def main():
 
                 # Get top stat contributions for explanation
                 stat_avgs = {}
-                statted = [i for i in icon_items if any(int(i.get(s, 0)) > 0 for s in ALL_STATS)]
-                for stat in ALL_STATS:
-                    vals = [int(i.get(stat, 0)) for i in statted if int(i.get(stat, 0)) > 0]
-                    if vals:
-                        stat_avgs[stat] = sum(vals) / len(vals)
+                for k, stat in enumerate(ALL_STATS):
+                    if bucket.stat_counts[k]:
+                        stat_avgs[stat] = bucket.stat_sums[k] / bucket.stat_counts[k]
 
                 # Top 3 contributing stats
                 top_stats = sorted(
@@ -675,29 +739,22 @@ def main():
                 )[:3]
                 top_stats_str = ', '.join(f"{s}={v:.0f}" for s, v in top_stats)
 
-                example_names = [i['Name'] for i in icon_items[:3]]
+                example_names = bucket.example_names
 
                 # Penalise icons where ALL items are multi-slot and also
                 # equippable in a weapon/shield slot. A shield icon picked
                 # for 'back' confuses players — they expect a cloak.
                 if slot_name not in WEAPON_SLOTS:
-                    all_also_weapon = all(
-                        int(i['slots']) & WEAPON_SLOT_MASK
-                        for i in icon_items
-                    )
-                    if all_also_weapon:
+                    if bucket.all_weapon:
                         total_score *= 0.3   # heavy penalty
 
                 # Weapon-type hint bonus/penalty — nudge weapon slots
                 # toward item-types typical for this class archetype.
                 hint_types = profile.get('weapon_hints', {}).get(slot_name)
                 if hint_types and slot_name in WEAPON_SLOTS:
-                    typed = [i for i in icon_items if i.get('itemtype_str', '')]
+                    typed = [t for t in bucket.itemtypes if t]
                     if typed:
-                        match_count = sum(
-                            1 for i in typed
-                            if i['itemtype_str'] in hint_types
-                        )
+                        match_count = sum(1 for t in typed if t in hint_types)
                         match_ratio = match_count / len(typed)
                         # 60%+ matching items → up to 1.5x boost
                         # <20% matching → 0.6x penalty
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Cosine-similarity index over labelled reference vectors.
+
+generate_catalog.py (pixel feature vectors) and vision_classify.py (HOG
+vectors) classify an icon by its most similar confirmed reference. Both
+used to loop over every reference in Python for every query, re-computing
+each reference norm each time. ReferenceIndex stacks the references once,
+grouped by label (subcategory) with unit-norm rows, and scores a whole
+batch of queries with one matrix multiply:
+
+    similarities = normalized(queries) @ matrix.T      # (queries, references)
+
+The best score per label is a max over that label's contiguous block of
+columns; query() returns the top-k labels with the margin between the
+first two. Ties resolve to the first reference in insertion order, as the
+old loops did.
+
+An index is saved as an .npz next to the feature caches, tagged with a
+source key (a hash of whatever the references were built from), so a
+caller can skip rebuilding when its inputs have not changed.
+
+Usage:
+    index = ReferenceIndex.from_refs({"sword": [v1, v2], "shield": [v3]})
+    for match in index.query(vectors, k=3):    # None for a zero query
+        print(match.label, match.score, match.margin, match.top)
+    index.save(path, source_key(...))
+    index = ReferenceIndex.load(path, source_key(...))   # None if stale
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+INDEX_FORMAT = 1
+MIN_NORM = 1e-6
+
+
+@dataclass
+class Match:
+    label: str
+    score: float  # cosine similarity of the best reference
+    margin: float  # score minus the best score of the next label (score if only one)
+    top: list[tuple[str, float]]  # top-k labels with their best scores, best first
+
+
+def source_key(*parts) -> str:
+    """Stable hash of JSON-serializable inputs, used to tag a saved index."""
+    blob = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+class ReferenceIndex:
+    """Unit-norm reference vectors stacked by label."""
+
+    def __init__(self, labels: list[str], counts: list[int], matrix: np.ndarray, source: str = "") -> None:
+        self.labels = list(labels)  # one per group, in insertion order
+        self.counts = list(counts)  # references per label (all > 0)
+        self.matrix = np.asarray(matrix, dtype=np.float64)  # (references, dims)
+        self.source = source
+        self._starts = np.concatenate(([0], np.cumsum(self.counts)[:-1])).astype(np.intp)
+
+    @classmethod
+    def from_refs(cls, refs: dict[str, list], source: str = "") -> "ReferenceIndex":
+        """Stack {label: [vector, ...]}; references with (near) zero norm are dropped."""
+        labels, counts, rows = [], [], []
+        for label, vectors in refs.items():
+            if not len(vectors):
+                continue
+            block = np.asarray(vectors, dtype=np.float64).reshape(len(vectors), -1)
+            norms = np.linalg.norm(block, axis=1)
+            keep = norms >= MIN_NORM
+            if not keep.any():
+                continue
+            labels.append(label)
+            counts.append(int(keep.sum()))
+            rows.append(block[keep] / norms[keep, None])
+        matrix = np.concatenate(rows) if rows else np.zeros((0, 0))
+        return cls(labels, counts, matrix, source)
+
+    def __len__(self) -> int:
+        return len(self.matrix)
+
+    @property
+    def dims(self) -> int:
+        return self.matrix.shape[1] if len(self.matrix) else 0
+
+    def similarities(self, queries) -> tuple[np.ndarray, np.ndarray]:
+        """Cosine similarity of every query to every reference.
+
+        Returns (scores (queries, references), valid (queries,)); rows of
+        queries with (near) zero norm are not valid and score 0.
+        """
+        q = np.asarray(queries, dtype=np.float64)
+        q = q.reshape(1, -1) if q.ndim == 1 else q
+        norms = np.linalg.norm(q, axis=1)
+        valid = norms >= MIN_NORM
+        q = q / np.where(valid, norms, 1.0)[:, None]
+        return q @ self.matrix.T, valid
+
+    def label_scores(self, queries) -> tuple[np.ndarray, np.ndarray]:
+        """Best similarity per label: (scores (queries, labels), valid (queries,))."""
+        sims, valid = self.similarities(queries)
+        return np.maximum.reduceat(sims, self._starts, axis=1), valid
+
+    def query(self, queries, k: int = 3) -> list[Match | None]:
+        """Top-k labels for each query (None for a zero query or an empty index)."""
+        q = np.asarray(queries, dtype=np.float64)
+        count = 1 if q.ndim == 1 else len(q)
+        if not len(self) or not count:
+            return [None] * count
+        scores, valid = self.label_scores(q)
+        # Stable sort keeps insertion order among equal scores (first best label wins)
+        order = np.argsort(-scores, axis=1, kind="stable")[:, : max(1, k)]
+        results: list[Match | None] = []
+        for i in range(count):
+            if not valid[i]:
+                results.append(None)
+                continue
+            top = [(self.labels[j], float(scores[i, j])) for j in order[i]]
+            margin = top[0][1] - top[1][1] if len(top) > 1 else top[0][1]
+            results.append(Match(label=top[0][0], score=top[0][1], margin=margin, top=top))
+        return results
+
+    def save(self, path: Path, source: str | None = None) -> None:
+        if source is not None:
+            self.source = source
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+            np.savez(
+                tmp_path,
+                format=np.array(INDEX_FORMAT),
+                source=np.array(self.source),
+                labels=np.array(self.labels, dtype=str),
+                counts=np.array(self.counts, dtype=np.int64),
+                matrix=self.matrix,
+            )
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # read-only checkout: the index is rebuilt next run
+
+    @classmethod
+    def load(cls, path: Path, source: str) -> "ReferenceIndex | None":
+        """Saved index built from `source`; None if missing, stale or malformed."""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data["format"]) != INDEX_FORMAT or str(data["source"]) != source:
+                    return None
+                return cls(
+                    [str(label) for label in data["labels"]],
+                    [int(n) for n in data["counts"]],
+                    data["matrix"],
+                    source,
+                )
+        except (OSError, KeyError, ValueError):
+            return None
@@ -39,9 +39,28 @@ breaks all existing animation Y-offset mappings.
 
 from PIL import Image, ImageOps
 from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import contextlib
+import io
+import os
+import re
 import sys
 import json
-import shutil
+
+import buildcache
+import deploy
+import imagecache
+import watch
+
+try:
+    import gauge_kernels as _kernels
+except ImportError:  # NumPy not installed - per-pixel loops only
+    _kernels = None
+
+# Build cache version: any edit to the generator or its kernels invalidates outputs
+SCRIPT_VERSION = buildcache.script_version(
+    __file__, Path(__file__).with_name("gauge_kernels.py"), Path(__file__).with_name("imagecache.py")
+)
 
 
 # ============================================================================
@@ -53,11 +72,15 @@ WIDE_WIDTHS = [120]  # Base is 120, can expand with 150, 160, etc.
 TALL_WIDTHS = [105, 120, 250]  # Base is 120 (from standard), others scale from 120t
 CANONICAL_BASE_WIDTH = 120  # Normalize source section width before scaling variants
 
+# Generated sizes: gauge_inlay<SIZE_MARKER>_thorne0X.tga, SIZE_MARKER is digits
+# optionally followed by 't' (e.g. 120, 105t, 250t). Base sources never match.
+SIZED_GAUGE_RE = re.compile(r'^gauge_inlay(\d+t?)_thorne\d+\.tga$', re.IGNORECASE)
+
 
 class GaugeGenerator:
     """Manages gauge generation with stats tracking."""
     
-    def __init__(self, variant_dir, black_mask_thin=1, debug=False, black_threshold=0):
+    def __init__(self, variant_dir, black_mask_thin=1, debug=False, black_threshold=0, use_kernels=True, use_cache=True):
         """Initialize generator for a gauge variant.
         
         Args:
@@ -65,11 +88,18 @@ class GaugeGenerator:
             black_mask_thin: Number of thinning passes for stretched black mask
             debug: If True, emit per-output debug visualization TGAs
             black_threshold: Max RGB value considered black (0=exact black only)
+            use_kernels: If True and NumPy is available, run pixel stages through
+                         the array kernels in gauge_kernels.py (byte-identical
+                         to the per-pixel reference loops)
+            use_cache: If True, skip tasks whose outputs are up to date in
+                       .regen_gauges-cache.json (always off in debug mode,
+                       which must re-emit the debug TGAs)
         """
         self.variant_dir = Path(variant_dir)
         self.black_mask_thin = max(0, int(black_mask_thin))
         self.debug = bool(debug)
         self.black_threshold = max(0, min(255, int(black_threshold)))
+        self.use_kernels = bool(use_kernels) and _kernels is not None
         self.stats = {
             "variant": self.variant_dir.name,
             "variant_path": str(self.variant_dir),
@@ -83,6 +113,10 @@ class GaugeGenerator:
         }
         self.config = self._load_variant_config()
         self.stats["config_loaded"] = (self.variant_dir / ".regen_gauges.json").exists()
+        self.cache = buildcache.BuildCache(
+            self.variant_dir, "regen_gauges", SCRIPT_VERSION,
+            enabled=bool(use_cache) and not self.debug,
+        )
     
     def _load_variant_config(self):
         """Load per-variant config from .regen_gauges.json if present.
@@ -254,6 +288,12 @@ class GaugeGenerator:
             return section
 
         threshold = self.black_threshold
+        if self.use_kernels:
+            section, snapped_from = _kernels.snap_dark_columns(section, threshold, snap_positions)
+            if snapped_from is not None:
+                print(f"    Snapped grid marks: {snapped_from} -> {snap_positions}")
+            return section
+
         w, h = section.size
         px = section.load()
 
@@ -328,6 +368,12 @@ class GaugeGenerator:
         if not snap_positions:
             return fill_section
 
+        if self.use_kernels:
+            fill_section, snapped_from = _kernels.snap_fill_gaps(fill_section, snap_positions)
+            if snapped_from is not None:
+                print(f"    Snapped fill gaps: {snapped_from} -> {snap_positions}")
+            return fill_section
+
         w, h = fill_section.size
         px = fill_section.load()
 
@@ -511,7 +557,7 @@ class GaugeGenerator:
         print(f"  Generating wide gauge @ {width}px...")
         
         # Load standard gauge
-        std = Image.open(source)
+        std = imagecache.load_rgba(source, shared=True)
         std_width = std.size[0]
         
         # Extract individual sections (8px tall each)
@@ -615,7 +661,7 @@ class GaugeGenerator:
         print(f"  Generating tall gauge (120×64)...")
         
         # Load standard gauge
-        std = Image.open(source)
+        std = imagecache.load_rgba(source, shared=True)
         std_width = std.size[0]
         target_width = 120
         
@@ -700,6 +746,9 @@ class GaugeGenerator:
         composite.paste(lightgridfill_tall, (0, 48))
         composite.save(str(composite_file), format='TGA')
         print(f"    Saved: {composite_filename}")
+        # Tall variants are scaled from these two files: keep them decoded
+        imagecache.remember(output_file, result)
+        imagecache.remember(composite_file, composite)
         if self.debug and debug_sections:
             self._write_debug_canvas(output_file, debug_sections)
         self.stats["generated"]["tall"].append(output_filename)
@@ -735,7 +784,7 @@ class GaugeGenerator:
         print(f"  Generating tall gauge @ {width}x64 ({scale_factor:.2f}x from 120t)...")
         
         # Load 120t main source (4 rows x 16px = 64px)
-        tall = Image.open(source)
+        tall = imagecache.load_rgba(source, shared=True)
         tall_width = tall.size[0]  # Should be 120
         
         # Extract main sections (16px each, 4 rows from 64px source)
@@ -791,7 +840,7 @@ class GaugeGenerator:
         
         # Scale composite rows if composite source exists
         if composite_source.exists():
-            comp = Image.open(composite_source)
+            comp = imagecache.load_rgba(composite_source, shared=True)
             comp_width = comp.size[0]
             
             # Extract composite sections (Overlay@Y=0, SolidFill@Y=16, GridFill@Y=32)
@@ -844,6 +893,8 @@ class GaugeGenerator:
         """
         if not self._section_fill_gaps():
             return fill_section.copy()
+        if self.use_kernels:
+            return _kernels.fill_transparent_gaps(fill_section)
         
         result = fill_section.copy()
         px = result.load()
@@ -914,6 +965,15 @@ class GaugeGenerator:
         overlay = self._generate_overlay(bg_section, interior_only=True)
         gray_level = self._section_gridfill_gray_level()
         
+        if self.use_kernels:
+            gray_overlay = _kernels.recolor_marks(overlay, gray_level)
+            result = _kernels.blend_overlay_into_fill(
+                solidfill, gray_overlay,
+                spread=self._section_gridfill_spread(),
+                darken=self._section_gridfill_darken(),
+            )
+            return _kernels.clear_edge_columns(result)
+        
         # Convert overlay marks to configured gray level
         gray_overlay = overlay.copy()
         px = gray_overlay.load()
@@ -961,14 +1021,17 @@ class GaugeGenerator:
         gray_level = self._section_lightgridfill_gray_level()
         
         # Convert black overlay marks to gray
-        gray_overlay = overlay.copy()
-        px = gray_overlay.load()
-        width, height = gray_overlay.size
-        for y in range(height):
-            for x in range(width):
-                r, g, b, a = px[x, y]
-                if a > 0:
-                    px[x, y] = (gray_level, gray_level, gray_level, a)
+        if self.use_kernels:
+            gray_overlay = _kernels.recolor_marks(overlay, gray_level)
+        else:
+            gray_overlay = overlay.copy()
+            px = gray_overlay.load()
+            width, height = gray_overlay.size
+            for y in range(height):
+                for x in range(width):
+                    r, g, b, a = px[x, y]
+                    if a > 0:
+                        px[x, y] = (gray_level, gray_level, gray_level, a)
         
         # Composite gray marks onto SolidFill (with optional neighbor darkening)
         darken = self._section_lightgridfill_darken()
@@ -982,6 +1045,9 @@ class GaugeGenerator:
             result = Image.alpha_composite(solidfill, gray_overlay)
         
         # Clear first and last columns so the background border shows through
+        if self.use_kernels:
+            return _kernels.clear_edge_columns(result)
+        width, height = result.size
         res_px = result.load()
         for y in range(height):
             res_px[0, y] = (0, 0, 0, 0)
@@ -1016,19 +1082,22 @@ class GaugeGenerator:
             gaps at each grid-line column, inner shading preserved
         """
         src_width, src_height = fill_section.size
-        fill_px = fill_section.load()
         
         # Step 1: Identify gap columns in source fill (fully transparent interior columns)
-        src_gap_cols = set()
-        for x in range(1, src_width - 1):       # Skip border columns
-            is_gap = True
-            for y in range(1, src_height - 1):   # Check interior rows only
-                _, _, _, a = fill_px[x, y]
-                if a > 0:
-                    is_gap = False
-                    break
-            if is_gap:
-                src_gap_cols.add(x)
+        if self.use_kernels:
+            src_gap_cols = set(_kernels.transparent_columns(fill_section))
+        else:
+            fill_px = fill_section.load()
+            src_gap_cols = set()
+            for x in range(1, src_width - 1):       # Skip border columns
+                is_gap = True
+                for y in range(1, src_height - 1):   # Check interior rows only
+                    _, _, _, a = fill_px[x, y]
+                    if a > 0:
+                        is_gap = False
+                        break
+                if is_gap:
+                    src_gap_cols.add(x)
         
         # If no gaps found, fall back to normal scaling
         if not src_gap_cols:
@@ -1039,18 +1108,20 @@ class GaugeGenerator:
             )
         
         # Step 2: Detect grid-line columns from scaled background
-        bg_width, bg_height = bg_scaled.size
-        bg_px = bg_scaled.load()
         threshold = self.black_threshold
-        
-        dst_gap_cols = sorted(set(
-            x for x in range(1, bg_width - 1)
-            if any(
-                bg_px[x, y][3] > 0 and bg_px[x, y][0] <= threshold
-                and bg_px[x, y][1] <= threshold and bg_px[x, y][2] <= threshold
-                for y in range(1, bg_height - 1)
-            )
-        ))
+        if self.use_kernels:
+            dst_gap_cols = _kernels.dark_columns(bg_scaled, threshold)
+        else:
+            bg_width, bg_height = bg_scaled.size
+            bg_px = bg_scaled.load()
+            dst_gap_cols = sorted(set(
+                x for x in range(1, bg_width - 1)
+                if any(
+                    bg_px[x, y][3] > 0 and bg_px[x, y][0] <= threshold
+                    and bg_px[x, y][1] <= threshold and bg_px[x, y][2] <= threshold
+                    for y in range(1, bg_height - 1)
+                )
+            ))
         
         # Step 3: Parse source into segments (runs of non-gap columns)
         # A segment is a contiguous run of columns that are NOT gap columns
@@ -1155,6 +1226,9 @@ class GaugeGenerator:
             spread: Pixels of gradient falloff around each mark (1=immediate neighbors only)
             darken: Max darkening factor for immediate neighbors (0=none, 1=black)
         """
+        if self.use_kernels:
+            return _kernels.blend_overlay_into_fill(solidfill, overlay, spread=spread, darken=darken)
+
         result = solidfill.copy()
         width, height = result.size
         res_px = result.load()
@@ -1215,6 +1289,8 @@ class GaugeGenerator:
             return Image.new('RGBA', bg_section.size, (0, 0, 0, 0))
         if threshold is None:
             threshold = self.black_threshold
+        if self.use_kernels:
+            return _kernels.extract_overlay(bg_section, threshold, interior_only=interior_only)
         
         width, height = bg_section.size
         result = Image.new('RGBA', (width, height), (0, 0, 0, 0))
@@ -1387,6 +1463,9 @@ class GaugeGenerator:
         if threshold is None:
             threshold = self.black_threshold
 
+        if self.use_kernels:
+            return _kernels.fill_black_from_nearest(source, threshold)
+
         result = source.copy()
         src_px = source.load()
         out_px = result.load()
@@ -1406,7 +1485,12 @@ class GaugeGenerator:
         return result
 
     def _find_nearest_non_black_pixel(self, pixels, width, height, x, y, threshold=None):
-        """Find nearest non-black pixel using expanding-radius search."""
+        """Find nearest non-black pixel using expanding-radius search.
+
+        Reference implementation for the per-pixel path. The kernel path
+        fills every black pixel at once with a distance transform that
+        reproduces this ring scan order (see gauge_kernels.fill_black_from_nearest).
+        """
         if threshold is None:
             threshold = self.black_threshold
 
@@ -1444,6 +1528,8 @@ class GaugeGenerator:
         """Build an L-mode binary mask for pure-black pixels (0 or 255)."""
         if threshold is None:
             threshold = self.black_threshold
+        if self.use_kernels:
+            return _kernels.build_black_mask(source, threshold)
 
         width, height = source.size
         mask = Image.new('L', (width, height), 0)
@@ -1472,6 +1558,9 @@ class GaugeGenerator:
         if threshold is None:
             threshold = self.black_threshold
 
+        if self.use_kernels:
+            return _kernels.scale_black_mask_horizontal(source, target_width, threshold)
+
         src_w, src_h = source.size
         source_mask = self._build_black_mask(source, threshold=threshold)
         target_mask = Image.new('L', (target_width, src_h), 0)
@@ -1519,6 +1608,9 @@ class GaugeGenerator:
         if threshold is None:
             threshold = self.black_threshold
 
+        if self.use_kernels:
+            return _kernels.scale_black_mask_vertical(source, target_height, threshold)
+
         src_w, src_h = source.size
         source_mask = self._build_black_mask(source, threshold=threshold)
         target_mask = Image.new('L', (src_w, target_height), 0)
@@ -1562,6 +1654,8 @@ class GaugeGenerator:
         mw, mh = black_mask.size
         if tw != mw or th != mh:
             return target
+        if self.use_kernels:
+            return _kernels.apply_black_mask_overlay(target, black_mask)
 
         t_px = target.load()
         m_px = black_mask.load()
@@ -1640,6 +1734,87 @@ class GaugeGenerator:
         canvas.save(str(debug_file), format='TGA')
         print(f"    Debug: {debug_name}")
     
+    def task_files(self, kind, width):
+        """Source and output files for one generation task.
+
+        Args:
+            kind: "tall" (120t base), "wide", or "tall_variant"
+            width: Target width in pixels (ignored for "tall")
+
+        Returns:
+            (sources, outputs) lists of Paths, or None if no source gauge exists
+        """
+        base_name = self.extract_base_name()
+        if not base_name:
+            return None
+        if kind == "tall_variant":
+            sources = [
+                self.variant_dir / self.get_output_filename(base_name, 120, is_tall=True),
+                self.variant_dir / self.get_composite_filename(base_name, 120, is_tall=True),
+            ]
+            outputs = [self.variant_dir / self.get_output_filename(base_name, width, is_tall=True)]
+            if sources[1].exists():
+                outputs.append(self.variant_dir / self.get_composite_filename(base_name, width, is_tall=True))
+            return sources, outputs
+
+        source = self.get_source_file()
+        if not source:
+            return None
+        # Fix TGA if needed (before hashing, so a hit still repairs the source)
+        self.fix_tga_file(source)
+        if kind == "tall":
+            width = 120
+        is_tall = kind == "tall"
+        outputs = [
+            self.variant_dir / self.get_output_filename(base_name, width, is_tall=is_tall),
+            self.variant_dir / self.get_composite_filename(base_name, width, is_tall=is_tall),
+        ]
+        return [source], outputs
+
+    def run_task(self, kind, width):
+        """Run one generation task, skipping it if its outputs are up to date.
+
+        Args:
+            kind: "tall" (120t base), "wide", or "tall_variant"
+            width: Target width in pixels (ignored for "tall")
+
+        Returns:
+            True if successful, False otherwise
+        """
+        files = self.task_files(kind, width)
+        digest = None
+        if files:
+            sources, outputs = files
+            cache_config = {
+                "config": self.config,
+                "black_mask_thin": self.black_mask_thin,
+                "black_threshold": self.black_threshold,
+            }
+            digest = self.cache.digest(sources=sources, config=cache_config, key=f"{kind}:{width}")
+            if self.cache.is_fresh(outputs, digest):
+                size_class = "wide" if kind == "wide" else "tall"
+                self.stats["generated"][size_class].append(outputs[0].name)
+                print(f"  Up to date: {', '.join(out.name for out in outputs)}")
+                return True
+
+        if kind == "tall":
+            ok = self.generate_tall_gauge()
+        elif kind == "wide":
+            ok = self.generate_wide_gauge(width)
+        else:
+            ok = self.generate_tall_variant(width)
+
+        if ok and digest:
+            self.cache.record(files[1], digest)
+        return ok
+
+    def merge_task_stats(self, generated, cache_export=None):
+        """Append a task's generated filenames and cache entries to this generator."""
+        for size_class in ("wide", "tall"):
+            self.stats["generated"][size_class].extend(generated.get(size_class, []))
+        if cache_export:
+            self.cache.merge(cache_export)
+
     def save_stats(self):
         """Save generation statistics to JSON file."""
         base_name = self.extract_base_name()
@@ -1647,17 +1822,140 @@ class GaugeGenerator:
             return False
         
         stats_file = self.variant_dir / ".regen_gauges-stats.json"
+        self.cache.save()
+        self.stats["cache"] = self.cache.summary()
         
         try:
             with open(stats_file, 'w') as f:
                 json.dump(self.stats, f, indent=2)
             print(f"  Saved stats: {stats_file.name}")
+            if self.cache.enabled:
+                print(f"  Build cache: {self.cache.hits} hit(s), {self.cache.misses} miss(es)")
             return True
         except Exception as e:
             print(f"  WARNING: Failed to save stats: {e}")
             return False
 
 
+def plan_gauge_tasks():
+    """Ordered (kind, width) tasks for one variant, matching the serial run order.
+
+    The 120t base comes first because tall variants are scaled from its
+    output files; wide gauges only depend on the source.
+    """
+    tasks = [("tall", 120)]
+    tasks.extend(("wide", width) for width in WIDE_WIDTHS)
+    tasks.extend(("tall_variant", width) for width in TALL_WIDTHS if width != 120)
+    return tasks
+
+
+def _announce_task(kind, width):
+    """Print the line generate_variant() shows before a task (only the base wide gauge has one)."""
+    if kind == "wide" and width == 120:
+        # Base wide is generated as part of standard tall generation
+        print(f"  Generating wide gauge @ {width}px (base)...")
+
+
+def _run_gauge_task(variant_path, kind, width, generator_kwargs):
+    """Process-pool worker: run a single (variant, kind, width) task.
+
+    Returns (ok, log, generated, cache_export) where log is the task's
+    captured console output, generated is its stats["generated"] entries and
+    cache_export carries its build-cache entries back to the parent (the only
+    process that writes .regen_gauges-cache.json).
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator = GaugeGenerator(variant_path, **generator_kwargs)
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        _announce_task(kind, width)
+        ok = generator.run_task(kind, width)
+    return ok, log.getvalue(), generator.stats["generated"], generator.cache.export()
+
+
+def _fix_variant_source(variant_path, generator_kwargs):
+    """Repair a mislabeled PNG source once, before any task of the variant runs.
+
+    Tasks would otherwise each call fix_tga_file() on the same source at
+    the same time. Returns the captured console output (the "Fixed:" line,
+    which a serial run prints as part of the 120t task).
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator = GaugeGenerator(variant_path, **generator_kwargs)
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        source = generator.get_source_file() if generator.extract_base_name() else None
+        if source:
+            generator.fix_tga_file(source)
+    return log.getvalue()
+
+
+def run_variants_parallel(variants, generator_kwargs, jobs):
+    """Generate all variants with a process pool.
+
+    Fans out (variant, kind, width) tasks. Each variant's source is repaired
+    in this process first, then its 120t task starts; its wide and tall
+    variants are queued once the 120t task succeeds, so a failed base writes
+    nothing else (as in a serial run). Logs and stats are merged in
+    plan_gauge_tasks() order, so output and .regen_gauges-stats.json match
+    a serial run.
+
+    Args:
+        variants: List of (variant_name, variant_path) to process
+        generator_kwargs: Keyword arguments for GaugeGenerator
+        jobs: Worker process count
+
+    Returns:
+        List of (variant_name, variant_path, generator) that succeeded
+    """
+    plan = plan_gauge_tasks()
+    results = {}  # (variant_index, kind, width) -> (ok, log, generated, cache_export)
+
+    fix_logs = [_fix_variant_source(variant_path, generator_kwargs) for _, variant_path in variants]
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = {}
+        for idx, (_, variant_path) in enumerate(variants):
+            future = pool.submit(_run_gauge_task, variant_path, "tall", 120, generator_kwargs)
+            pending[future] = (idx, "tall", 120)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = pending.pop(future)
+                results[key] = future.result()
+                idx, kind, _ = key
+                if kind != "tall":
+                    continue
+                ok, log, generated, cache_export = results[key]
+                results[key] = (ok, fix_logs[idx] + log, generated, cache_export)
+                if ok:
+                    variant_path = variants[idx][1]
+                    for follow_kind, follow_width in plan[1:]:
+                        follow = pool.submit(_run_gauge_task, variant_path, follow_kind, follow_width, generator_kwargs)
+                        pending[follow] = (idx, follow_kind, follow_width)
+
+    regenerated = []
+    for idx, (variant, variant_path) in enumerate(variants):
+        print(f"Processing {variant}...")
+        generator = GaugeGenerator(variant_path, **generator_kwargs)
+        if not results[(idx, "tall", 120)][0]:
+            print(results[(idx, "tall", 120)][1], end="")
+            print("  ERROR: Failed to generate tall gauge")
+            continue
+        for kind, width in plan:
+            key = (idx, kind, width)
+            if key not in results:
+                continue
+            _, log, generated, cache_export = results[key]
+            print(log, end="")
+            generator.merge_task_stats(generated, cache_export)
+        regenerated.append((variant, variant_path, generator))
+        generator.save_stats()
+        print()
+    return regenerated
+
+
 def cleanup_orphaned_gauges(search_dirs):
     """Remove gauge .tga files whose size suffix is not in WIDE_WIDTHS or TALL_WIDTHS.
 
@@ -1671,8 +1969,6 @@ def cleanup_orphaned_gauges(search_dirs):
     Returns:
         Number of files removed.
     """
-    import re
-
     # Build the set of valid size markers from current config
     valid_markers = set()
     for w in WIDE_WIDTHS:
@@ -1681,10 +1977,6 @@ def cleanup_orphaned_gauges(search_dirs):
         valid_markers.add(f'{w}t')
         valid_markers.add(str(w))
 
-    # Pattern: gauge_inlay<SIZE_MARKER>_thorne0X.tga
-    # SIZE_MARKER is digits optionally followed by 't' (e.g. 120, 105t, 250t)
-    marker_re = re.compile(r'^gauge_inlay(\d+t?)_thorne\d+\.tga$', re.IGNORECASE)
-
     removed = 0
     for search_dir in search_dirs:
         if not search_dir.exists():
@@ -1692,7 +1984,7 @@ def cleanup_orphaned_gauges(search_dirs):
         for f in sorted(search_dir.glob('gauge_inlay*_thorne*.tga')):
             if f.name.endswith('_debug.tga'):
                 continue
-            m = marker_re.match(f.name)
+            m = SIZED_GAUGE_RE.match(f.name)
             if not m:
                 # No size marker → base file, skip
                 continue
@@ -1704,6 +1996,150 @@ def cleanup_orphaned_gauges(search_dirs):
     return removed
 
 
+def generate_variant(variant, variant_path, generator_kwargs):
+    """Generate one variant serially in this process (plan_gauge_tasks() order).
+
+    Returns:
+        The GaugeGenerator (stats saved), or None if the base tall gauge failed
+    """
+    print(f"Processing {variant}...")
+    generator = GaugeGenerator(variant_path, **generator_kwargs)
+    
+    # Generate base tall gauge
+    if not generator.run_task("tall", 120):
+        print(f"  ERROR: Failed to generate tall gauge")
+        return None
+    
+    # Generate wide variants
+    for width in WIDE_WIDTHS:
+        _announce_task("wide", width)
+        generator.run_task("wide", width)
+    
+    # Generate tall variants (skip 120, which is the base)
+    for width in TALL_WIDTHS:
+        if width != 120:
+            generator.run_task("tall_variant", width)
+    
+    # Save stats
+    generator.save_stats()
+    print()
+    return generator
+
+
+def copy_back(variants_to_copy, root_path, base_path):
+    """Copy regenerated gauges to thorne_drak/, deploy to thorne_dev/, remove orphans.
+
+    Files whose content is already at the destination are skipped (deploy.py).
+
+    Args:
+        variants_to_copy: List of (variant_name, variant_path, generator)
+        root_path: thorne_drak/ directory
+        base_path: thorne_drak/Options/Gauges/ directory
+    """
+    print(f"{'='*70}")
+    print(f"Copying regenerated files back to thorne_drak/...")
+    print(f"{'='*70}")
+    
+    deployer = deploy.Deployer()
+    for variant_name, variant_path, generator in variants_to_copy:
+        base_name = generator.extract_base_name()
+        if not base_name:
+            continue
+
+        # Copy full gauge asset set from selected variant directory.
+        # This includes generated sizes AND the base source gauge file
+        # (e.g., gauge_inlay_thorne01.tga), which is needed by standard gauges.
+        files_to_copy = sorted([f.name for f in variant_path.glob('gauge*.tga') if not f.name.endswith('_debug.tga')])
+        
+        for filename in files_to_copy:
+            src = variant_path / filename
+            dst = root_path / filename
+            
+            if src.exists() and deployer.deploy(src, dst) != "unchanged":
+                print(f"  Copied {filename}")
+    deployer.save()
+    print(f"  {deployer.summary()}")
+    
+    # Deploy to thorne_dev
+    thorne_dev_path = deploy.dev_path()
+    if thorne_dev_path.exists():
+        print(f"\n{'='*70}")
+        print(f"Deploying to thorne_dev for testing...")
+        print(f"{'='*70}")
+        
+        deployer = deploy.Deployer()
+        for variant_name, variant_path, generator in variants_to_copy:
+            base_name = generator.extract_base_name()
+            if not base_name:
+                continue
+
+            # Deploy full gauge asset set from root_path (already copied above).
+            files_to_deploy = sorted([f.name for f in variant_path.glob('gauge*.tga') if not f.name.endswith('_debug.tga')])
+            
+            for filename in files_to_deploy:
+                src = root_path / filename
+                dst = thorne_dev_path / filename
+                
+                if src.exists() and deployer.deploy(src, dst) != "unchanged":
+                    print(f"  Deployed {filename}")
+        deployer.save()
+        print(f"  {deployer.summary()}")
+    
+    # --- Orphan cleanup: remove gauge .tga files for widths no longer in config ---
+    cleanup_dirs = [root_path]
+    if base_path.exists():
+        cleanup_dirs.extend([d for d in base_path.iterdir() if d.is_dir()])
+    if thorne_dev_path.exists():
+        cleanup_dirs.append(thorne_dev_path)
+    
+    orphans_removed = cleanup_orphaned_gauges(cleanup_dirs)
+    if orphans_removed:
+        print(f"\n{'='*70}")
+        print(f"CLEANUP: Removed {orphans_removed} orphaned gauge file(s)")
+        print(f"{'='*70}")
+
+
+def watch_variants(variants, generator_kwargs, copy_names, root_path, base_path):
+    """--watch: regenerate a variant in-process whenever its sources change.
+
+    Only each variant's .regen_gauges.json and base gauge_inlay*_thorne0X.tga
+    are watched (never the generated sizes), and a change rebuilds just that
+    variant. Decoded sources stay in imagecache's in-process LRU between
+    rebuilds and the build cache skips tasks whose inputs are unchanged.
+
+    Args:
+        variants: List of (variant_name, variant_path) to watch
+        generator_kwargs: Keyword arguments for GaugeGenerator
+        copy_names: Variant names whose rebuilds are copied back (same rule
+                    as the initial run: single variant, else Thorne only)
+        root_path: thorne_drak/ directory
+        base_path: thorne_drak/Options/Gauges/ directory
+    """
+    by_dir = {path.resolve(): (name, path) for name, path in variants}
+
+    def sources():
+        files = []
+        for _, variant_path in variants:
+            files.append(variant_path / ".regen_gauges.json")
+            files.extend(
+                f for f in variant_path.glob('gauge_inlay*_thorne*.tga')
+                if not SIZED_GAUGE_RE.match(f.name) and not f.name.endswith('_debug.tga')
+            )
+        return files
+
+    def rebuild(changed):
+        to_copy = []
+        for variant_dir in sorted({path.parent.resolve() for path in changed}):
+            variant, variant_path = by_dir[variant_dir]
+            generator = generate_variant(variant, variant_path, generator_kwargs)
+            if generator and variant in copy_names:
+                to_copy.append((variant, variant_path, generator))
+        if to_copy:
+            copy_back(to_copy, root_path, base_path)
+
+    return watch.watch(sources, rebuild, label="regen_gauges", root=root_path.parent)
+
+
 def main():
     """Main entry point."""
     import argparse
@@ -1742,6 +2178,9 @@ FEATURES:
     [*] Smart copyback (single->thorne_drak, multi->Thorne only)
     [*] Automatic deployment to thorne_dev/
     [*] Stats JSON generation
+    [*] Parallel (variant, width) tasks with --jobs N
+    [*] Content-hash build cache (.regen_gauges-cache.json, --force to bypass)
+    [*] --watch: poll sources, rebuild only the edited variant in-process
 
 WORKFLOW:
     1. Edit source: thorne_drak/Options/Gauges/Thorne/gauge_inlay_thorne01.tga
@@ -1749,6 +2188,9 @@ WORKFLOW:
     3. Run: python regen_gauges.py --all  (or specify: Thorne)
     4. Test: /loadskin thorne_drak
 
+    Iterating on one gauge: python regen_gauges.py Thorne --watch
+    rebuilds Thorne (and copies it back) each time the source or config is saved.
+
 SIZE CONFIGURATION:
     To add new widths, edit WIDE_WIDTHS and TALL_WIDTHS at top of script.
         """,
@@ -1792,6 +2234,31 @@ SIZE CONFIGURATION:
         help="Emit *_debug.tga 255x255 stacked stage visualizations"
     )
 
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Worker processes for (variant, width) tasks (default: 1 serial, 0 = all cores)"
+    )
+
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every output even if the build cache says it is up to date"
+    )
+
+    parser.add_argument(
+        "--no-numpy",
+        action="store_true",
+        help="Use the per-pixel reference loops instead of the NumPy kernels (slow; for verification)"
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After the build, keep polling sources and regenerate changed variants in-process (Ctrl+C to stop)"
+    )
+
     args = parser.parse_args()
 
     # If no arguments provided, show usage
@@ -1822,7 +2289,7 @@ SIZE CONFIGURATION:
 
     # If debug mode is off, proactively remove stale debug artifacts.
     if not args.debug:
-        thorne_dev_path = Path('C:\\TAKP\\uifiles\\thorne_dev')
+        thorne_dev_path = deploy.dev_path()
         cleanup_targets = []
         if base_path.exists():
             cleanup_targets.extend([d for d in base_path.iterdir() if d.is_dir()])
@@ -1850,51 +2317,34 @@ SIZE CONFIGURATION:
     print(f"{'='*70}")
     print(f"Wide variants: {WIDE_WIDTHS}")
     print(f"Tall variants: {TALL_WIDTHS}")
+    print(f"Pixel kernels: {'NumPy' if _kernels is not None and not args.no_numpy else 'per-pixel loops'}")
     print(f"{'='*70}\n")
     
     regenerated_variants = []
-    
+    generator_kwargs = {
+        "black_mask_thin": args.black_mask_thin,
+        "debug": args.debug,
+        "black_threshold": args.black_threshold,
+        "use_kernels": not args.no_numpy,
+        "use_cache": not args.force,
+    }
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    found_variants = []
     for variant in variant_names:
-        if variant.lower() == 'root':
-            variant_path = root_path
-        else:
-            variant_path = base_path / variant
-        
+        variant_path = root_path if variant.lower() == 'root' else base_path / variant
         if variant_path.exists():
-            print(f"Processing {variant}...")
-            generator = GaugeGenerator(
-                variant_path,
-                black_mask_thin=args.black_mask_thin,
-                debug=args.debug,
-                black_threshold=args.black_threshold,
-            )
-            
-            # Generate base tall gauge
-            if generator.generate_tall_gauge():
-                regenerated_variants.append((variant, variant_path, generator))
-            else:
-                print(f"  ERROR: Failed to generate tall gauge")
-                continue
-            
-            # Generate wide variants
-            for width in WIDE_WIDTHS:
-                if width == 120:
-                    # Base wide is generated as part of standard tall generation
-                    print(f"  Generating wide gauge @ {width}px (base)...")
-                    generator.generate_wide_gauge(width)
-                else:
-                    generator.generate_wide_gauge(width)
-            
-            # Generate tall variants (skip 120, which is the base)
-            for width in TALL_WIDTHS:
-                if width != 120:
-                    generator.generate_tall_variant(width)
-            
-            # Save stats
-            generator.save_stats()
-            print()
+            found_variants.append((variant, variant_path))
         else:
             print(f"ERROR: {variant_path} not found\n")
+
+    if jobs > 1:
+        regenerated_variants = run_variants_parallel(found_variants, generator_kwargs, jobs)
+    else:
+        for variant, variant_path in found_variants:
+            generator = generate_variant(variant, variant_path, generator_kwargs)
+            if generator:
+                regenerated_variants.append((variant, variant_path, generator))
     
     # Copy regenerated files back to thorne_drak root
     # Logic: single variant → copy all; multiple variants → copy only Thorne
@@ -1906,63 +2356,7 @@ SIZE CONFIGURATION:
         variants_to_copy = [(name, path, gen) for name, path, gen in regenerated_variants if name.lower() == 'thorne']
     
     if variants_to_copy:
-        print(f"{'='*70}")
-        print(f"Copying regenerated files back to thorne_drak/...")
-        print(f"{'='*70}")
-        
-        for variant_name, variant_path, generator in variants_to_copy:
-            base_name = generator.extract_base_name()
-            if not base_name:
-                continue
-
-            # Copy full gauge asset set from selected variant directory.
-            # This includes generated sizes AND the base source gauge file
-            # (e.g., gauge_inlay_thorne01.tga), which is needed by standard gauges.
-            files_to_copy = sorted([f.name for f in variant_path.glob('gauge*.tga') if not f.name.endswith('_debug.tga')])
-            
-            for filename in files_to_copy:
-                src = variant_path / filename
-                dst = root_path / filename
-                
-                if src.exists():
-                    shutil.copy2(src, dst)
-                    print(f"  Copied {filename}")
-        
-        # Deploy to thorne_dev
-        thorne_dev_path = Path('C:\\TAKP\\uifiles\\thorne_dev')
-        if thorne_dev_path.exists():
-            print(f"\n{'='*70}")
-            print(f"Deploying to thorne_dev for testing...")
-            print(f"{'='*70}")
-            
-            for variant_name, variant_path, generator in variants_to_copy:
-                base_name = generator.extract_base_name()
-                if not base_name:
-                    continue
-
-                # Deploy full gauge asset set from root_path (already copied above).
-                files_to_deploy = sorted([f.name for f in variant_path.glob('gauge*.tga') if not f.name.endswith('_debug.tga')])
-                
-                for filename in files_to_deploy:
-                    src = root_path / filename
-                    dst = thorne_dev_path / filename
-                    
-                    if src.exists():
-                        shutil.copy2(src, dst)
-                        print(f"  Deployed {filename}")
-        
-        # --- Orphan cleanup: remove gauge .tga files for widths no longer in config ---
-        cleanup_dirs = [root_path]
-        if base_path.exists():
-            cleanup_dirs.extend([d for d in base_path.iterdir() if d.is_dir()])
-        if thorne_dev_path.exists():
-            cleanup_dirs.append(thorne_dev_path)
-        
-        orphans_removed = cleanup_orphaned_gauges(cleanup_dirs)
-        if orphans_removed:
-            print(f"\n{'='*70}")
-            print(f"CLEANUP: Removed {orphans_removed} orphaned gauge file(s)")
-            print(f"{'='*70}")
+        copy_back(variants_to_copy, root_path, base_path)
         
         print(f"\n{'='*70}")
         print(f"SUMMARY: {len(regenerated_variants)} variant(s) regenerated successfully")
@@ -1975,6 +2369,10 @@ SIZE CONFIGURATION:
             print(f"(Multiple variants regenerated - only Thorne variant would be copied)")
         print(f"{'='*70}")
     
+    if args.watch:
+        copy_names = {name for name, _, _ in variants_to_copy}
+        sys.exit(watch_variants(found_variants, generator_kwargs, copy_names, root_path, base_path))
+    
     sys.exit(0)
 
 
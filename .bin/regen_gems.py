@@ -10,6 +10,7 @@ Features:
         - Default: transparent 1px border (22×22 icon inset at 1,1)
   - Scales to spell_icons_thorneXX.tga (22×22 icons, 10 rows × 10 columns) - clean, no borders
   - Auto-regenerates stat_icons_thorne01.tga from new spell_icons_thorne
+    (in-process via regen_icons, reusing the atlases rendered here)
     - Optional --border mode for gemicons ONLY: transparent (default), black, blend
   - High-quality LANCZOS resampling + SHARPEN filter
   - Supports all icon variants (Classic, Duxa, Infiniti, Steamworks, Thorne, WoW)
@@ -33,11 +34,21 @@ EXAMPLES:
 
 import sys
 import json
-import subprocess
-import shutil
 from pathlib import Path
 from PIL import Image, ImageFilter
 
+import buildcache
+import deploy
+import imagecache
+import regen_icons
+
+# Build cache version: any edit to this script invalidates its outputs
+SCRIPT_VERSION = buildcache.script_version(__file__, Path(__file__).with_name("imagecache.py"))
+
+# Files copied back to thorne_drak/ (and thorne_dev/) for the deployed variant
+COPYBACK_FILES = [f"{prefix}{i:02d}.tga" for i in range(1, 4) for prefix in ("gemicons", "spell_icons_thorne")]
+COPYBACK_FILES.append("stat_icons_thorne01.tga")
+
 
 class GemIconGenerator:
     """Generate gemicons and tinyicons from spell icon sources."""
@@ -60,13 +71,15 @@ class GemIconGenerator:
     # Output image size
     OUTPUT_SIZE = 256
     
-    def __init__(self, variant_dir, border_mode="transparent"):
+    def __init__(self, variant_dir, border_mode="transparent", use_cache=True):
         """
         Initialize the generator.
         
         Args:
             variant_dir: Path to icon variant directory (e.g., thorne_drak/Options/Icons/Thorne)
             border_mode: transparent (default), black, or blend
+            use_cache: If True, skip output files that are up to date in
+                       .regen_gems-cache.json
         """
         self.variant_dir = Path(variant_dir)
         self.variant_name = self.variant_dir.name
@@ -79,6 +92,10 @@ class GemIconGenerator:
             "icons_scaled": 0,
             "border_mode": border_mode
         }
+        # spell_icons_thorne atlases rendered this run (file name -> image),
+        # handed to the staticon pass instead of re-decoding the files
+        self.spell_icon_images = {}
+        self.cache = buildcache.BuildCache(self.variant_dir, "regen_gems", SCRIPT_VERSION, enabled=use_cache)
     
     def _calculate_spell_positions(self):
         """Calculate icon positions in spell files (6×6 grid, 40×40 icons)."""
@@ -120,7 +137,7 @@ class GemIconGenerator:
         positions = self._calculate_spell_positions()
         
         try:
-            img = Image.open(spell_file).convert("RGBA")
+            img = imagecache.load_rgba(spell_file, shared=True)
             
             for x, y in positions:
                 icon = img.crop((x, y, x + self.SPELL_ICON_SIZE, y + self.SPELL_ICON_SIZE))
@@ -223,15 +240,33 @@ class GemIconGenerator:
         
         # Save
         output_img.save(output_path, format="TGA")
+        return output_img
     
-    def _group_icons_for_output(self, all_icons, icons_per_file):
-        """Group icons into chunks for output files."""
-        grouped = []
-        for i in range(0, len(all_icons), icons_per_file):
-            chunk = all_icons[i:i + icons_per_file]
-            grouped.append(chunk)
-        return grouped
-    
+    def _plan_outputs(self, spell_files, prefix, icons_per_file):
+        """Plan output files for one icon size.
+
+        Icons are numbered across spell files in order (36 per file), so each
+        output file depends only on the spell files its icon range spans.
+
+        Returns:
+            List of (output_path, first_icon, last_icon, spell_sources)
+        """
+        total = len(spell_files) * self.SPELL_ICONS_PER_FILE
+        plan = []
+        for i, first in enumerate(range(0, total, icons_per_file), start=1):
+            last = min(first + icons_per_file, total)
+            sources = spell_files[first // self.SPELL_ICONS_PER_FILE:(last - 1) // self.SPELL_ICONS_PER_FILE + 1]
+            plan.append((self.variant_dir / f"{prefix}{i:02d}.tga", first, last, sources))
+        return plan
+
+    def _plan_packed(self, all_icons, prefix, icons_per_file):
+        """Plan output files over an already-packed icon list (no cache sources)."""
+        plan = []
+        for i, first in enumerate(range(0, len(all_icons), icons_per_file), start=1):
+            last = min(first + icons_per_file, len(all_icons))
+            plan.append((self.variant_dir / f"{prefix}{i:02d}.tga", first, last, []))
+        return plan
+
     def generate(self):
         """Generate gemicons and tinyicons from spell sources."""
         print(f"\n{'='*70}")
@@ -245,89 +280,128 @@ class GemIconGenerator:
             return False
         
         print(f"  Found {len(spell_files)} spell files")
-        
-        # Extract all icons from all spell files
-        all_icons = []
-        for spell_file in spell_files:
+
+        # Plan every output and check it against the build cache before decoding
+        cache_config = {
+            "border_mode": self.border_mode,
+            "gem_icon_size": self.GEM_ICON_SIZE,
+            "small_icon_size": self.SMALL_ICON_SIZE,
+        }
+        gem_plan = self._plan_outputs(spell_files, "gemicons", self.GEM_ICONS_PER_FILE)
+        spell_plan = self._plan_outputs(spell_files, "spell_icons_thorne", self.SMALL_ICONS_PER_FILE)
+        digests = {}
+        stale = set()
+        for output_file, first, last, sources in gem_plan + spell_plan:
+            digests[output_file] = self.cache.digest(sources=sources, config=cache_config, key=output_file.name)
+            if not self.cache.is_fresh([output_file], digests[output_file]):
+                stale.add(output_file)
+
+        # Extract icons only from the spell files that feed a stale output
+        needed = set()
+        for output_file, first, last, sources in gem_plan + spell_plan:
+            if output_file in stale:
+                needed.update(spell_files.index(src) for src in sources)
+        icons_by_file = {}
+        for index, spell_file in enumerate(spell_files):
+            if index not in needed:
+                continue
             print(f"  Processing {spell_file.name}...")
             icons = self._extract_icons_from_spell(spell_file)
             if icons:
-                all_icons.extend(icons)
+                icons_by_file[index] = icons
                 self.stats["spell_files_processed"] += 1
-        
+
+        if len(icons_by_file) < len(needed):
+            # A spell file failed to load: icons after it shift up (original
+            # packing), so regenerate everything and leave the cache untouched.
+            all_icons = []
+            for index, spell_file in enumerate(spell_files):
+                all_icons.extend(icons_by_file.get(index) or self._extract_icons_from_spell(spell_file))
+            if not all_icons:
+                print("  ERROR: No icons extracted")
+                return False
+            gem_plan = self._plan_packed(all_icons, "gemicons", self.GEM_ICONS_PER_FILE)
+            spell_plan = self._plan_packed(all_icons, "spell_icons_thorne", self.SMALL_ICONS_PER_FILE)
+            stale = {output_file for output_file, _, _, _ in gem_plan + spell_plan}
+            digests = {}
+        else:
+            all_icons = [None] * (len(spell_files) * self.SPELL_ICONS_PER_FILE)
+            for index, icons in icons_by_file.items():
+                start = index * self.SPELL_ICONS_PER_FILE
+                all_icons[start:start + len(icons)] = icons
+
         total_icons = len(all_icons)
-        print(f"  Extracted {total_icons} icons total")
-        
-        if not all_icons:
-            print("  ERROR: No icons extracted")
-            return False
+        print(f"  Extracted {sum(len(icons) for icons in icons_by_file.values())} icons total")
         
         # Generate gemicons (24×24)
         border_msg = " with transparent border" if self.border_mode == "transparent" else f" with {self.border_mode} border"
         print(f"\n  Scaling to gemicons (24×24){border_msg}...")
-        gem_icons = [self._create_gem_icon(icon) for icon in all_icons]
-        gem_groups = self._group_icons_for_output(gem_icons, self.GEM_ICONS_PER_FILE)
-        
-        for i, icons in enumerate(gem_groups, start=1):
-            output_file = self.variant_dir / f"gemicons{i:02d}.tga"
-            self._create_output_file(icons, output_file, self.GEM_ICON_SIZE, self.GEM_GRID_SIZE)
-            print(f"    Created {output_file.name} ({len(icons)} icons)")
+        for output_file, first, last, _ in gem_plan:
+            if output_file in stale:
+                icons = [self._create_gem_icon(icon) for icon in all_icons[first:last]]
+                self._create_output_file(icons, output_file, self.GEM_ICON_SIZE, self.GEM_GRID_SIZE)
+                print(f"    Created {output_file.name} ({len(icons)} icons)")
+                if output_file in digests:
+                    self.cache.record([output_file], digests[output_file])
+            else:
+                print(f"    Up to date: {output_file.name}")
             self.stats["gemicon_files_created"] += 1
         
         # Generate spell_icons_thorne (22×22)
         print("\n  Scaling to spell_icons_thorne (22×22)...")
-        spell_icons = self._scale_icons(all_icons, self.SMALL_ICON_SIZE)
-        spell_groups = self._group_icons_for_output(spell_icons, self.SMALL_ICONS_PER_FILE)
-        
-        for i, icons in enumerate(spell_groups, start=1):
-            output_file = self.variant_dir / f"spell_icons_thorne{i:02d}.tga"
-            self._create_output_file(icons, output_file, self.SMALL_ICON_SIZE, self.SMALL_GRID_SIZE)
-            print(f"    Created {output_file.name} ({len(icons)} icons)")
+        for output_file, first, last, _ in spell_plan:
+            if output_file in stale:
+                icons = self._scale_icons(all_icons[first:last], self.SMALL_ICON_SIZE)
+                atlas = self._create_output_file(icons, output_file, self.SMALL_ICON_SIZE, self.SMALL_GRID_SIZE)
+                self.spell_icon_images[output_file.name] = atlas
+                imagecache.remember(output_file, atlas)
+                print(f"    Created {output_file.name} ({len(icons)} icons)")
+                if output_file in digests:
+                    self.cache.record([output_file], digests[output_file])
+            else:
+                print(f"    Up to date: {output_file.name}")
             self.stats["spellicon_files_created"] += 1
         
         self.stats["icons_scaled"] = total_icons
         
         # Save stats
+        self.cache.save()
+        self.stats["cache"] = self.cache.summary()
         stats_file = self.variant_dir / ".regen_gems-stats.json"
         with open(stats_file, 'w') as f:
             json.dump(self.stats, f, indent=2)
         
         print(f"\n  Statistics saved to {stats_file.name}")
+        print(f"  Build cache: {self.cache.hits} hit(s), {self.cache.misses} miss(es)")
         print(f"  [OK] Gemicons complete: {self.variant_name}")
         
         return True
     
-    def regenerate_staticons(self, script_dir):
-        """Regenerate staticons from the newly created gemicons."""
+    def regenerate_staticons(self, icon_config, force=False):
+        """Regenerate staticons from the newly created spell_icons_thorne.
+
+        Runs regen_icons in-process with the shared config and the atlases
+        rendered by generate(), so nothing is re-read or re-decoded.
+        """
         print(f"\n  Regenerating staticons for {self.variant_name}...")
         
-        regen_icons_script = script_dir / "regen_icons.py"
-        if not regen_icons_script.exists():
-            print(f"  WARNING: {regen_icons_script.name} not found, skipping staticons")
+        if icon_config is None:
+            print(f"  WARNING: {regen_icons.CONFIG_PATH.name} not loaded, skipping staticons")
             return False
         
-        try:
-            result = subprocess.run(
-                [sys.executable, str(regen_icons_script), self.variant_name],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if result.returncode == 0:
-                print(f"  [OK] Staticons complete: {self.variant_name}")
-                return True
-            else:
-                print("  ERROR: Staticon generation failed")
-                if result.stderr:
-                    print(f"  {result.stderr}")
-                return False
-        except subprocess.TimeoutExpired:
-            print("  ERROR: Staticon generation timed out")
-            return False
-        except Exception as e:
-            print(f"  ERROR: Failed to run staticon generation: {e}")
-            return False
+        success, _, _ = regen_icons.regenerate_icons(
+            self.variant_dir,
+            regen_icons.CONFIG_PATH,
+            self.variant_dir.parents[2],
+            use_cache=not force,
+            config=icon_config,
+            images=self.spell_icon_images,
+        )
+        if success:
+            print(f"  [OK] Staticons complete: {self.variant_name}")
+        else:
+            print("  ERROR: Staticon generation failed")
+        return success
 
 
 def discover_variants(base_dir):
@@ -389,6 +463,12 @@ Examples:
         help="Gemicon border mode: transparent (default), black, blend. Use --border for blend."
     )
 
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every output even if the build cache says it is up to date"
+    )
+
     args = parser.parse_args()
     
     # If no arguments provided, show usage
@@ -400,6 +480,20 @@ Examples:
         print("  python regen_gems.py Thorne --border      # With border mode")
         print("\nFor help: python regen_gems.py --help")
         return 1
+
+    script_dir = Path(__file__).parent
+    base_dir = script_dir.parent
+
+    # Stat icon config is read once and shared by every variant's staticon pass
+    icon_config = None
+    try:
+        with open(regen_icons.CONFIG_PATH, "r") as f:
+            icon_config = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"WARNING: Could not load {regen_icons.CONFIG_PATH.name}: {e}")
+
+    if args.all:
+        variants = discover_variants(base_dir)
         print(f"Auto-discovered {len(variants)} variants: {', '.join(variants)}")
     elif args.variants:
         variants = args.variants
@@ -419,10 +513,10 @@ Examples:
             print(f"\nERROR: Variant directory not found: {variant_dir}")
             continue
         
-        generator = GemIconGenerator(variant_dir, border_mode=args.border)
+        generator = GemIconGenerator(variant_dir, border_mode=args.border, use_cache=not args.force)
         if generator.generate():
             # Also regenerate staticons from the new gemicons
-            generator.regenerate_staticons(script_dir)
+            generator.regenerate_staticons(icon_config, force=args.force)
             success_count += 1
             regenerated_variants.append((variant, variant_dir))
     
@@ -444,37 +538,31 @@ Examples:
         print(f"\n{'='*70}")
         print("Copying regenerated files back to thorne_drak/...")
         print(f"{'='*70}")
+        deployer = deploy.Deployer()
         for variant_name, variant_path in variants_to_copy:
-            # Copy gemicons and spell_icons_thorne only
-            for i in range(1, 4):
-                src = variant_path / f"gemicons{i:02d}.tga"
-                dst = root_path / f"gemicons{i:02d}.tga"
+            for name in COPYBACK_FILES:
+                src = variant_path / name
                 if src.exists():
-                    shutil.copy2(src, dst)
-                src = variant_path / f"spell_icons_thorne{i:02d}.tga"
-                dst = root_path / f"spell_icons_thorne{i:02d}.tga"
-                if src.exists():
-                    shutil.copy2(src, dst)
-            print(f"  Copied {variant_name} gemicons/spell_icons_thorne to thorne_drak/")
+                    deployer.deploy(src, root_path / name)
+            print(f"  Copied {variant_name} gemicons/spell_icons_thorne/stat_icons to thorne_drak/")
+        deployer.save()
+        print(f"  {deployer.summary()}")
     
     # Also copy to thorne_dev for immediate testing
-    thorne_dev_path = Path('C:\\TAKP\\uifiles\\thorne_dev')
+    thorne_dev_path = deploy.dev_path()
     if thorne_dev_path.exists() and variants_to_copy:
         print(f"\n{'='*70}")
         print("Deploying to thorne_dev for testing...")
         print(f"{'='*70}")
+        deployer = deploy.Deployer()
         for variant_name, variant_path in variants_to_copy:
-            # Copy gemicons and spell_icons_thorne only
-            for i in range(1, 4):
-                src = variant_path / f"gemicons{i:02d}.tga"
-                dst = thorne_dev_path / f"gemicons{i:02d}.tga"
-                if src.exists():
-                    shutil.copy2(src, dst)
-                src = variant_path / f"spell_icons_thorne{i:02d}.tga"
-                dst = thorne_dev_path / f"spell_icons_thorne{i:02d}.tga"
+            for name in COPYBACK_FILES:
+                src = variant_path / name
                 if src.exists():
-                    shutil.copy2(src, dst)
-            print(f"  Deployed {variant_name} gemicons/spell_icons_thorne to thorne_dev/")
+                    deployer.deploy(src, thorne_dev_path / name)
+            print(f"  Deployed {variant_name} gemicons/spell_icons_thorne/stat_icons to thorne_dev/")
+        deployer.save()
+        print(f"  {deployer.summary()}")
     
     # Summary
     print(f"\n{'='*70}")
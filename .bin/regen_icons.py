@@ -36,15 +36,29 @@ EXAMPLES:
     
     # With text labels next to icons (easier to identify during editing)
     python regen_icons.py Thorne --labels
+
+API:
+    regen_gems.py imports this module and calls regenerate_icons() in-process,
+    passing the loaded config and the spell_icons_thorne atlases it has just
+    rendered (images=), so nothing is re-read or re-decoded.
 """
 
 import os
 import sys
 import json
-import shutil
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 
+import buildcache
+import deploy
+import imagecache
+
+# Build cache version: any edit to this script invalidates its outputs
+SCRIPT_VERSION = buildcache.script_version(__file__, Path(__file__).with_name("imagecache.py"))
+
+# Icon coordinate config shared by the CLI and regen_gems.py
+CONFIG_PATH = Path(__file__).resolve().with_name("regen_icons.json")
+
 
 class StatIconGenerator:
     """Generate stat icon files."""
@@ -78,7 +92,8 @@ class StatIconGenerator:
         "STR": "STR", "INT": "INT", "WIS": "WIS", "AGI": "AGI", "DEX": "DEX", "CHA": "CHA",
     }
     
-    def __init__(self, source_dir, config_path, output_file, add_labels=True):
+    def __init__(self, source_dir, config_path, output_file, add_labels=True, use_cache=True,
+                 config=None, images=None):
         """
         Initialize the generator.
         
@@ -87,13 +102,22 @@ class StatIconGenerator:
             config_path: Path to JSON config file with icon coordinate mappings (source from spell_icons_thorne)
             output_file: Output path for staticons texture file
             add_labels: Whether to add text labels next to icons (default: True)
+            use_cache: If True, skip generation when the output is up to date
+                       in .regen_icons-cache.json
+            config: Already-loaded config dict (config_path is then not read)
+            images: Already-decoded RGBA source images by file name (e.g. the
+                    spell_icons_thorne atlases regen_gems just rendered); other
+                    source files are loaded through imagecache
         """
         self.source_dir = Path(source_dir)
         self.output_file = Path(output_file)
         self.add_labels = add_labels
-        self.config = None
+        self.images = dict(images or {})
+        self.config = config
         self.font = None
         self.label_font = None
+        self.label_font_path = None
+        self.cache = buildcache.BuildCache(self.output_file.parent, "regen_icons", SCRIPT_VERSION, enabled=use_cache)
         self.stats = {
             "file": str(output_file),
             "source_dir": str(source_dir),
@@ -101,7 +125,7 @@ class StatIconGenerator:
         }
         
         # Load config
-        if not self._load_config(config_path):
+        if self.config is None and not self._load_config(config_path):
             raise ValueError(f"Failed to load config: {config_path}")
         
         # Load fonts if needed
@@ -141,6 +165,7 @@ class StatIconGenerator:
             if os.path.exists(font_path):
                 try:
                     self.label_font = ImageFont.truetype(font_path, 9)
+                    self.label_font_path = font_path
                     is_bold = "bold" in font_path.lower() or "bd" in font_path.lower()
                     font_type = "Bold" if is_bold else "Regular"
                     return True
@@ -193,13 +218,15 @@ class StatIconGenerator:
         """
         try:
             full_path = self.source_dir / source_file
+            source_img = self.images.get(source_file)
             
-            if not full_path.exists():
+            if source_img is None and not full_path.exists():
                 print(f"  WARNING: File not found: {source_file}")
                 return self._create_placeholder(target_size)
             
-            # Load and extract
-            source_img = Image.open(full_path).convert("RGBA")
+            # Load (decoded once per source file) and extract
+            if source_img is None:
+                source_img = imagecache.load_rgba(full_path, shared=True)
             icon = source_img.crop((x, y, x + w, y + h))
             
             # Resize if needed
@@ -217,6 +244,22 @@ class StatIconGenerator:
         print(f"GENERATING: {self.output_file.name}")
         print(f"{'='*70}")
         
+        # Skip pixel work if the output was built from identical sources/config
+        source_files = sorted({
+            info["file"] for info in self.config.values()
+            if isinstance(info, dict) and info.get("file")
+        })
+        cache_config = {
+            "config": self.config,
+            "add_labels": self.add_labels,
+            "label_font": self.label_font_path if self.add_labels else None,
+        }
+        digest = self.cache.digest(
+            sources=[self.source_dir / name for name in source_files],
+            config=cache_config,
+        )
+        fresh = self.cache.is_fresh([self.output_file], digest)
+
         # Create blank 256x256 RGBA template
         output_img = Image.new("RGBA", (256, 256), (0, 0, 0, 0))
         
@@ -247,7 +290,7 @@ class StatIconGenerator:
                 src_h = source_info.get("h", 22)
                 
                 # Extract icon
-                icon = self._extract_icon(source_file, src_x, src_y, src_w, src_h)
+                icon = None if fresh else self._extract_icon(source_file, src_x, src_y, src_w, src_h)
                 
                 icon_type = "extracted"
                 source_info_display = f"{source_file} @ {coord_format}"
@@ -260,7 +303,8 @@ class StatIconGenerator:
                 print(f"  -- {icon_name:8} at ({x:3},{y:3}) PLACEHOLDER")
             
             # Paste into output
-            output_img.paste(icon, (x, y), icon)
+            if not fresh:
+                output_img.paste(icon, (x, y), icon)
             
             # Record stats
             self.stats["icons"][icon_name] = {
@@ -270,6 +314,10 @@ class StatIconGenerator:
                 "source": source_info_display
             }
         
+        if fresh:
+            print(f"\n[OK] Up to date: {self.output_file}")
+            return True
+
         # Create output directory if needed
         self.output_file.parent.mkdir(parents=True, exist_ok=True)
         
@@ -279,6 +327,7 @@ class StatIconGenerator:
         
         # Save output
         output_img.save(self.output_file)
+        self.cache.record([self.output_file], digest)
         print(f"\n[OK] Generated: {self.output_file}")
         
         if self.add_labels:
@@ -313,16 +362,21 @@ class StatIconGenerator:
             stats_file = ".regen_icons-stats.json"
         
         stats_path = self.output_file.parent / stats_file
+        self.cache.save()
+        self.stats["cache"] = self.cache.summary()
         
         try:
             with open(stats_path, 'w') as f:
                 json.dump(self.stats, f, indent=2)
             print(f"[OK] Saved stats: {stats_path}")
+            if self.cache.enabled:
+                print(f"[OK] Build cache: {self.cache.hits} hit(s), {self.cache.misses} miss(es)")
         except Exception as e:
             print(f"WARNING: Failed to save stats: {e}")
 
 
-def regenerate_icons(variant_dir, config_path, root_path, add_labels=True):
+def regenerate_icons(variant_dir, config_path, root_path, add_labels=True, use_cache=True,
+                     config=None, images=None):
     """Regenerate stat icons for a specific variant.
     
     Args:
@@ -330,6 +384,9 @@ def regenerate_icons(variant_dir, config_path, root_path, add_labels=True):
         config_path: Path to config JSON file
         root_path: Path to root thorne_drak directory
         add_labels: Whether to add text labels next to icons
+        use_cache: Whether to skip an output that is already up to date
+        config: Already-loaded config dict (see StatIconGenerator)
+        images: Already-decoded source images by file name (see StatIconGenerator)
     
     Returns:
         (success, variant_name, variant_dir) tuple
@@ -344,7 +401,10 @@ def regenerate_icons(variant_dir, config_path, root_path, add_labels=True):
             variant_dir,
             config_path,
             output_file,
-            add_labels=add_labels
+            add_labels=add_labels,
+            use_cache=use_cache,
+            config=config,
+            images=images,
         )
         
         if generator.generate():
@@ -368,7 +428,7 @@ if __name__ == '__main__':
     repo_root = script_dir.parent
     root_path = repo_root / 'thorne_drak'
     base_path = root_path / 'Options' / 'Icons'
-    config_path = script_dir / 'regen_icons.json'
+    config_path = CONFIG_PATH
     
     parser = argparse.ArgumentParser(
         description="Generate stat icon textures from icon variants",
@@ -394,6 +454,7 @@ FEATURES:
     [*] Smart copyback (single->thorne_drak/, multi->Thorne only)
     [*] Automatic deployment to thorne_dev/
     [*] Stats JSON generation
+    [*] Content-hash build cache (.regen_icons-cache.json, --force to bypass)
 
 WORKFLOW:
     1. Edit source icons: thorne_drak/Options/Icons/Thorne/gemicons*.tga
@@ -427,6 +488,12 @@ WORKFLOW:
         help="Disable text labels next to icons (default: labels ON)"
     )
 
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate even if the build cache says the output is up to date"
+    )
+
     args = parser.parse_args()
 
     # Validate required paths before processing variants.
@@ -475,7 +542,8 @@ WORKFLOW:
                     root_path,
                     config_path,
                     output_file,
-                    add_labels=add_labels
+                    add_labels=add_labels,
+                    use_cache=not args.force,
                 )
                 if generator.generate():
                     generator.save_stats()
@@ -491,6 +559,7 @@ WORKFLOW:
                     config_path,
                     root_path,
                     add_labels=add_labels,
+                    use_cache=not args.force,
                 )
                 if success:
                     success_count += 1
@@ -512,27 +581,31 @@ WORKFLOW:
         print(f"\n{'='*70}")
         print(f"Copying regenerated files back to thorne_drak/...")
         print(f"{'='*70}")
+        deployer = deploy.Deployer()
         for variant_name, variant_path in variants_to_copy:
             src = variant_path / 'stat_icons_thorne01.tga'
             dst = root_path / 'stat_icons_thorne01.tga'
             
             if src.exists():
-                shutil.copy2(src, dst)
-                print(f"  Copied {variant_name} stat icons to thorne_drak/")
+                action = deployer.deploy(src, dst)
+                print(f"  Copied {variant_name} stat icons to thorne_drak/ ({action})")
+        deployer.save()
     
     # Also copy to thorne_dev for immediate testing
-    thorne_dev_path = Path('C:\\TAKP\\uifiles\\thorne_dev')
+    thorne_dev_path = deploy.dev_path()
     if thorne_dev_path.exists() and variants_to_copy:
         print(f"\n{'='*70}")
         print(f"Deploying to thorne_dev for testing...")
         print(f"{'='*70}")
+        deployer = deploy.Deployer()
         for variant_name, variant_path in variants_to_copy:
             src = variant_path / 'stat_icons_thorne01.tga'
             dst = thorne_dev_path / 'stat_icons_thorne01.tga'
             
             if src.exists():
-                shutil.copy2(src, dst)
-                print(f"  Deployed {variant_name} stat icons to thorne_dev/")
+                action = deployer.deploy(src, dst)
+                print(f"  Deployed {variant_name} stat icons to thorne_dev/ ({action})")
+        deployer.save()
     
     # Summary
     print(f"\n{'='*70}")
@@ -19,18 +19,21 @@ Usage:
   python regen_slots.py Gold Silver Metal      # Multiple variants
     python regen_slots.py --all-combos           # All class/theme combos (.master/themes)
     python regen_slots.py --class Caster --theme Gold
+    python regen_slots.py --class Caster --watch  # Re-render on each source save
   python regen_slots.py --help                 # Show help
 
 Output (per variant):
   item_slots_thorne01.tga      -- Composited slot texture atlas
   .regen_slots-stats.json      -- Processing statistics
+  .regen_slots-cache.json      -- Build cache (atlas skipped when inputs are unchanged)
 """
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
-import shutil
 import sys
+from collections import OrderedDict
 from pathlib import Path
 
 try:
@@ -39,6 +42,16 @@ except ImportError:
     print("Error: Pillow is not installed. Install it with: pip install Pillow")
     sys.exit(1)
 
+import buildcache
+import deploy
+import imagecache
+import watch
+
+try:
+    import slot_kernels as _kernels
+except ImportError:  # NumPy not installed - per-pixel tint loop only
+    _kernels = None
+
 CONFIG_FILENAME = ".regen_slots.json"
 MASTER_CONFIG_PATH = (
     Path(__file__).resolve().parents[1]
@@ -47,6 +60,12 @@ MASTER_CONFIG_PATH = (
 )
 OUTPUT_FILENAME = "item_slots_thorne01.tga"
 STATS_FILENAME = ".regen_slots-stats.json"
+CACHE_NAME = "regen_slots"
+SCRIPT_VERSION = buildcache.script_version(
+    __file__, Path(__file__).with_name("slot_kernels.py"), Path(__file__).with_name("imagecache.py")
+)
+# Tinted + fitted tiles kept by SlotSourceCache (bounds long --watch sessions)
+TILE_CACHE_MAX_BYTES = 128 * 1024 * 1024
 
 
 # ---------------------------------------------------------------------------
@@ -60,7 +79,7 @@ def load_sources(directory: Path, source_files: list[str]) -> dict[str, Image.Im
         filepath = directory / filename
         if filepath.exists():
             try:
-                sources[filename] = Image.open(filepath).convert("RGBA")
+                sources[filename] = imagecache.load_rgba(filepath, shared=True)
             except Exception as e:
                 print(f"Warning: Could not load {filepath}: {e}")
     return sources
@@ -98,6 +117,9 @@ def tint_item_gradient(
       Optional midpoint color for 3-stop gradients (e.g., red/white/blue).
       When set, the gradient interpolates top->middle over the first half
       and middle->bottom over the second half.
+
+    This per-pixel loop is the reference implementation; slot_kernels.tint_gradient
+    is the byte-identical array version used by default.
     """
     rgba = item_tile.convert("RGBA")
     r_ch, _, _, a_ch = rgba.split()
@@ -164,11 +186,17 @@ def apply_item_gradient(
     top_color: tuple[int, int, int],
     bottom_color: tuple[int, int, int],
     middle_color: tuple[int, int, int] | None = None,
+    use_kernels: bool = True,
 ) -> Image.Image:
-    """Apply item coloration before compositing onto button."""
+    """Apply item coloration before compositing onto button.
+
+    With use_kernels (and NumPy available) the tint runs through the
+    byte-identical array kernel in slot_kernels.py instead of the loop.
+    """
     if gradient_type in ("none", "direct"):
         return item_tile.convert("RGBA")
-    return tint_item_gradient(
+    tint = _kernels.tint_gradient if use_kernels and _kernels is not None else tint_item_gradient
+    return tint(
         item_tile,
         top_color=top_color,
         bottom_color=bottom_color,
@@ -177,15 +205,12 @@ def apply_item_gradient(
     )
 
 
-def extract_cell(img: Image.Image, row: int, col: int, cell_width: int, cell_height: int) -> Image.Image:
-    """Extract a cell from a grid image. Indices are 0-based."""
-    # For now, use standard grid extraction
-    # Button grid may have custom spacing (2px separators), so coordinates come from config
-    return img.crop((col * cell_width, row * cell_height, col * cell_width + cell_width, row * cell_height + cell_height))
+def cell_box(row: int, col: int, cell_width: int, cell_height: int) -> tuple[int, int, int, int]:
+    """Crop box of a cell in a plain grid image. Indices are 0-based."""
+    return (col * cell_width, row * cell_height, col * cell_width + cell_width, row * cell_height + cell_height)
 
 
-def extract_button_cell(
-    img: Image.Image,
+def button_cell_box(
     row: int,
     col: int,
     cell_size: int,
@@ -193,11 +218,11 @@ def extract_button_cell(
     sep_y: int,
     origin_x: int,
     origin_y: int,
-) -> Image.Image:
-    """Extract button cell with separator-aware coordinates. Input indices are 0-based."""
+) -> tuple[int, int, int, int]:
+    """Crop box of a button cell with separator-aware coordinates. Input indices are 0-based."""
     x = origin_x + col * (cell_size + sep_x)
     y = origin_y + row * (cell_size + sep_y)
-    return img.crop((x, y, x + cell_size, y + cell_size))
+    return (x, y, x + cell_size, y + cell_size)
 
 
 def fit_item_to_button(
@@ -271,6 +296,141 @@ def composite_item_on_button(
     return result
 
 
+# ---------------------------------------------------------------------------
+# Shared source cache (batch rendering)
+# ---------------------------------------------------------------------------
+
+class SlotSourceCache:
+    """Decoded sources, cells and tinted tiles shared across SlotGenerator runs.
+
+    One instance renders every variant/combo requested on the command line, so
+    each source atlas is decoded once and each item tile is tinted and fitted
+    once per unique (cell pixels, gradient preset colors, direction). Classes
+    whose atlases share a cell and themes that share a preset reuse the same
+    tile, so --all-combos scales with unique tints rather than classes x themes.
+
+    Cached images are never modified in place by the compositing helpers.
+    Tinted and fitted tiles share an LRU bounded by TILE_CACHE_MAX_BYTES;
+    an evicted tile is simply re-tinted the next time it is needed.
+    """
+
+    def __init__(self, use_kernels: bool = True) -> None:
+        self.use_kernels = use_kernels
+        self._json: dict[Path, dict] = {}
+        self._images: dict[Path, Image.Image] = {}
+        self._cells: dict[tuple, tuple[Image.Image, bytes]] = {}
+        self._tiles: OrderedDict[tuple, Image.Image] = OrderedDict()
+        self._tile_bytes = 0
+        self.decoded = 0
+        self.tints = 0
+        self.tint_hits = 0
+
+    def load_json(self, path: Path) -> dict:
+        """Parse a JSON config once per run."""
+        key = path.resolve()
+        if key not in self._json:
+            with open(path, "r", encoding="utf-8") as f:
+                self._json[key] = json.load(f)
+        return self._json[key]
+
+    def image(self, path: Path) -> Image.Image:
+        """Decode a source atlas to RGBA once per run (raises on decode errors)."""
+        key = path.resolve()
+        if key not in self._images:
+            self._images[key] = imagecache.load_rgba(path, shared=True)
+            self.decoded += 1
+        return self._images[key]
+
+    def cell(self, path: Path, box: tuple[int, int, int, int]) -> tuple[Image.Image, bytes]:
+        """Crop a cell from a source atlas; returns (tile, pixel content key)."""
+        key = (path.resolve(), box)
+        if key not in self._cells:
+            tile = self.image(path).crop(box)
+            self._cells[key] = (tile, hashlib.sha1(tile.tobytes()).digest())
+        return self._cells[key]
+
+    def _tile(self, key: tuple) -> Image.Image | None:
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+        return tile
+
+    def _remember(self, key: tuple, tile: Image.Image) -> Image.Image:
+        self._tiles[key] = tile
+        self._tile_bytes += tile.width * tile.height * 4
+        while self._tile_bytes > TILE_CACHE_MAX_BYTES and len(self._tiles) > 1:
+            _, old = self._tiles.popitem(last=False)
+            self._tile_bytes -= old.width * old.height * 4
+        return tile
+
+    def tinted(
+        self,
+        tile: Image.Image,
+        cell_key: bytes,
+        gradient_type: str,
+        top_color: tuple[int, int, int],
+        bottom_color: tuple[int, int, int],
+        middle_color: tuple[int, int, int] | None,
+    ) -> tuple[Image.Image, tuple]:
+        """apply_item_gradient, memoized by cell pixels and gradient parameters."""
+        key = ("tint", cell_key, tile.size, gradient_type, top_color, bottom_color, middle_color)
+        tinted = self._tile(key)
+        if tinted is not None:
+            self.tint_hits += 1
+        else:
+            tinted = self._remember(key, apply_item_gradient(
+                tile, gradient_type, top_color, bottom_color,
+                middle_color=middle_color, use_kernels=self.use_kernels,
+            ))
+            self.tints += 1
+        return tinted, key
+
+    def fitted(
+        self,
+        tile: Image.Image,
+        tint_key: tuple,
+        cell_size: int,
+        fit_size: int,
+        offset_x: int,
+        offset_y: int,
+        fit_mode: str,
+    ) -> Image.Image:
+        """fit_item_to_button, memoized by tinted tile and layout parameters."""
+        key = ("fit", tint_key, cell_size, fit_size, offset_x, offset_y, fit_mode)
+        fitted = self._tile(key)
+        if fitted is None:
+            fitted = self._remember(key, fit_item_to_button(
+                tile,
+                cell_size=cell_size,
+                fit_size=fit_size,
+                offset_x=offset_x,
+                offset_y=offset_y,
+                fit_mode=fit_mode,
+            ))
+        return fitted
+
+    def forget(self, paths: list[Path]) -> None:
+        """Drop parsed configs, decoded atlases and cells of changed files (--watch).
+
+        Tinted and fitted tiles are keyed by cell pixel content, so they stay
+        valid and are reused when an edit leaves a tile unchanged; tiles no
+        longer used age out of the bounded LRU.
+        """
+        keys = {path.resolve() for path in paths}
+        for key in keys:
+            self._json.pop(key, None)
+            self._images.pop(key, None)
+        for cell_key in [cell_key for cell_key in self._cells if cell_key[0] in keys]:
+            del self._cells[cell_key]
+
+    def summary(self) -> str:
+        """One-line report for the run summary."""
+        return (
+            f"{self.decoded} source atlas(es) decoded, "
+            f"{self.tints} unique tint(s), {self.tint_hits} reused"
+        )
+
+
 # ---------------------------------------------------------------------------
 # SlotGenerator class
 # ---------------------------------------------------------------------------
@@ -288,6 +448,8 @@ class SlotGenerator:
         buttons_dir: Path | None = None,
         variant_name: str | None = None,
         verbose: bool = False,
+        use_cache: bool = True,
+        shared: SlotSourceCache | None = None,
     ) -> None:
         self.variant_dir = variant_dir
         self.variant_name = variant_name or variant_dir.name
@@ -310,6 +472,8 @@ class SlotGenerator:
         self.verbose = verbose
         self._dot_count = 0
         self._dot_line_open = False
+        self.cache = buildcache.BuildCache(self.output_dir, CACHE_NAME, SCRIPT_VERSION, enabled=use_cache)
+        self.shared = shared or SlotSourceCache()
 
     def _progress_dot(self) -> None:
         print(".", end="", flush=True)
@@ -334,8 +498,7 @@ class SlotGenerator:
         if not MASTER_CONFIG_PATH.exists():
             print(f"  ERROR: Master config not found: {MASTER_CONFIG_PATH}")
             return False
-        with open(MASTER_CONFIG_PATH, "r", encoding="utf-8") as f:
-            master_config = json.load(f)
+        master_config = self.shared.load_json(MASTER_CONFIG_PATH)
 
         # Load variant styling config (<variant>/.regen_slots.json)
         if not self.config_file.exists():
@@ -351,36 +514,61 @@ class SlotGenerator:
         # Fallback: if source file not in variant dir, look in .master/
         master_dir = self.master_dir
 
-        def _resolve_source(filename: str) -> tuple[Image.Image | None, str]:
+        def _resolve_source(filename: str) -> tuple[Path | None, str]:
             """Load a source TGA, falling back to .master/ if not in variant dir."""
             p = (self.items_dir or self.variant_dir) / filename
             if p.exists():
                 try:
-                    return Image.open(p).convert("RGBA"), "variant"
+                    self.shared.image(p)
+                    return p, "variant"
                 except Exception as e:
                     print(f"  Warning: Could not load {p}: {e}")
             p2 = (self.buttons_dir or master_dir) / filename
             if p2.exists():
                 try:
-                    img = Image.open(p2).convert("RGBA")
+                    self.shared.image(p2)
                     print(f"  Info: {filename} not in variant dir — loaded from .master/")
-                    return img, "master"
+                    return p2, "master"
                 except Exception as e:
                     print(f"  Warning: Could not load {p2}: {e}")
             return None, "missing"
 
-        items_img, items_loc = _resolve_source(source_items)
-        buttons_img, buttons_loc = _resolve_source(source_buttons)
-
-        if items_img is None:
+        # Skip compositing if the atlas was built from identical sources/config
+        source_paths: list[Path] = []
+        source_locs: dict[str, str] = {}
+        for filename in (source_items, source_buttons):
+            for loc, base in (("variant", self.items_dir or self.variant_dir), ("master", self.buttons_dir or master_dir)):
+                if (base / filename).exists():
+                    source_paths.append(base / filename)
+                    source_locs[filename] = loc
+                    break
+        out_path = self.output_dir / OUTPUT_FILENAME
+        digest = self.cache.digest(
+            sources=source_paths,
+            config={"master": master_config, "variant": variant_config},
+            key=OUTPUT_FILENAME,
+        )
+        cached_items = self.cache.meta(out_path)
+        if self.cache.is_fresh([out_path], digest) and cached_items is not None:
+            self.stats["summary"]["source_files"] = source_locs
+            self.stats["items"] = cached_items
+            self.stats["summary"]["items_total"] = len(cached_items)
+            self.stats["summary"]["items_with_overrides"] = sum(1 for item in cached_items if item.get("has_override"))
+            self.stats["output_file"] = str(out_path.name)
+            print(f"  Up to date: {out_path.name}")
+            print(f"  [OK] Slots complete: {self.variant_name}")
+            return True
+
+        items_src, items_loc = _resolve_source(source_items)
+        buttons_src, buttons_loc = _resolve_source(source_buttons)
+
+        if items_src is None:
             print(f"  ERROR: {source_items} not found in variant dir or .master/")
             return False
-        if buttons_img is None:
+        if buttons_src is None:
             print(f"  ERROR: {source_buttons} not found in variant dir or .master/")
             return False
 
-        items_src = items_img
-        buttons_src = buttons_img
         self.stats["summary"]["source_files"] = {
             source_items: items_loc,
             source_buttons: buttons_loc,
@@ -432,16 +620,20 @@ class SlotGenerator:
             button_col = int(button_col_raw) - 1
             button_col_src = _src("button_col", override, master_item, "default_button")
 
-            item_tile = extract_cell(items_src, item_row, item_col, cell_size, cell_size)
-            button_tile = extract_button_cell(
+            item_tile, item_key = self.shared.cell(
+                items_src, cell_box(item_row, item_col, cell_size, cell_size)
+            )
+            button_tile, _ = self.shared.cell(
                 buttons_src,
-                row=button_row,
-                col=button_col,
-                cell_size=cell_size,
-                sep_x=sep_x,
-                sep_y=sep_y,
-                origin_x=origin_x,
-                origin_y=origin_y,
+                button_cell_box(
+                    row=button_row,
+                    col=button_col,
+                    cell_size=cell_size,
+                    sep_x=sep_x,
+                    sep_y=sep_y,
+                    origin_x=origin_x,
+                    origin_y=origin_y,
+                ),
             )
 
             # --- Gradient resolution ---
@@ -461,8 +653,8 @@ class SlotGenerator:
             middle_color = parse_rgb(raw_mid, fallback=(255, 255, 255)) if raw_mid is not None else None
             gradient_type = item_entry.get("gradient_type", preset.get("type", "vertical"))
 
-            item_colored = apply_item_gradient(
-                item_tile, gradient_type, top_color, bottom_color, middle_color=middle_color
+            item_colored, tint_key = self.shared.tinted(
+                item_tile, item_key, gradient_type, top_color, bottom_color, middle_color
             )
 
             # --- Fit/layout resolution ---
@@ -477,8 +669,9 @@ class SlotGenerator:
             item_opacity = float(item_entry.get("item_opacity", default_item.get("item_opacity", 0.92)))
             item_opacity_src = _src("item_opacity", override, master_item, "default_item")
 
-            item_fitted = fit_item_to_button(
+            item_fitted = self.shared.fitted(
                 item_colored,
+                tint_key,
                 cell_size=cell_size,
                 fit_size=fit_size,
                 offset_x=offset_x,
@@ -545,9 +738,9 @@ class SlotGenerator:
             if overridden_fields:
                 self.stats["summary"]["items_with_overrides"] += 1
 
-        out_path = self.output_dir / OUTPUT_FILENAME
         output_atlas.save(out_path, format="TGA")
         self.stats["output_file"] = str(out_path.name)
+        self.cache.record([out_path], digest, meta=self.stats["items"])
 
         total = self.stats["summary"]["items_total"]
         overridden = self.stats["summary"]["items_with_overrides"]
@@ -560,6 +753,8 @@ class SlotGenerator:
     def save_stats(self) -> None:
         """Write processing statistics to .regen_slots-stats.json."""
         stats_file = self.output_dir / STATS_FILENAME
+        self.cache.save()
+        self.stats["cache"] = self.cache.summary()
         with open(stats_file, "w", encoding="utf-8") as f:
             json.dump(self.stats, f, indent=2)
 
@@ -620,6 +815,138 @@ def resolve_theme_dir(master_dir: Path, theme_name: str) -> Path:
     return master_dir / "themes" / theme_name
 
 
+# ---------------------------------------------------------------------------
+# Class/theme combos
+# ---------------------------------------------------------------------------
+
+def generate_combo(
+    base_dir: Path,
+    master_dir: Path,
+    class_name: str,
+    theme_name: str,
+    shared: SlotSourceCache,
+    verbose: bool = False,
+    use_cache: bool = True,
+) -> tuple[str, Path] | None:
+    """Render one class/theme combo into Options/Slots/<Class>/<Theme>/ and save its stats.
+
+    Returns (label, output_dir) on success, None on error.
+    """
+    resolved_class_name, class_dir = resolve_class_dir(master_dir, class_name)
+    theme_dir = resolve_theme_dir(master_dir, theme_name)
+    if not theme_dir.exists():
+        print(f"\nERROR: Theme directory not found: {theme_dir}")
+        return None
+
+    output_dir = base_dir / "thorne_drak" / "Options" / "Slots" / resolved_class_name / theme_name
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    label = f"{resolved_class_name}/{theme_name}"
+    generator = SlotGenerator(
+        variant_dir=theme_dir,
+        config_file=theme_dir / CONFIG_FILENAME,
+        output_dir=output_dir,
+        master_dir=master_dir,
+        items_dir=class_dir,
+        buttons_dir=master_dir,
+        variant_name=label,
+        verbose=verbose,
+        use_cache=use_cache,
+        shared=shared,
+    )
+    if not generator.generate():
+        return None
+    generator.save_stats()
+    return label, output_dir
+
+
+def copy_combo(combo_label: str, combo_path: Path, base_dir: Path) -> None:
+    """Copy a combo's atlas to thorne_drak/ (and thorne_dev/ when present).
+
+    Destinations that already hold identical content are left untouched.
+    """
+    root_path = base_dir / "thorne_drak"
+    src = combo_path / OUTPUT_FILENAME
+    if src.exists():
+        deployer = deploy.Deployer()
+        dst = root_path / OUTPUT_FILENAME
+        action = deployer.deploy(src, dst)
+        print(f"\n  Copied {combo_label}/{OUTPUT_FILENAME} -> thorne_drak/ ({action})")
+
+        thorne_dev_path = deploy.dev_path()
+        if thorne_dev_path.exists():
+            dst_dev = thorne_dev_path / OUTPUT_FILENAME
+            action = deployer.deploy(src, dst_dev)
+            print(f"  Deployed {combo_label}/{OUTPUT_FILENAME} -> thorne_dev/ ({action})")
+        deployer.save()
+
+
+def watch_combos(
+    base_dir: Path,
+    master_dir: Path,
+    classes: list[str],
+    themes: list[str],
+    shared: SlotSourceCache,
+    copy_label: str | None,
+    verbose: bool = False,
+) -> int:
+    """--watch: re-render only the combos affected by each source change.
+
+    Change mapping (within the --class/--theme scope of the initial run):
+        .master/themes/<Theme>/*         -> every class x <Theme>
+        .master/classes/<Class>/*.tga    -> <Class> x every theme
+        .master/.regen_slots.json,
+        .master/*.tga (button atlas, fallback item atlas) -> every combo
+
+    The SlotSourceCache from the initial build is kept, so unchanged atlases
+    stay decoded and unchanged tiles stay tinted; only the changed files are
+    dropped from it. Combos whose inputs did not actually change are skipped
+    by the build cache. copy_label is re-copied to thorne_drak/ when rebuilt.
+    """
+    classes = [class_name for class_name in classes if resolve_class_dir(master_dir, class_name)[1].exists()]
+    class_dirs = {}
+    for class_name in classes:
+        _, class_dir = resolve_class_dir(master_dir, class_name)
+        if class_dir != master_dir:
+            class_dirs[class_dir.resolve()] = class_name
+    theme_dirs = {resolve_theme_dir(master_dir, theme).resolve(): theme for theme in themes}
+
+    def sources() -> list[Path]:
+        files = [MASTER_CONFIG_PATH, *master_dir.glob("*.tga")]
+        for class_dir in class_dirs:
+            files.extend(class_dir.glob("*.tga"))
+        for theme_dir in theme_dirs:
+            files.append(theme_dir / CONFIG_FILENAME)
+            files.extend(theme_dir.glob("*.tga"))
+        return files
+
+    def rebuild(changed: list[Path]) -> None:
+        affected: set[tuple[str, str]] = set()
+        for path in changed:
+            parent = path.parent.resolve()
+            if parent in theme_dirs:
+                affected.update((class_name, theme_dirs[parent]) for class_name in classes)
+            elif parent in class_dirs:
+                affected.update((class_dirs[parent], theme) for theme in themes)
+            else:
+                affected.update((class_name, theme) for class_name in classes for theme in themes)
+
+        shared.forget(changed)
+        rebuilt = []
+        for class_name in classes:
+            for theme_name in themes:
+                if (class_name, theme_name) in affected:
+                    combo = generate_combo(base_dir, master_dir, class_name, theme_name, shared, verbose=verbose)
+                    if combo:
+                        rebuilt.append(combo)
+        for label, path in rebuilt:
+            if label == copy_label:
+                copy_combo(label, path, base_dir)
+        print(f"\n  {len(rebuilt)}/{len(affected)} combo(s) updated; shared cache: {shared.summary()}")
+
+    return watch.watch(sources, rebuild, label="regen_slots", root=base_dir)
+
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
@@ -635,6 +962,7 @@ Examples:
   python regen_slots.py --class Caster         # Single class, all themes
   python regen_slots.py --class Caster --theme Gold
   python regen_slots.py Gold Silver Metal       # Legacy standalone variants
+  python regen_slots.py --class Caster --watch # Rebuild affected combos on save
 
     Combo mode notes:
     - Themes live in .master/themes/<Theme>/.regen_slots.json
@@ -678,6 +1006,26 @@ Examples:
         action="store_true",
         help="Show detailed per-item output (default is compact progress dots).",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every atlas even if the build cache says it is up to date.",
+    )
+    parser.add_argument(
+        "--no-numpy",
+        action="store_true",
+        help="Use the per-pixel reference tint loop instead of the NumPy kernel (slow; for verification).",
+    )
+    parser.add_argument(
+        "--no-copyback",
+        action="store_true",
+        help="Skip the copy to thorne_drak/ and thorne_dev/ (build.py uses this for non-primary classes).",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After the build, keep polling sources and re-render only the affected combos (Ctrl+C to stop).",
+    )
 
     args = parser.parse_args()
 
@@ -710,6 +1058,10 @@ Examples:
 
     combo_mode = bool(args.all_combos or args.class_name or args.theme_name)
 
+    if args.watch and not combo_mode:
+        print("ERROR: --watch works with class/theme combos (--all, --class, --theme)")
+        return 1
+
     if args.variants and not combo_mode:
         variants = args.variants
     elif not combo_mode:
@@ -721,6 +1073,7 @@ Examples:
     success_count = 0
     total_count = len(variants)
     regenerated_variants: list[tuple[str, Path]] = []
+    shared = SlotSourceCache(use_kernels=not args.no_numpy)  # one decode/tint cache for every combo in this run
 
     if combo_mode:
         master_dir = base_dir / ".master"
@@ -740,33 +1093,18 @@ Examples:
 
         total_count = len(classes) * len(themes)
         for class_name in classes:
-            resolved_class_name, class_dir = resolve_class_dir(master_dir, class_name)
+            _, class_dir = resolve_class_dir(master_dir, class_name)
             if not class_dir.exists():
                 print(f"\nERROR: Class directory not found: {class_dir}")
                 continue
             for theme_name in themes:
-                theme_dir = resolve_theme_dir(master_dir, theme_name)
-                if not theme_dir.exists():
-                    print(f"\nERROR: Theme directory not found: {theme_dir}")
-                    continue
-
-                output_dir = base_dir / "thorne_drak" / "Options" / "Slots" / resolved_class_name / theme_name
-                output_dir.mkdir(parents=True, exist_ok=True)
-
-                generator = SlotGenerator(
-                    variant_dir=theme_dir,
-                    config_file=theme_dir / CONFIG_FILENAME,
-                    output_dir=output_dir,
-                    master_dir=master_dir,
-                    items_dir=class_dir,
-                    buttons_dir=master_dir,
-                    variant_name=f"{resolved_class_name}/{theme_name}",
-                    verbose=args.verbose,
+                combo = generate_combo(
+                    base_dir, master_dir, class_name, theme_name, shared,
+                    verbose=args.verbose, use_cache=not args.force,
                 )
-                if generator.generate():
-                    generator.save_stats()
+                if combo:
                     success_count += 1
-                    regenerated_variants.append((f"{resolved_class_name}/{theme_name}", output_dir))
+                    regenerated_variants.append(combo)
 
         # Smart copyback for combo mode:
         #   --all-combos         → copy Thorne/Thorne (primary class + primary theme)
@@ -793,20 +1131,11 @@ Examples:
                     combo_to_copy = (label, path)
                     break
 
+        if combo_to_copy and args.no_copyback:
+            combo_to_copy = None
+
         if combo_to_copy:
-            combo_label, combo_path = combo_to_copy
-            root_path = base_dir / "thorne_drak"
-            src = combo_path / OUTPUT_FILENAME
-            if src.exists():
-                dst = root_path / OUTPUT_FILENAME
-                shutil.copy2(src, dst)
-                print(f"\n  Copied {combo_label}/{OUTPUT_FILENAME} -> thorne_drak/")
-
-                thorne_dev_path = Path(r"C:\TAKP\uifiles\thorne_dev")
-                if thorne_dev_path.exists():
-                    dst_dev = thorne_dev_path / OUTPUT_FILENAME
-                    shutil.copy2(src, dst_dev)
-                    print(f"  Deployed {combo_label}/{OUTPUT_FILENAME} -> thorne_dev/")
+            copy_combo(*combo_to_copy, base_dir)
     else:
         for variant in variants:
             variant_dir = base_dir / "thorne_drak" / "Options" / "Slots" / variant
@@ -815,7 +1144,7 @@ Examples:
                 print(f"\nERROR: Variant directory not found: {variant_dir}")
                 continue
 
-            generator = SlotGenerator(variant_dir, verbose=args.verbose)
+            generator = SlotGenerator(variant_dir, verbose=args.verbose, use_cache=not args.force, shared=shared)
             if generator.generate():
                 generator.save_stats()
                 success_count += 1
@@ -824,16 +1153,22 @@ Examples:
     if combo_mode:
         print(f"\n{'='*70}")
         print(f"SUMMARY: {success_count}/{total_count} combo(s) processed successfully")
+        print(f"  Shared cache: {shared.summary()}")
         print(f"{'='*70}\n")
         if success_count > 0 and combo_to_copy:
             print("Ready to test in-game with: /loadskin thorne_dev\n")
+        if args.watch:
+            copy_label = combo_to_copy[0] if combo_to_copy else None
+            return watch_combos(base_dir, master_dir, classes, themes, shared, copy_label, verbose=args.verbose)
         return 0 if success_count == total_count else 1
 
     # Smart copyback: single variant → copy it; multiple → copy Gold (primary)
     variants_to_copy: list[tuple[str, Path]] = []
     root_path = base_dir / "thorne_drak"
 
-    if len(regenerated_variants) == 1:
+    if args.no_copyback:
+        pass
+    elif len(regenerated_variants) == 1:
         variants_to_copy = regenerated_variants
     elif len(regenerated_variants) > 1:
         for name, path in regenerated_variants:
@@ -841,6 +1176,7 @@ Examples:
                 variants_to_copy = [(name, path)]
                 break
 
+    deployer = deploy.Deployer()
     if variants_to_copy:
         print(f"\n{'='*70}")
         print("Copying regenerated files back to thorne_drak/...")
@@ -849,11 +1185,11 @@ Examples:
             src = variant_path / OUTPUT_FILENAME
             dst = root_path / OUTPUT_FILENAME
             if src.exists():
-                shutil.copy2(src, dst)
-                print(f"  Copied {variant_name}/{OUTPUT_FILENAME} -> thorne_drak/")
+                action = deployer.deploy(src, dst)
+                print(f"  Copied {variant_name}/{OUTPUT_FILENAME} -> thorne_drak/ ({action})")
 
     # Deploy to thorne_dev for immediate testing
-    thorne_dev_path = Path(r"C:\TAKP\uifiles\thorne_dev")
+    thorne_dev_path = deploy.dev_path()
     if thorne_dev_path.exists() and variants_to_copy:
         print(f"\n{'='*70}")
         print("Deploying to thorne_dev for testing...")
@@ -862,11 +1198,13 @@ Examples:
             src = variant_path / OUTPUT_FILENAME
             dst = thorne_dev_path / OUTPUT_FILENAME
             if src.exists():
-                shutil.copy2(src, dst)
-                print(f"  Deployed {variant_name}/{OUTPUT_FILENAME} -> thorne_dev/")
+                action = deployer.deploy(src, dst)
+                print(f"  Deployed {variant_name}/{OUTPUT_FILENAME} -> thorne_dev/ ({action})")
+    deployer.save()
 
     print(f"\n{'='*70}")
     print(f"SUMMARY: {success_count}/{total_count} variant(s) processed successfully")
+    print(f"  Shared cache: {shared.summary()}")
     print(f"{'='*70}\n")
 
     if success_count > 0 and variants_to_copy:
@@ -20,6 +20,7 @@ Output (per directory):
   thorne_item01.tga        -- Base composited item atlas (40px cells, 256x256)
   thorne_icons01.tga       -- Icon variant (20px cells, 256x256, if configured)
   .regen_thorne-stats.json -- Processing statistics
+  .regen_thorne-cache.json -- Build cache (atlases skipped when inputs are unchanged)
 """
 from __future__ import annotations
 
@@ -31,8 +32,13 @@ from pathlib import Path
 
 from PIL import Image, ImageEnhance, ImageOps
 
+import buildcache
+import imagecache
+
 CONFIG_FILENAME = ".regen_thorne.json"
 STATS_FILENAME = ".regen_thorne-stats.json"
+CACHE_NAME = "regen_thorne"
+SCRIPT_VERSION = buildcache.script_version(__file__, Path(__file__).with_name("imagecache.py"))
 
 
 # ---------------------------------------------------------------------------
@@ -189,7 +195,7 @@ def load_sources(directory: Path, fallback_dir: Path | None = None) -> dict[str,
     sources: dict[str, Image.Image] = {}
     for path in directory.glob("*.tga"):
         try:
-            sources[path.name] = Image.open(path).convert("RGBA")
+            sources[path.name] = imagecache.load_rgba(path, shared=True)
         except Exception:
             continue
     if fallback_dir and fallback_dir.exists() and fallback_dir != directory:
@@ -197,7 +203,7 @@ def load_sources(directory: Path, fallback_dir: Path | None = None) -> dict[str,
             if path.name in sources:
                 continue
             try:
-                sources[path.name] = Image.open(path).convert("RGBA")
+                sources[path.name] = imagecache.load_rgba(path, shared=True)
             except Exception:
                 continue
     return sources
@@ -250,6 +256,7 @@ class ThorneGenerator:
         source_dir: Path | None = None,
         fallback_dir: Path | None = None,
         verbose: bool = False,
+        use_cache: bool = True,
     ) -> None:
         self.directory = directory
         self.config_file = directory / CONFIG_FILENAME
@@ -270,6 +277,7 @@ class ThorneGenerator:
         self._dot_count = 0
         self._dot_line_open = False
         self._last_auto_stats: dict | None = None
+        self.cache = buildcache.BuildCache(directory, CACHE_NAME, SCRIPT_VERSION, enabled=use_cache)
 
     def _progress_dot(self) -> None:
         print(".", end="", flush=True)
@@ -410,6 +418,13 @@ class ThorneGenerator:
 
         return atlas
 
+    def _resolve_source(self, filename: str) -> Path:
+        """Path a source file is loaded from (source_dir first, then fallback_dir)."""
+        path = self.source_dir / filename
+        if not path.exists() and self.fallback_dir:
+            return self.fallback_dir / filename
+        return path
+
     def generate(self) -> bool:
         """Run the full atlas generation pipeline. Returns True on success."""
         print(f"\n{'='*70}")
@@ -436,43 +451,67 @@ class ThorneGenerator:
         items = config.get("items", [])
         variants = config.get("variants", [])
 
-        sources = load_sources(self.source_dir, fallback_dir=self.fallback_dir)
-
         if not items:
             print("  ERROR: Config has no items to render.")
             return False
 
-        # Generate base atlas
-        print(f"\n  Generating base atlas ({base_output_filename})...")
-        atlas = self.generate_atlas(
-            items, sources, base_cell_size, base_cell_size, base_output_size, default_tone, atlas_name="base",
-            source_grids=source_grids, auto_tone_default=auto_tone_default,
-        )
-        out_base = self.directory / base_output_filename
-        atlas.save(out_base, format="TGA")
-        self._ensure_newline()
-        self.stats["output_files"].append(str(out_base.name))
-        self.stats["summary"]["atlases_generated"] += 1
-        print(f"\n  Created: {out_base.name}  ({atlas.size[0]}×{atlas.size[1]})")
-
-        # Generate variant atlases
+        # One (output file, cell size, output size, name) per atlas: base first, then variants
+        atlases = [(base_output_filename, base_cell_size, base_output_size, "base")]
         for variant in variants:
             variant_name = variant.get("name", "variant")
-            variant_cell_size = int(variant.get("cell_size", base_cell_size))
-            variant_output_size = int(variant.get("output_size", base_output_size))
-            variant_output_filename = variant.get("output_file", f"item_{variant_name}01.tga")
+            atlases.append((
+                variant.get("output_file", f"item_{variant_name}01.tga"),
+                int(variant.get("cell_size", base_cell_size)),
+                int(variant.get("output_size", base_output_size)),
+                variant_name,
+            ))
+
+        source_files = sorted({entry["source_file"] for entry in items if entry.get("source_file")})
+        source_paths = [self._resolve_source(name) for name in source_files]
+        render_config = {
+            "cell_size": base_cell_size,
+            "default_tone": default_tone,
+            "auto_tone": auto_tone_default,
+            "source_grids": source_grids,
+            "items": items,
+        }
+        sources: dict[str, Image.Image] | None = None
+
+        for output_filename, cell_size, output_size, atlas_name in atlases:
+            if atlas_name == "base":
+                print(f"\n  Generating base atlas ({output_filename})...")
+            else:
+                print(f"\n  Generating variant '{atlas_name}' ({output_filename})...")
+            out_path = self.directory / output_filename
+            digest = self.cache.digest(
+                sources=source_paths,
+                config={**render_config, "output_cell_size": cell_size, "output_size": output_size},
+                key=output_filename,
+            )
+            cached_items = self.cache.meta(out_path)
+            if self.cache.is_fresh([out_path], digest) and cached_items is not None:
+                self.stats["items"].extend(cached_items)
+                self.stats["summary"]["items_total"] += len(cached_items)
+                self.stats["output_files"].append(str(out_path.name))
+                self.stats["summary"]["atlases_generated"] += 1
+                print(f"  Up to date: {out_path.name}")
+                continue
 
-            print(f"\n  Generating variant '{variant_name}' ({variant_output_filename})...")
-            variant_atlas = self.generate_atlas(
-                items, sources, base_cell_size, variant_cell_size, variant_output_size, default_tone, atlas_name=variant_name,
+            if sources is None:
+                sources = load_sources(self.source_dir, fallback_dir=self.fallback_dir)
+            first_item = len(self.stats["items"])
+            errors_before = len(self.stats["errors"])
+            atlas = self.generate_atlas(
+                items, sources, base_cell_size, cell_size, output_size, default_tone, atlas_name=atlas_name,
                 source_grids=source_grids, auto_tone_default=auto_tone_default,
             )
-            out_variant = self.directory / variant_output_filename
-            variant_atlas.save(out_variant, format="TGA")
+            atlas.save(out_path, format="TGA")
             self._ensure_newline()
-            self.stats["output_files"].append(str(out_variant.name))
+            self.stats["output_files"].append(str(out_path.name))
             self.stats["summary"]["atlases_generated"] += 1
-            print(f"\n  Created: {out_variant.name}  ({variant_atlas.size[0]}×{variant_atlas.size[1]})")
+            if len(self.stats["errors"]) == errors_before:
+                self.cache.record([out_path], digest, meta=self.stats["items"][first_item:])
+            print(f"\n  Created: {out_path.name}  ({atlas.size[0]}×{atlas.size[1]})")
 
         print(f"\n  [OK] Thorne atlas generation complete: {self.directory.name}")
         print(f"  Items rendered: {self.stats['summary']['items_total']}")
@@ -482,6 +521,8 @@ class ThorneGenerator:
     def save_stats(self) -> None:
         """Write processing statistics to .regen_thorne-stats.json."""
         stats_file = self.directory / STATS_FILENAME
+        self.cache.save()
+        self.stats["cache"] = self.cache.summary()
         with open(stats_file, "w", encoding="utf-8") as f:
             json.dump(self.stats, f, indent=2)
 
@@ -619,6 +660,11 @@ Directory must contain .regen_thorne.json config file and source dragitem TGA fi
         action="store_true",
         help="Show detailed per-item output (default is compact progress dots).",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every atlas even if the build cache says it is up to date.",
+    )
 
     args = parser.parse_args()
 
@@ -687,6 +733,7 @@ Directory must contain .regen_thorne.json config file and source dragitem TGA fi
             source_dir=master_dir / "items",
             fallback_dir=master_dir,
             verbose=args.verbose,
+            use_cache=not args.force,
         )
         if generator.generate():
             generator.save_stats()
@@ -725,6 +772,7 @@ Directory must contain .regen_thorne.json config file and source dragitem TGA fi
                 source_dir=items_dir,
                 fallback_dir=master_dir,
                 verbose=args.verbose,
+                use_cache=not args.force,
             )
             if generator.generate():
                 generator.save_stats()
@@ -750,7 +798,7 @@ Directory must contain .regen_thorne.json config file and source dragitem TGA fi
 
         # Generate base master
         items_dir = master_dir / "items"
-        generator = ThorneGenerator(master_dir, source_dir=items_dir, fallback_dir=master_dir, verbose=args.verbose)
+        generator = ThorneGenerator(master_dir, source_dir=items_dir, fallback_dir=master_dir, verbose=args.verbose, use_cache=not args.force)
         if generator.generate():
             generator.save_stats()
             success += 1
@@ -767,6 +815,7 @@ Directory must contain .regen_thorne.json config file and source dragitem TGA fi
                 source_dir=items_dir,
                 fallback_dir=master_dir,
                 verbose=args.verbose,
+                use_cache=not args.force,
             )
             if generator.generate():
                 generator.save_stats()
@@ -796,6 +845,7 @@ Directory must contain .regen_thorne.json config file and source dragitem TGA fi
             source_dir=items_dir,
             fallback_dir=master_dir,
             verbose=args.verbose,
+            use_cache=not args.force,
         )
         if generator.generate():
             generator.save_stats()
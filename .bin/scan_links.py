@@ -4,24 +4,36 @@ scan_links.py  —  Thorne UI Markdown Link Scanner
 Scan markdown files for local links and report broken references.
 Supports categorized output, false-positive filtering, and auto-fix.
 
+One os.walk of the repository builds the set of every file and directory
+path (plus the basename index used for suggestions), so checking whether a
+link target exists is a set lookup, not a stat() per link. Per-file results
+are cached in .tmp/scan_links-cache.json, keyed by the file's content hash
+and the path-set generation (a hash of every path in the repo): a markdown
+file is only re-scanned when it changed or when files were added, removed
+or renamed. --jobs N scans the remaining files on N worker processes.
+
 Usage:
     python .bin/scan_links.py                  # Scan and report
     python .bin/scan_links.py --fix            # Apply safe auto-fixes
     python .bin/scan_links.py --verbose        # Show all categories expanded
     python .bin/scan_links.py --fix --verbose  # Fix + detailed output
+    python .bin/scan_links.py -j 0             # Scan changed files on all cores
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import sys
-from collections import defaultdict
-from dataclasses import dataclass
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import List, Optional, Tuple
 from urllib.parse import unquote
 
 # ---------------------------------------------------------------------------
@@ -84,6 +96,18 @@ DEFAULT_EXCLUDED_DIRS = {
     "__pycache__",
 }
 
+DEFAULT_CACHE = ".tmp/scan_links-cache.json"
+CACHE_FORMAT = 2
+
+# Fuzzy suggestions (last strategy): score = NAME_WEIGHT * basename similarity
+# + (1 - NAME_WEIGHT) * directory-segment similarity
+NAME_WEIGHT = 0.6
+SUGGEST_MIN_SCORE = 0.75   # best candidate must score at least this
+SUGGEST_MIN_MARGIN = 0.1   # ...and beat the runner-up by this much
+TRIGRAM_MIN_DICE = 0.3     # trigram prefilter before the edit distance
+DIGITS_RE = re.compile(r"\d+")
+SUGGEST_SETTINGS = [NAME_WEIGHT, SUGGEST_MIN_SCORE, SUGGEST_MIN_MARGIN, TRIGRAM_MIN_DICE]
+
 # ---------------------------------------------------------------------------
 # Categories for broken link classification
 # ---------------------------------------------------------------------------
@@ -164,22 +188,86 @@ class LinkFinding:
     context_line: str = ""
 
 
+@dataclass
+class FileScan:
+    """Result of scanning one markdown file."""
+    file: Path
+    findings: List[LinkFinding]
+    links: int
+    fixes: int = 0
+    cacheable: bool = True  # False if a target was checked outside the path set
+
+
+@dataclass
+class RepoPaths:
+    """Every file and directory under root (minus excluded dirs), from one walk."""
+    root: Path
+    excluded_dirs: set[str]
+    files: set[str] = field(default_factory=set)
+    dirs: set[str] = field(default_factory=set)
+    basename_index: dict[str, List[Path]] = field(default_factory=dict)
+    markdown_files: List[Path] = field(default_factory=list)
+    has_symlinks: bool = False
+    case_insensitive: bool = False
+    generation: str = ""
+    fallbacks: int = 0  # existence checks that had to stat() the filesystem
+    _suggestions: Optional["SuggestionIndex"] = field(default=None, repr=False)
+
+    def suggestion_index(self) -> "SuggestionIndex":
+        """Fuzzy basename index, built on first use (only broken links need it)."""
+        if self._suggestions is None:
+            self._suggestions = SuggestionIndex(self)
+        return self._suggestions
+
+    def _key(self, path: str) -> str:
+        return path.lower() if self.case_insensitive else path
+
+    def resolve(self, md_file: Path, link_path: str) -> Path:
+        """resolve_target() without the filesystem when no symlinks are involved."""
+        if self.has_symlinks:
+            return resolve_target(md_file, self.root, link_path)
+        decoded = unquote(link_path)
+        if decoded.startswith("/"):
+            joined = os.path.join(self.root, decoded.lstrip("/"))
+        else:
+            joined = os.path.join(md_file.parent, decoded)
+        target = os.path.normpath(joined)
+        if self._rel_parts(target) is None:
+            return Path(target).resolve()  # outside the repo: may cross symlinks
+        return Path(target)
+
+    def _rel_parts(self, path: str) -> Optional[List[str]]:
+        root = str(self.root)
+        if path == root:
+            return []
+        if not path.startswith(root.rstrip(os.sep) + os.sep):
+            return None
+        return path[len(root.rstrip(os.sep)) + 1:].split(os.sep)
+
+    def exists(self, path: Path) -> bool:
+        """Path.exists() as a set lookup for anything the walk covered."""
+        text = str(path)
+        key = self._key(text)
+        if key in self.files or key in self.dirs:
+            return True
+        parts = self._rel_parts(text)
+        if parts is not None and not any(part in self.excluded_dirs for part in parts):
+            return False
+        # Outside the repo or inside an excluded directory: ask the filesystem
+        self.fallbacks += 1
+        return path.exists()
+
+
 # ---------------------------------------------------------------------------
 # Filesystem helpers
 # ---------------------------------------------------------------------------
 
 
-def iter_markdown_files(root: Path, excluded_dirs: set[str],
-                       excluded_paths: list[str] | None = None) -> Iterable[Path]:
-    for path in root.rglob("*.md"):
-        if any(part in excluded_dirs for part in path.parts):
-            continue
-        # Check path-prefix exclusions (e.g. ".github/agents")
-        if excluded_paths:
-            rel = path.relative_to(root).as_posix()
-            if any(rel.startswith(ep + "/") or rel == ep for ep in excluded_paths):
-                continue
-        yield path
+def is_excluded_path(rel: str, excluded_paths: list[str] | None) -> bool:
+    """Check path-prefix exclusions (e.g. ".github/agents")."""
+    if not excluded_paths:
+        return False
+    return any(rel.startswith(ep + "/") or rel == ep for ep in excluded_paths)
 
 
 def normalize_url(raw_url: str) -> str:
@@ -211,26 +299,62 @@ def resolve_target(md_file: Path, root: Path, link_path: str) -> Path:
     return (md_file.parent / decoded).resolve()
 
 
-def build_basename_index(root: Path, excluded_dirs: set[str]) -> dict[str, List[Path]]:
-    index: dict[str, List[Path]] = {}
-    for path in root.rglob("*"):
-        if any(part in excluded_dirs for part in path.parts):
-            continue
-        if path.is_file():
-            index.setdefault(path.name.lower(), []).append(path)
-    # Also index directories (for dir-link targets)
-    for path in root.rglob("*"):
-        if any(part in excluded_dirs for part in path.parts):
+def build_path_index(root: Path, excluded_dirs: set[str],
+                     excluded_paths: list[str] | None = None) -> RepoPaths:
+    """Walk root once: path set, basename index and the markdown files to scan."""
+    paths = RepoPaths(root=root, excluded_dirs=excluded_dirs)
+    root_text = str(root)
+    swapped = root_text.swapcase()
+    paths.case_insensitive = os.path.normcase("A") == "a" or (
+        swapped != root_text and os.path.exists(swapped)
+    )
+    paths.dirs.add(paths._key(root_text))
+    dir_entries: List[Path] = []
+    listing: List[str] = []
+    # scandir walk: entry types come from the directory listing, no stat() per path
+    pending = [(str(root), "")]
+    while pending:
+        dirpath, rel_base = pending.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
             continue
-        if path.is_dir():
-            index.setdefault(path.name.lower() + "/", []).append(path)
-    return index
+        subdirs = []
+        for entry in entries:
+            if entry.is_symlink():
+                paths.has_symlinks = True
+            if entry.is_dir():
+                if entry.name in excluded_dirs or entry.is_symlink():
+                    continue  # symlinked dirs are not descended (like rglob)
+                path = Path(entry.path)
+                paths.dirs.add(paths._key(entry.path))
+                dir_entries.append(path)
+                listing.append(rel_base + entry.name + "/")
+                subdirs.append((entry.path, rel_base + entry.name + "/"))
+            else:
+                name = entry.name
+                path = Path(entry.path)
+                paths.files.add(paths._key(entry.path))
+                paths.basename_index.setdefault(name.lower(), []).append(path)
+                listing.append(rel_base + name)
+                if name.endswith(".md") and not is_excluded_path(rel_base + name, excluded_paths):
+                    paths.markdown_files.append(path)
+        pending.extend(reversed(subdirs))
+    # Directories are indexed after files (for dir-link targets)
+    for path in dir_entries:
+        paths.basename_index.setdefault(path.name.lower() + "/", []).append(path)
+    paths.markdown_files.sort()
+    listing.sort()
+    paths.generation = hashlib.sha256("\n".join(listing).encode("utf-8")).hexdigest()[:16]
+    return paths
 
 
 def relpath_for(md_file: Path, target: Path) -> str:
     """Compute a relative posix path from md_file's directory to target."""
     try:
-        rel = os.path.relpath(target.resolve(), md_file.parent.resolve())
+        # Both paths come from the walk of the resolved root: no resolve() needed
+        rel = os.path.relpath(target, md_file.parent)
         return Path(rel).as_posix()
     except ValueError:
         return str(target)
@@ -241,40 +365,172 @@ def relpath_for(md_file: Path, target: Path) -> str:
 # ---------------------------------------------------------------------------
 
 
+def normalize_name(name: str) -> str:
+    """Lowercase; hyphens and spaces count as underscores (common rename pattern)."""
+    return name.lower().replace("-", "_").replace(" ", "_")
+
+
+def trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def bounded_edit_distance(a: str, b: str, limit: int) -> Optional[int]:
+    """Edit distance (adjacent transpositions count as one edit), or None if > limit."""
+    if abs(len(a) - len(b)) > limit:
+        return None
+    before: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        current = [i]
+        for j, cb in enumerate(b, start=1):
+            best = min(previous[j - 1] + (ca != cb), previous[j] + 1, current[j - 1] + 1)
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                best = min(best, before[j - 2] + 1)
+            current.append(best)
+        if min(current) > limit:
+            return None
+        before, previous = previous, current
+    return previous[-1] if previous[-1] <= limit else None
+
+
+def name_similarity(a: str, b: str) -> float:
+    """1.0 for equal names, less for a few edits, 0.0 otherwise (or if numbers differ)."""
+    if a == b:
+        return 1.0
+    if DIGITS_RE.findall(a) != DIGITS_RE.findall(b):
+        return 0.0
+    edits = bounded_edit_distance(a, b, max(1, max(len(a), len(b)) // 6))
+    return 0.0 if edits is None else 1.0 - edits / max(len(a), len(b))
+
+
+def segment_similarity(a: List[str], b: List[str]) -> float:
+    """Dice coefficient of two lists of (normalized) directory names.
+
+    Segments match exactly or with a few edits (partial credit), so a typo
+    in a directory name still ranks the intended path first.
+    """
+    if not a and not b:
+        return 1.0
+    remaining = list(b)
+    matched = 0.0
+    for seg in a:
+        best, best_i = 0.0, -1
+        for i, other in enumerate(remaining):
+            sim = name_similarity(seg, other)
+            if sim > best:
+                best, best_i = sim, i
+                if sim == 1.0:
+                    break
+        if best_i >= 0:
+            matched += best
+            del remaining[best_i]
+    return 2.0 * matched / (len(a) + len(b))
+
+
+class SuggestionIndex:
+    """Trigram index over every file and directory name in the repo.
+
+    candidates() ranks existing paths for a broken link by basename edit
+    distance and directory-segment similarity, without touching the
+    filesystem. Names whose numbers differ (v0.7 vs v0.8, Thorne 6 vs
+    Thorne 7) never match: they are different items, not typos.
+    """
+
+    def __init__(self, paths: RepoPaths) -> None:
+        self.paths = paths
+        by_name: dict[str, List[Path]] = {}
+        for key, targets in paths.basename_index.items():
+            by_name.setdefault(normalize_name(key), []).extend(targets)
+        self.names: List[str] = []             # normalized name, dirs end with "/"
+        self.targets: List[List[Path]] = []
+        self.gram_counts: List[int] = []
+        self.postings: dict[str, List[int]] = defaultdict(list)
+        for name, targets in by_name.items():
+            grams = trigrams(name.rstrip("/"))
+            for gram in grams:
+                self.postings[gram].append(len(self.names))
+            self.names.append(name)
+            self.targets.append(targets)
+            self.gram_counts.append(len(grams))
+
+    def _query_dirs(self, md_file: Path, decoded: str) -> List[str]:
+        """Directory names the link points into (repo-relative when possible)."""
+        parts = self.paths._rel_parts(str(self.paths.resolve(md_file, decoded.rstrip("/"))))
+        if parts is None:
+            parts = [p for p in decoded.rstrip("/").split("/") if p not in ("", ".", "..")]
+        return [normalize_name(p) for p in parts[:-1]]
+
+    def candidates(self, md_file: Path, link_path: str, limit: int = 5) -> List[Tuple[float, Path]]:
+        """Existing paths that link_path most likely meant, best first."""
+        decoded = unquote(link_path).rstrip()
+        want_dir = decoded.endswith("/")
+        name = normalize_name(Path(decoded.rstrip("/")).name)
+        if not name:
+            return []
+        grams = trigrams(name)
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(self.postings.get(gram, ()))
+        query_dirs = self._query_dirs(md_file, decoded)
+
+        ranked: List[Tuple[float, Path]] = []
+        for idx, count in shared.items():
+            candidate = self.names[idx]
+            if want_dir and not candidate.endswith("/"):
+                continue
+            candidate = candidate.rstrip("/")
+            if 2.0 * count / (len(grams) + self.gram_counts[idx]) < TRIGRAM_MIN_DICE:
+                continue
+            name_sim = name_similarity(name, candidate)
+            if name_sim == 0.0:
+                continue
+            for target in self.targets[idx]:
+                target_dirs = [normalize_name(p) for p in target.relative_to(self.paths.root).parts[:-1]]
+                score = NAME_WEIGHT * name_sim + (1.0 - NAME_WEIGHT) * segment_similarity(query_dirs, target_dirs)
+                ranked.append((round(score, 4), target))
+        ranked.sort(key=lambda item: (-item[0], str(item[1])))
+        return ranked[:limit]
+
+
 def pick_suggestion(
     md_file: Path,
     root: Path,
     link_path: str,
-    basename_index: dict[str, List[Path]],
+    paths: RepoPaths,
 ) -> Optional[str]:
-    """Try to find the correct target for a broken link."""
+    """Try to find the correct target for a broken link.
+
+    Candidate targets are checked against the repo path set, not the filesystem.
+    """
+    basename_index = paths.basename_index
     link_path = link_path.rstrip()
     decoded = unquote(link_path)
 
     # Strategy 1: Directory link with trailing slash — try without slash
     if decoded.endswith("/"):
         trimmed = decoded.rstrip("/")
-        target = resolve_target(md_file, root, trimmed)
-        if target.exists():
+        target = paths.resolve(md_file, trimmed)
+        if paths.exists(target):
             return trimmed
 
     # Strategy 2: Missing extension — try adding .md
     if Path(decoded).suffix == "":
         with_md = f"{decoded}.md"
-        target = resolve_target(md_file, root, with_md)
-        if target.exists():
+        target = paths.resolve(md_file, with_md)
+        if paths.exists(target):
             return with_md
 
     # Strategy 3: Hyphen vs underscore substitution (common rename pattern)
     # e.g. ui-analysis/ -> ui_analysis/, initial-phases/ -> initial_phases/
     underscore_variant = decoded.replace("-", "_")
     if underscore_variant != decoded:
-        target = resolve_target(md_file, root, underscore_variant)
-        if target.exists():
+        target = paths.resolve(md_file, underscore_variant)
+        if paths.exists(target):
             return underscore_variant
         # Also try with trailing slash stripped
-        target = resolve_target(md_file, root, underscore_variant.rstrip("/"))
-        if target.exists():
+        target = paths.resolve(md_file, underscore_variant.rstrip("/"))
+        if paths.exists(target):
             return underscore_variant.rstrip("/")
 
     # Strategy 4: Case-insensitive basename search for unique match
@@ -285,8 +541,8 @@ def pick_suggestion(
     if len(matches) == 1:
         suggestion = relpath_for(md_file, matches[0])
         # Verify the suggestion actually resolves
-        check = resolve_target(md_file, root, suggestion)
-        if check.exists():
+        check = paths.resolve(md_file, suggestion)
+        if paths.exists(check):
             return suggestion
 
     # Strategy 5: Walk ../  depth corrections
@@ -295,14 +551,14 @@ def pick_suggestion(
         parts = decoded.split("/")
         # Try adding one more ../
         deeper = "../" + decoded
-        target = resolve_target(md_file, root, deeper)
-        if target.exists():
+        target = paths.resolve(md_file, deeper)
+        if paths.exists(target):
             return deeper
         # Try removing one ../
         if parts[0] == "..":
             shallower = "/".join(parts[1:])
-            target = resolve_target(md_file, root, shallower)
-            if target.exists():
+            target = paths.resolve(md_file, shallower)
+            if paths.exists(target):
                 return shallower
 
     # Strategy 6: For paths referencing old directory names, try common renames
@@ -314,13 +570,13 @@ def pick_suggestion(
     for old, new in rename_map.items():
         if old in decoded:
             renamed = decoded.replace(old, new, 1)
-            target = resolve_target(md_file, root, renamed)
-            if target.exists():
+            target = paths.resolve(md_file, renamed)
+            if paths.exists(target):
                 return renamed
             # Also try with underscore substitution
             renamed_us = renamed.replace("-", "_")
-            target = resolve_target(md_file, root, renamed_us)
-            if target.exists():
+            target = paths.resolve(md_file, renamed_us)
+            if paths.exists(target):
                 return renamed_us
 
     # Strategy 7: Basename search in directory index
@@ -331,6 +587,16 @@ def pick_suggestion(
             suggestion = relpath_for(md_file, dir_matches[0])
             return suggestion + "/"
 
+    # Strategy 8: Fuzzy match (typos, partial renames) — only a clear winner
+    ranked = paths.suggestion_index().candidates(md_file, decoded)
+    if ranked and ranked[0][0] >= SUGGEST_MIN_SCORE:
+        if len(ranked) == 1 or round(ranked[0][0] - ranked[1][0], 4) >= SUGGEST_MIN_MARGIN:
+            suggestion = relpath_for(md_file, ranked[0][1])
+            if decoded.endswith("/"):
+                suggestion += "/"
+            if paths.exists(paths.resolve(md_file, suggestion)):
+                return suggestion
+
     return None
 
 
@@ -448,133 +714,293 @@ def _suggest_relative_for_absolute(
         return repo_rel
 
 
-def scan_links(
-    root: Path,
-    fix: bool,
-    excluded_dirs: set[str],
-    excluded_paths: list[str] | None = None,
-) -> Tuple[List[LinkFinding], int, int, int]:
-    broken: List[LinkFinding] = []
-    total_files = 0
-    total_links = 0
-    fixes_applied = 0
+def scan_file(md_file: Path, paths: RepoPaths, fix: bool) -> FileScan:
+    """Scan one markdown file (and rewrite it when fix applies changes)."""
+    root = paths.root
+    findings: List[LinkFinding] = []
+    links = 0
+    fixes = 0
+    fallbacks = paths.fallbacks
+
+    try:
+        lines = md_file.read_text(encoding="utf-8").splitlines()
+    except UnicodeDecodeError:
+        lines = md_file.read_text(encoding="latin-1").splitlines()
+
+    updated = False
+    in_code_block = False
+
+    for i, line in enumerate(lines, start=1):
+        # Track fenced code blocks — skip both passes inside them
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            in_code_block = not in_code_block
+            continue
+        if in_code_block:
+            continue
 
-    basename_index = build_basename_index(root, excluded_dirs)
+        # --- Pass 1: Scan markdown links for broken targets ---
+        urls = extract_urls(line)
+        if urls:
+            for raw_url in urls:
+                links += 1
+                url = normalize_url(raw_url)
+                if should_skip(url):
+                    continue
 
-    for md_file in sorted(iter_markdown_files(root, excluded_dirs, excluded_paths)):
-        total_files += 1
-        try:
-            lines = md_file.read_text(encoding="utf-8").splitlines()
-        except UnicodeDecodeError:
-            lines = md_file.read_text(encoding="latin-1").splitlines()
-
-        updated = False
-        in_code_block = False
-
-        for i, line in enumerate(lines, start=1):
-            # Track fenced code blocks — skip both passes inside them
-            stripped = line.strip()
-            if stripped.startswith("```"):
-                in_code_block = not in_code_block
-                continue
-            if in_code_block:
-                continue
+                # Skip false positives early
+                if is_false_positive(url):
+                    continue
 
-            # --- Pass 1: Scan markdown links for broken targets ---
-            urls = extract_urls(line)
-            if urls:
-                for raw_url in urls:
-                    total_links += 1
-                    url = normalize_url(raw_url)
-                    if should_skip(url):
-                        continue
-
-                    # Skip false positives early
-                    if is_false_positive(url):
-                        continue
-
-                    path_part, _frag = split_url(url)
-                    path_part = strip_query(path_part)
-                    if not path_part:
-                        continue
-
-                    target = resolve_target(md_file, root, path_part)
-                    if target.exists():
-                        continue
-
-                    suggestion = pick_suggestion(md_file, root, path_part, basename_index)
-
-                    finding = LinkFinding(
-                        file=md_file,
-                        line_number=i,
-                        raw_url=raw_url,
-                        resolved_path=target,
-                        reason="target_not_found",
-                        suggestion=suggestion,
-                        context_line=line.strip()[:120],
-                    )
-                    finding.category = classify_finding(finding, md_file)
-
-                    if fix and suggestion and finding.category == "auto-fixable":
-                        # Replace the raw URL with the suggestion in the line
-                        new_url = suggestion
-                        # Preserve fragment if present
-                        _, frag = split_url(url)
-                        if frag:
-                            new_url = f"{suggestion}#{frag}"
-                        # Target the link target specifically: ](old_url) -> ](new_url)
-                        # This avoids replacing a matching substring in the
-                        # display text when the filename appears in both.
-                        old_target = f"]({raw_url})"
-                        new_target = f"]({new_url})"
-                        if old_target in line:
-                            line = line.replace(old_target, new_target, 1)
-                        else:
-                            line = line.replace(raw_url, new_url, 1)
-                        lines[i - 1] = line
-                        updated = True
-                        fixes_applied += 1
-                        finding.applied_fix = True
-
-                    broken.append(finding)
-
-            # --- Pass 2: Detect absolute paths in backtick references ---
-            for m in ABSOLUTE_PATH_RE.finditer(line):
-                abs_path = m.group(1)
-                # Only flag paths that match our known prefixes
-                if not any(abs_path.startswith(p) or abs_path.lower().startswith(p.lower())
-                           for p in ABSOLUTE_PATH_PREFIXES):
+                path_part, _frag = split_url(url)
+                path_part = strip_query(path_part)
+                if not path_part:
                     continue
 
-                # Try to compute a relative suggestion
-                abs_suggestion = _suggest_relative_for_absolute(
-                    abs_path, md_file, root
-                )
+                target = paths.resolve(md_file, path_part)
+                if paths.exists(target):
+                    continue
+
+                suggestion = pick_suggestion(md_file, root, path_part, paths)
 
                 finding = LinkFinding(
                     file=md_file,
                     line_number=i,
-                    raw_url=abs_path,
-                    resolved_path=None,
-                    reason="absolute_path",
-                    category="absolute-path",
-                    suggestion=abs_suggestion,
+                    raw_url=raw_url,
+                    resolved_path=target,
+                    reason="target_not_found",
+                    suggestion=suggestion,
                     context_line=line.strip()[:120],
                 )
-
-                if fix and abs_suggestion:
-                    line = line.replace(abs_path, abs_suggestion, 1)
+                finding.category = classify_finding(finding, md_file)
+
+                if fix and suggestion and finding.category == "auto-fixable":
+                    # Replace the raw URL with the suggestion in the line
+                    new_url = suggestion
+                    # Preserve fragment if present
+                    _, frag = split_url(url)
+                    if frag:
+                        new_url = f"{suggestion}#{frag}"
+                    # Target the link target specifically: ](old_url) -> ](new_url)
+                    # This avoids replacing a matching substring in the
+                    # display text when the filename appears in both.
+                    old_target = f"]({raw_url})"
+                    new_target = f"]({new_url})"
+                    if old_target in line:
+                        line = line.replace(old_target, new_target, 1)
+                    else:
+                        line = line.replace(raw_url, new_url, 1)
                     lines[i - 1] = line
                     updated = True
-                    fixes_applied += 1
+                    fixes += 1
                     finding.applied_fix = True
 
-                broken.append(finding)
+                findings.append(finding)
+
+        # --- Pass 2: Detect absolute paths in backtick references ---
+        for m in ABSOLUTE_PATH_RE.finditer(line):
+            abs_path = m.group(1)
+            # Only flag paths that match our known prefixes
+            if not any(abs_path.startswith(p) or abs_path.lower().startswith(p.lower())
+                       for p in ABSOLUTE_PATH_PREFIXES):
+                continue
+
+            # Try to compute a relative suggestion
+            abs_suggestion = _suggest_relative_for_absolute(
+                abs_path, md_file, root
+            )
+
+            finding = LinkFinding(
+                file=md_file,
+                line_number=i,
+                raw_url=abs_path,
+                resolved_path=None,
+                reason="absolute_path",
+                category="absolute-path",
+                suggestion=abs_suggestion,
+                context_line=line.strip()[:120],
+            )
+
+            if fix and abs_suggestion:
+                line = line.replace(abs_path, abs_suggestion, 1)
+                lines[i - 1] = line
+                updated = True
+                fixes += 1
+                finding.applied_fix = True
+
+            findings.append(finding)
+
+    if fix and updated:
+        md_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    return FileScan(md_file, findings, links, fixes, cacheable=paths.fallbacks == fallbacks)
+
+
+def is_fixable(finding: LinkFinding) -> bool:
+    return bool(finding.suggestion) and finding.category in ("auto-fixable", "absolute-path")
+
+
+class ScanCache:
+    """Per-file scan results keyed by content hash and path-set generation."""
+
+    def __init__(self, path: Path | None, root: Path | None = None) -> None:
+        self.path = path
+        self.root = str(root) if root else None
+        self.files: dict[str, list] = {}    # rel path -> [size, mtime_ns, sha256]
+        self.results: dict[str, list] = {}  # rel path -> [sha256, generation, links, findings]
+        self.hits = 0
+        self.misses = 0
+        if path is None:
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (data.get("format") == CACHE_FORMAT and data.get("root") == self.root
+                and data.get("suggest") == SUGGEST_SETTINGS):
+            self.files = data.get("files", {})
+            self.results = data.get("results", {})
+
+    def content_hash(self, path: Path, rel: str) -> str:
+        st = path.stat()
+        known = self.files.get(rel)
+        if known and known[0] == st.st_size and known[1] == st.st_mtime_ns:
+            return known[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self.files[rel] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def get(self, rel: str, digest: str, md_file: Path, generation: str) -> Optional[FileScan]:
+        entry = self.results.get(rel)
+        if not entry or entry[0] != digest or entry[1] != generation:
+            return None
+        findings = [
+            LinkFinding(
+                file=md_file,
+                line_number=line,
+                raw_url=raw_url,
+                resolved_path=Path(resolved) if resolved else None,
+                reason=reason,
+                category=category,
+                suggestion=suggestion,
+                context_line=context,
+            )
+            for line, raw_url, resolved, reason, category, suggestion, context in entry[3]
+        ]
+        return FileScan(md_file, findings, entry[2])
+
+    def put(self, rel: str, digest: str, generation: str, scan: FileScan) -> None:
+        self.results[rel] = [
+            digest,
+            generation,
+            scan.links,
+            [
+                [f.line_number, f.raw_url, str(f.resolved_path) if f.resolved_path else None,
+                 f.reason, f.category, f.suggestion, f.context_line]
+                for f in scan.findings
+            ],
+        ]
+
+    def prune(self, keep: set[str]) -> None:
+        self.files = {rel: v for rel, v in self.files.items() if rel in keep}
+        self.results = {rel: v for rel, v in self.results.items() if rel in keep}
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                "format": CACHE_FORMAT,
+                "root": self.root,
+                "suggest": SUGGEST_SETTINGS,
+                "files": self.files,
+                "results": self.results,
+            }
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass  # read-only checkout: results are simply not persisted
+
+
+_worker_paths: RepoPaths | None = None
+
+
+def _init_worker(paths: RepoPaths) -> None:
+    global _worker_paths
+    _worker_paths = paths
+
+
+def _scan_worker(args: Tuple[Path, bool]) -> FileScan:
+    md_file, fix = args
+    return scan_file(md_file, _worker_paths, fix)
 
-        if fix and updated:
-            md_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
-    return broken, total_files, total_links, fixes_applied
+def scan_links(
+    root: Path,
+    fix: bool,
+    excluded_dirs: set[str],
+    excluded_paths: list[str] | None = None,
+    cache: ScanCache | None = None,
+    jobs: int = 1,
+) -> Tuple[List[LinkFinding], int, int, int]:
+    """Scan every markdown file under root.
+
+    Files whose content and the repo path set are unchanged since the last
+    run are taken from the cache (with --fix, only if nothing in them is
+    fixable). The rest are scanned on `jobs` worker processes.
+    """
+    cache = cache or ScanCache(None)
+    paths = build_path_index(root, excluded_dirs, excluded_paths)
+
+    scans: dict[Path, FileScan] = {}
+    digests: dict[Path, Optional[str]] = {}
+    rels: dict[Path, str] = {}
+    to_scan: List[Path] = []
+    for md_file in paths.markdown_files:
+        rel = md_file.relative_to(root).as_posix()
+        rels[md_file] = rel
+        try:
+            digest = cache.content_hash(md_file, rel)
+        except OSError:
+            digest = None
+        digests[md_file] = digest
+        cached = cache.get(rel, digest, md_file, paths.generation) if digest else None
+        if cached is not None and not (fix and any(is_fixable(f) for f in cached.findings)):
+            scans[md_file] = cached
+            cache.hits += 1
+        else:
+            to_scan.append(md_file)
+    cache.misses = len(to_scan)
+
+    if jobs > 1 and len(to_scan) > 1:
+        workers = min(jobs, len(to_scan))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(paths,)) as pool:
+            chunksize = max(1, len(to_scan) // (workers * 4))
+            for scan in pool.map(_scan_worker, [(md_file, fix) for md_file in to_scan], chunksize=chunksize):
+                scans[scan.file] = scan
+    else:
+        for md_file in to_scan:
+            scans[md_file] = scan_file(md_file, paths, fix)
+
+    for md_file in to_scan:
+        scan = scans[md_file]
+        if scan.fixes:
+            cache.files.pop(rels[md_file], None)  # rewritten: hash again next run
+        elif scan.cacheable and digests[md_file]:
+            cache.put(rels[md_file], digests[md_file], paths.generation, scan)
+    cache.prune(set(rels.values()))
+
+    broken: List[LinkFinding] = []
+    total_links = 0
+    fixes_applied = 0
+    for md_file in paths.markdown_files:
+        scan = scans[md_file]
+        broken.extend(scan.findings)
+        total_links += scan.links
+        fixes_applied += scan.fixes
+    return broken, len(paths.markdown_files), total_links, fixes_applied
 
 
 # ---------------------------------------------------------------------------
@@ -669,7 +1095,9 @@ def main() -> int:
         epilog="Examples:\n"
         "  python .bin/scan_links.py              # Scan and report\n"
         "  python .bin/scan_links.py --fix        # Auto-fix safe suggestions\n"
-        "  python .bin/scan_links.py --verbose    # Show all categories\n",
+        "  python .bin/scan_links.py --verbose    # Show all categories\n"
+        "  python .bin/scan_links.py -j 0         # Scan changed files on all cores\n"
+        "  python .bin/scan_links.py --force      # Ignore the result cache\n",
     )
     parser.add_argument(
         "--root",
@@ -691,17 +1119,40 @@ def main() -> int:
         action="store_true",
         help="Show false positives and template placeholders in output.",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Worker processes for scanning changed files (default: 1 serial, 0 = all cores).",
+    )
+    parser.add_argument(
+        "--cache",
+        default=DEFAULT_CACHE,
+        help=f"Per-file result cache (default: {DEFAULT_CACHE}).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-scan every file, ignoring cached results (the cache is rewritten).",
+    )
 
     args = parser.parse_args()
     root = Path(args.root).resolve()
     output_path = Path(args.output)
+    start = time.perf_counter()
 
     # Load exclusion configuration
     excluded_dirs, excluded_paths = load_link_scan_config(root)
 
+    cache = ScanCache(Path(args.cache), root)
+    if args.force:
+        cache.results.clear()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
     findings, total_files, total_links, fixes_applied = scan_links(
-        root, args.fix, excluded_dirs, excluded_paths
+        root, args.fix, excluded_dirs, excluded_paths, cache, jobs
     )
+    cache.save()
 
     # Count by category (exclude false positives from broken count)
     real_broken = sum(
@@ -721,6 +1172,10 @@ def main() -> int:
         "template_placeholders": sum(
             1 for f in findings if f.category == "template-placeholder"
         ),
+        "scanned": cache.misses,
+        "cached": cache.hits,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000.0, 3),
+        "jobs": jobs,
     }
 
     write_report(output_path, findings, summary)
@@ -730,7 +1185,7 @@ def main() -> int:
     print("  Thorne UI -- Markdown Link Scanner")
     print("=" * 50)
     print(f"  Root:           {root}")
-    print(f"  Files scanned:  {total_files}")
+    print(f"  Files scanned:  {total_files} ({cache.misses} scanned, {cache.hits} cached)")
     print(f"  Links scanned:  {total_links}")
     print(f"  Broken links:   {real_broken}")
     if fixable > 0:
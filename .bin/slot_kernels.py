@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Array-backed pixel kernels for regen_slots.py.
+
+tint_gradient() is the whole-image NumPy implementation of the per-pixel loop
+in tint_item_gradient(). It is written to be byte-identical with the loop:
+
+  - the gradient position t is a precomputed per-(size, direction) map built
+    with the same divisions the loop performs per pixel
+  - the 2- or 3-stop ramp evaluates the loop's expressions in the same order
+    (float64), selecting the half of a 3-stop ramp with np.where
+  - int(max(0, min(255, v))) is reproduced with np.clip + truncating cast
+
+The loop implementation remains in regen_slots.py as the reference path
+(`--no-numpy`) and as the fallback when NumPy is not installed.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image
+
+
+@lru_cache(maxsize=None)
+def gradient_t_map(width, height, direction):
+    """(H, W) float64 gradient position t in [0.0, 1.0] for a tile size and direction.
+
+    direction is already normalized; unknown values fall back to vertical.
+    The returned array is shared between calls and marked read-only.
+    """
+    x_span = max(1, width - 1)
+    y_span = max(1, height - 1)
+    xs = np.arange(width, dtype=np.float64) / x_span
+    ys = np.arange(height, dtype=np.float64)[:, None] / y_span
+
+    if direction == "horizontal":
+        t = np.broadcast_to(xs, (height, width))
+    elif direction == "diagonal_tl":
+        t = (xs + ys) / 2.0
+    elif direction == "diagonal_tr":
+        xs_rev = np.arange(width - 1, -1, -1, dtype=np.float64) / x_span
+        t = (xs_rev + ys) / 2.0
+    else:  # vertical (default)
+        t = np.broadcast_to(ys, (height, width))
+
+    t = np.array(t, dtype=np.float64)
+    t.setflags(write=False)
+    return t
+
+
+def _ramp(t, top, bottom, middle):
+    """Per-pixel ramp color for one channel, mirroring the loop's expressions."""
+    if middle is None:
+        return top + (bottom - top) * t
+    lower = t < 0.5
+    s_low = t * 2.0
+    s_high = (t - 0.5) * 2.0
+    return np.where(
+        lower,
+        top + (middle - top) * s_low,
+        middle + (bottom - middle) * s_high,
+    )
+
+
+def tint_gradient(item_tile, top_color, bottom_color, middle_color=None, direction="vertical"):
+    """Tint a grayscale item tile by luminance with a 2- or 3-stop color ramp.
+
+    Same contract as regen_slots.tint_item_gradient (direction is normalized
+    here the same way); returns a new RGBA image.
+    """
+    arr = np.array(item_tile.convert("RGBA"), dtype=np.uint8)
+    height, width = arr.shape[:2]
+    direction = (direction or "vertical").strip().lower()
+
+    t = gradient_t_map(width, height, direction)
+    lum_t = arr[:, :, 0] / 255.0  # source atlas is grayscale, R=G=B
+    alpha = arr[:, :, 3]
+    visible = alpha != 0
+
+    out = np.zeros((height, width, 4), dtype=np.uint8)
+    for channel in range(3):
+        middle = middle_color[channel] if middle_color is not None else None
+        row = _ramp(t, top_color[channel], bottom_color[channel], middle)
+        value = np.clip(row * lum_t, 0, 255).astype(np.uint8)
+        out[:, :, channel] = np.where(visible, value, 0)
+    out[:, :, 3] = alpha
+    return Image.fromarray(out)
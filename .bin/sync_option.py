@@ -8,17 +8,20 @@ Examples:
   python .bin/sync_option.py --list
   python .bin/sync_option.py --list inventory
   python .bin/sync_option.py --option spellbook/large --dry-run --verbose
+
+Files already identical in thorne_dev are skipped (see deploy.py).
 """
 
 from __future__ import annotations
 
 import argparse
-import shutil
 from pathlib import Path
 from typing import List
 
+import deploy
+
 DEFAULT_SOURCE = Path(r"C:\Thorne-UI\thorne_drak")
-DEFAULT_DEST = Path(r"C:\TAKP\uifiles\thorne_dev")
+DEFAULT_DEST = deploy.dev_path()
 
 EXCLUDED_FILENAMES = {"Thumbs.db", ".DS_Store"}
 EXCLUDED_EXTENSIONS = {".md"}
@@ -115,7 +118,14 @@ def list_available(options_root: Path, category_filter: str | None = None) -> in
     return 0
 
 
-def copy_option_files(source_option_dir: Path, dest_dir: Path, *, dry_run: bool, verbose: bool) -> tuple[bool, str]:
+def copy_option_files(
+    source_option_dir: Path,
+    dest_dir: Path,
+    *,
+    dry_run: bool,
+    verbose: bool,
+    link_mode: str | None = None,
+) -> tuple[bool, str]:
     if not source_option_dir.is_dir():
         return False, f"Source option directory not found: {source_option_dir}"
 
@@ -139,24 +149,22 @@ def copy_option_files(source_option_dir: Path, dest_dir: Path, *, dry_run: bool,
             return True, f"No files copied (skipped {len(skipped)} markdown file(s))."
         return True, "No files found to copy."
 
-    if not dry_run:
-        dest_dir.mkdir(parents=True, exist_ok=True)
-
+    deployer = deploy.Deployer(link_mode=link_mode, dry_run=dry_run)
     copied: List[str] = []
     for src in files_to_copy:
-        dst = dest_dir / src.name
-        if dry_run:
-            copied.append(src.name)
+        action = deployer.deploy(src, dest_dir / src.name)
+        if action == "unchanged":
             continue
-
-        shutil.copy2(src, dst)
         copied.append(src.name)
         if verbose:
-            print(f"  copied: {src.name}")
+            print(f"  {action}: {src.name}")
+    deployer.save()
 
+    if not copied:
+        return True, f"Already up to date ({deployer.summary()})"
     preview = ", ".join(copied[:5])
     suffix = "" if len(copied) <= 5 else ", ..."
-    return True, f"Copied {len(copied)} file(s): {preview}{suffix}"
+    return True, f"Copied {len(copied)} file(s): {preview}{suffix}\n  {deployer.summary()}"
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -201,6 +209,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=str(DEFAULT_DEST),
         help=f"Destination thorne_dev directory (default: {DEFAULT_DEST})",
     )
+    parser.add_argument(
+        "--link",
+        choices=deploy.LINK_MODES,
+        default=None,
+        help="Transfer mode: auto (reflink, else in-kernel copy), hardlink, copy (default: THORNE_DEPLOY_LINK or auto).",
+    )
     parser.add_argument("--dry-run", action="store_true", help="Show what would copy without writing files.")
     parser.add_argument("--verbose", action="store_true", help="Show detailed file operations.")
     parser.add_argument(
@@ -280,6 +294,7 @@ def main(argv: list[str] | None = None) -> int:
         dest_base,
         dry_run=args.dry_run,
         verbose=args.verbose,
+        link_mode=args.link,
     )
 
     if not ok:
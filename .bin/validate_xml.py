@@ -3,13 +3,25 @@ validate_xml.py
 
 Validate XML files for well-formedness.
 Accepts optional file paths (for pre-commit) or scans a root directory.
+
+Results are cached in .tmp/xml_wellformed-cache.json by file content
+(sha256), so unchanged files - and identical copies under Options/ - are
+not parsed again (a failure is cached per file, since the error message
+names the file); a file whose size and mtime are unchanged is not even
+re-hashed. --jobs N parses the remaining files on N worker processes.
+The JSON report records every file's parse time (from the cache for files
+that were not re-parsed).
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List
@@ -34,6 +46,10 @@ EXCLUDED_DIRS = {
     "LunaQuarmified",
 }
 
+DEFAULT_CACHE = ".tmp/xml_wellformed-cache.json"
+CACHE_FORMAT = 2
+SLOWEST_SHOWN = 5
+
 try:
     from lxml import etree as xml_parser  # type: ignore
 
@@ -58,12 +74,26 @@ class XmlFinding:
     error: str
 
 
+@dataclass
+class XmlResult:
+    file: Path
+    error: str | None
+    parse_ms: float
+    cached: bool
+
+
 def iter_xml_files(root: Path) -> Iterable[Path]:
-    for path in root.rglob("*.xml"):
-        if any(part in EXCLUDED_DIRS for part in path.parts):
-            continue
-        if path.is_file():
-            yield path
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Prune excluded trees (.git, .tmp, ...) instead of walking and filtering them
+        dirnames[:] = sorted(d for d in dirnames if d not in EXCLUDED_DIRS)
+        for name in sorted(filenames):
+            if not name.endswith(".xml"):
+                continue
+            path = Path(dirpath) / name
+            if any(part in EXCLUDED_DIRS for part in path.parts):
+                continue
+            if path.is_file():
+                yield path
 
 
 def normalize_files(files: List[str]) -> List[Path]:
@@ -75,17 +105,142 @@ def normalize_files(files: List[str]) -> List[Path]:
     return resolved
 
 
-def validate_paths(paths: Iterable[Path]) -> List[XmlFinding]:
-    findings: List[XmlFinding] = []
+def timed_parse(path: Path) -> tuple[str | None, float]:
+    """Parse one file; returns (error message or None, parse time in ms)."""
+    start = time.perf_counter()
+    try:
+        parse_xml(path)
+        error = None
+    except Exception as exc:  # pragma: no cover - runtime parse errors
+        error = str(exc)
+    return error, (time.perf_counter() - start) * 1000.0
+
+
+class ResultCache:
+    """Parse results keyed by content hash, with a stat fast path per file."""
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.files: dict[str, list] = {}  # abs path -> [size, mtime_ns, sha256]
+        self.results: dict[str, list] = {}  # sha256 (ok) or "sha256:path" (failed) -> [error or None, parse_ms]
+        if path is None:
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("format") == CACHE_FORMAT and data.get("parser") == PARSER_NAME:
+            self.files = data.get("files", {})
+            self.results = data.get("results", {})
+
+    def content_hash(self, path: Path) -> str:
+        key = str(path.resolve())
+        st = path.stat()
+        known = self.files.get(key)
+        if known and known[0] == st.st_size and known[1] == st.st_mtime_ns:
+            return known[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self.files[key] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            data = {"format": CACHE_FORMAT, "parser": PARSER_NAME, "files": self.files, "results": self.results}
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass  # read-only checkout: results are simply not persisted
+
+
+def failure_key(digest: str, path: Path) -> str:
+    """Cache key of a failed parse: the error text names the file (lxml), so
+    failures are not shared between files with the same content."""
+    return f"{digest}:{path.resolve()}"
+
+
+def validate_files(paths: Iterable[Path], cache: ResultCache | None = None, jobs: int = 1) -> List[XmlResult]:
+    """Validate paths, reusing cached results for unchanged content.
+
+    Successful parses are shared by every file with the same content;
+    failures are cached per file. Files are parsed on `jobs` worker
+    processes when more than one file needs parsing. Results are returned
+    in input order.
+    """
+    paths = list(paths)
+    cache = cache or ResultCache(None)
+    digests: list[str | None] = []
+    keys: list[str | None] = []
+    results: list[XmlResult | None] = []
+    to_parse: dict[str, Path] = {}  # one parse per distinct content
     for path in paths:
         try:
-            parse_xml(path)
-        except Exception as exc:  # pragma: no cover - runtime parse errors
-            findings.append(XmlFinding(file=path, error=str(exc)))
+            digest = cache.content_hash(path)
+        except OSError as exc:
+            digests.append(None)
+            keys.append(None)
+            results.append(XmlResult(file=path, error=str(exc), parse_ms=0.0, cached=False))
+            continue
+        digests.append(digest)
+        results.append(None)
+        known = cache.results.get(digest)
+        if known is not None and known[0] is None:
+            keys.append(digest)
+        elif failure_key(digest, path) in cache.results:
+            keys.append(failure_key(digest, path))
+        else:
+            keys.append(None)
+            to_parse.setdefault(digest, path)
+
+    parsed: dict[str, tuple[str | None, float]] = {}  # cache key -> fresh result
+    if to_parse:
+        items = list(to_parse.items())
+        if jobs > 1 and len(items) > 1:
+            workers = min(jobs, len(items))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(items) // (workers * 4))
+                outcomes = list(pool.map(timed_parse, [path for _, path in items], chunksize=chunksize))
+        else:
+            outcomes = [timed_parse(path) for _, path in items]
+        for (digest, path), (error, parse_ms) in zip(items, outcomes):
+            key = digest if error is None else failure_key(digest, path)
+            parsed[key] = (error, parse_ms)
+            cache.results[key] = [error, round(parse_ms, 3)]
+
+    for index, path in enumerate(paths):
+        if results[index] is not None:
+            continue
+        key = keys[index]
+        cached = key is not None
+        if key is None:
+            digest = digests[index]
+            if digest in cache.results:
+                key = digest
+                cached = to_parse[digest] != path
+            else:
+                # Same content as a file that failed: parse this one for its own message
+                key = failure_key(digest, path)
+                if key not in parsed:
+                    error, parse_ms = timed_parse(path)
+                    parsed[key] = (error, parse_ms)
+                    cache.results[key] = [error, round(parse_ms, 3)]
+        error, parse_ms = cache.results[key]
+        results[index] = XmlResult(file=path, error=error, parse_ms=parse_ms, cached=cached)
+    return results
+
+
+def validate_paths(paths: Iterable[Path]) -> List[XmlFinding]:
+    findings: List[XmlFinding] = []
+    for result in validate_files(paths):
+        if result.error is not None:
+            findings.append(XmlFinding(file=result.file, error=result.error))
     return findings
 
 
-def write_report(output_path: Path, findings: List[XmlFinding], summary: dict) -> None:
+def write_report(output_path: Path, findings: List[XmlFinding], summary: dict, results: List[XmlResult] | None = None) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     report = {
         "summary": summary,
@@ -98,6 +253,16 @@ def write_report(output_path: Path, findings: List[XmlFinding], summary: dict) -
             for finding in findings
         ],
     }
+    if results is not None:
+        report["files"] = [
+            {
+                "file": str(result.file),
+                "parse_ms": result.parse_ms,
+                "cached": result.cached,
+                "ok": result.error is None,
+            }
+            for result in results
+        ]
     output_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
 
 
@@ -118,9 +283,27 @@ def main() -> int:
         default=".tmp/xml_wellformed.json",
         help="Output JSON report path (default: .tmp/xml_wellformed.json).",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Worker processes for parsing uncached files (default: 1 serial, 0 = all cores).",
+    )
+    parser.add_argument(
+        "--cache",
+        default=DEFAULT_CACHE,
+        help=f"Result cache path, keyed by file content (default: {DEFAULT_CACHE}).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-parse every file, ignoring cached results (the cache is rewritten).",
+    )
 
     args = parser.parse_args()
     output_path = Path(args.report)
+    start = time.perf_counter()
 
     if args.files:
         paths = normalize_files(args.files)
@@ -128,20 +311,39 @@ def main() -> int:
         root = Path(args.root).resolve()
         paths = list(iter_xml_files(root))
 
-    findings = validate_paths(paths)
+    cache = ResultCache(Path(args.cache))
+    if args.force:
+        cache.results.clear()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    results = validate_files(paths, cache, jobs)
+    cache.save()
+
+    findings = [XmlFinding(file=result.file, error=result.error) for result in results if result.error is not None]
+    parsed = [result for result in results if not result.cached]
     summary = {
         "files_checked": len(paths),
         "errors": len(findings),
+        "parsed": len(parsed),
+        "cached": len(results) - len(parsed),
+        "parse_ms": round(sum(result.parse_ms for result in parsed), 3),
+        "elapsed_ms": round((time.perf_counter() - start) * 1000.0, 3),
+        "jobs": jobs,
     }
 
-    write_report(output_path, findings, summary)
+    write_report(output_path, findings, summary, results)
 
     print("XML Well-Formedness Check")
     print(f"Parser: {PARSER_NAME}")
-    print(f"Files checked: {len(paths)}")
+    print(f"Files checked: {len(paths)} ({summary['parsed']} parsed, {summary['cached']} cached)")
     print(f"Errors: {len(findings)}")
     print(f"Report: {output_path}")
 
+    slowest = sorted(results, key=lambda result: result.parse_ms, reverse=True)[:SLOWEST_SHOWN]
+    if len(results) > 1 and slowest:
+        print("\nSlowest files:")
+        for result in slowest:
+            print(f"  {result.parse_ms:8.2f} ms  {result.file}")
+
     if findings:
         print("\nErrors:")
         for finding in findings:
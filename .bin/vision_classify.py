@@ -44,6 +44,10 @@ Options:
     --dry-run     Show results without writing to catalog
     --model NAME  Override default model (clip: model name, ollama: model tag)
 
+HOG feature vectors are kept in .master/items/.cache/hog_features.npz, keyed
+by cell PNG content and HOG_PARAMS, so --hog and --test only compute features
+for cells not seen before. Reference vectors are indexed in hog_refs.npz.
+
 Status written: "vision" (new tier between "high" and "confirmed")
   - Never overwrites "confirmed" entries (unless --force)
   - Overwrites "guess" and "high" entries
@@ -53,7 +57,9 @@ from __future__ import annotations
 
 import argparse
 import base64
+import hashlib
 import json
+import os
 import sys
 import time
 import urllib.error
@@ -64,6 +70,8 @@ from pathlib import Path
 import numpy as np
 from PIL import Image
 
+from reference_index import ReferenceIndex, source_key
+
 # ─── Paths ───────────────────────────────────────────────────────────
 
 REPO = Path(__file__).resolve().parent.parent
@@ -74,6 +82,20 @@ CACHE_DIR = ITEMS_DIR / ".cache"
 CELL = 40
 GRID = 6
 CLIP_REFS_PATH = CACHE_DIR / "clip_refs.npz"
+HOG_REFS_PATH = CACHE_DIR / "hog_refs.npz"
+HOG_FEATURES_PATH = CACHE_DIR / "hog_features.npz"
+HOG_FEATURES_FORMAT = 1
+
+# HOG descriptor settings (part of the hog_features.npz and hog_refs.npz keys:
+# change them and the stored features and reference index are rebuilt)
+HOG_PARAMS = {
+    "upscale": 4,
+    "orientations": 9,
+    "pixels_per_cell": (8, 8),
+    "cells_per_block": (2, 2),
+    "hist_h_bins": 18,
+    "hist_s_bins": 8,
+}
 
 # ─── Valid subcategories (loaded from _slot_map in item_catalog.json) ─
 # The _slot_map is the single source of truth for categories, subcategories,
@@ -360,70 +382,210 @@ Reply with ONLY the description, nothing else."""
 # TIER 1: HOG + Color Histogram Features
 # ═════════════════════════════════════════════════════════════════════
 
-def classify_hog(img: Image.Image) -> tuple[str, float]:
-    """Classify using HOG features + color histogram with KNN against
-    confirmed items. Returns (sub, confidence)."""
-    from skimage.feature import hog
-    import cv2
+_skimage_hog = None   # skimage.feature.hog, imported once by load_hog_backend()
+_cv2 = None
+_hog_store = None     # HogFeatureStore shared by every --hog / --test path
 
-    # Convert to grayscale numpy
-    gray = np.array(img.convert("L"))
-
-    # HOG descriptor — captures shape outlines
-    hog_features = hog(
-        gray,
-        orientations=9,
-        pixels_per_cell=(8, 8),
-        cells_per_block=(2, 2),
-        feature_vector=True,
-    )
+HOG_BATCH = 256       # cells per hog_features_batch() call
+
+
+def load_hog_backend():
+    """Import skimage's hog() and cv2 (cached after first call)."""
+    global _skimage_hog, _cv2
 
-    # Color histogram (H and S channels from HSV)
-    bgr = cv2.cvtColor(np.array(img.convert("RGB")), cv2.COLOR_RGB2BGR)
-    hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
-    hist_h = cv2.calcHist([hsv], [0], None, [18], [0, 180]).flatten()
-    hist_s = cv2.calcHist([hsv], [1], None, [8], [0, 256]).flatten()
+    if _skimage_hog is None:
+        from skimage.feature import hog
+        import cv2
+
+        _skimage_hog = hog
+        _cv2 = cv2
+    return _skimage_hog, _cv2
+
+
+def _hog_features_tiled(tiled: Image.Image, count: int) -> np.ndarray:
+    """HOG + color histogram + contour features of `count` equal-height
+    images stacked vertically in one RGB image. Returns (count, dims).
+
+    Grayscale and color conversions are per-pixel, so they run once on the
+    whole stack; HOG and contours run per image.
+    """
+    hog, cv2 = load_hog_backend()
+
+    # Convert to grayscale numpy
+    gray = np.array(tiled.convert("L"))
+    rgb = np.array(tiled.convert("RGB"))
+    height = rgb.shape[0] // count
+
+    # Color histogram (H and S channels from HSV); same bins as cv2.calcHist
+    bgr = cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+    hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV).reshape(count, -1, 3).astype(np.int64)
+    h_bins, s_bins = HOG_PARAMS["hist_h_bins"], HOG_PARAMS["hist_s_bins"]
+    offsets = np.arange(count)[:, None]
+    hist_h = np.bincount((offsets * h_bins + hsv[..., 0] * h_bins // 180).ravel(),
+                         minlength=count * h_bins).reshape(count, h_bins).astype(np.float32)
+    hist_s = np.bincount((offsets * s_bins + hsv[..., 1] * s_bins // 256).ravel(),
+                         minlength=count * s_bins).reshape(count, s_bins).astype(np.float32)
 
     # Normalize histograms
-    hist_h = hist_h / (hist_h.sum() + 1e-6)
-    hist_s = hist_s / (hist_s.sum() + 1e-6)
+    hist_h = hist_h / (hist_h.sum(axis=1, keepdims=True) + 1e-6)
+    hist_s = hist_s / (hist_s.sum(axis=1, keepdims=True) + 1e-6)
 
-    # Contour shape features
     gray_cv = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
     _, thresh = cv2.threshold(gray_cv, 15, 255, cv2.THRESH_BINARY)
-    contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-
-    circularity = 0.0
-    solidity = 0.0
-    extent = 0.0
-    if contours:
-        c = max(contours, key=cv2.contourArea)
-        area = cv2.contourArea(c)
-        perimeter = cv2.arcLength(c, True)
-        if perimeter > 0:
-            circularity = 4 * np.pi * area / (perimeter ** 2)
-        hull = cv2.convexHull(c)
-        hull_area = cv2.contourArea(hull)
-        if hull_area > 0:
-            solidity = area / hull_area
-        x, y, w, h = cv2.boundingRect(c)
-        if w * h > 0:
-            extent = area / (w * h)
-
-    # Combine into single feature vector
-    shape_feats = np.array([circularity, solidity, extent])
-    combined = np.concatenate([hog_features, hist_h, hist_s, shape_feats])
-
-    return combined
 
+    rows = []
+    for i in range(count):
+        y0, y1 = i * height, (i + 1) * height
+
+        # HOG descriptor — captures shape outlines
+        hog_features = hog(
+            gray[y0:y1],
+            orientations=HOG_PARAMS["orientations"],
+            pixels_per_cell=HOG_PARAMS["pixels_per_cell"],
+            cells_per_block=HOG_PARAMS["cells_per_block"],
+            feature_vector=True,
+        )
+
+        # Contour shape features
+        contours, _ = cv2.findContours(thresh[y0:y1], cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+        circularity = 0.0
+        solidity = 0.0
+        extent = 0.0
+        if contours:
+            c = max(contours, key=cv2.contourArea)
+            area = cv2.contourArea(c)
+            perimeter = cv2.arcLength(c, True)
+            if perimeter > 0:
+                circularity = 4 * np.pi * area / (perimeter ** 2)
+            hull = cv2.convexHull(c)
+            hull_area = cv2.contourArea(hull)
+            if hull_area > 0:
+                solidity = area / hull_area
+            x, y, w, h = cv2.boundingRect(c)
+            if w * h > 0:
+                extent = area / (w * h)
+
+        # Combine into single feature vector
+        shape_feats = np.array([circularity, solidity, extent])
+        rows.append(np.concatenate([hog_features, hist_h[i], hist_s[i], shape_feats]))
+
+    return np.stack(rows)
+
+
+def classify_hog(img: Image.Image) -> np.ndarray:
+    """HOG + color histogram + contour feature vector of one (upscaled) image,
+    for KNN matching against confirmed items."""
+    return _hog_features_tiled(img, 1)[0]
+
+
+def hog_features_batch(cells: list[Image.Image]) -> np.ndarray:
+    """classify_hog(load_png(...)) for many equal-size cell images at once.
+
+    The cells are stacked into one image so that compositing on black, the
+    NEAREST upscale and the color conversions are single calls per batch
+    (all per-pixel, so the result matches load_png() + classify_hog()).
+    """
+    if not cells:
+        return np.zeros((0, 0))
+    scale = HOG_PARAMS["upscale"]
+    w, h = cells[0].size
+    stack = Image.new("RGBA", (w, h * len(cells)))
+    for i, cell in enumerate(cells):
+        stack.paste(cell.convert("RGBA"), (0, i * h))
+    tiled = Image.new("RGB", stack.size, (0, 0, 0))
+    tiled.paste(stack, mask=stack.split()[3])
+    if scale > 1:
+        tiled = tiled.resize((w * scale, h * scale * len(cells)), Image.Resampling.NEAREST)
+    return _hog_features_tiled(tiled, len(cells))
+
+
+class HogFeatureStore:
+    """HOG feature vectors of cell PNGs, keyed by PNG content hash.
+
+    Saved as .cache/hog_features.npz together with HOG_PARAMS; a store
+    written with different parameters is discarded. features() computes
+    only the vectors it has not seen, HOG_BATCH cells per call.
+    """
 
-def build_hog_references(catalog: dict) -> dict[str, list[np.ndarray]]:
-    """Build HOG feature vectors from confirmed items."""
-    refs: dict[str, list[np.ndarray]] = {}
-    for file_key, cells in catalog.items():
+    def __init__(self, path: Path = HOG_FEATURES_PATH) -> None:
+        self.path = path
+        self.params = json.dumps(HOG_PARAMS, sort_keys=True)
+        self.vectors: dict[str, np.ndarray] = {}   # content hash -> feature vector
+        self.computed = 0
+        self.reused = 0
+        self._dirty = False
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data["format"]) == HOG_FEATURES_FORMAT and str(data["params"]) == self.params:
+                    self.vectors = dict(zip((str(k) for k in data["hashes"]), data["vectors"]))
+        except (OSError, KeyError, ValueError):
+            pass
+
+    def features(self, paths: list[Path]) -> np.ndarray:
+        """Feature vectors of cell PNGs, (len(paths), dims)."""
+        digests = []
+        missing: dict[str, bytes] = {}
+        for p in paths:
+            data = p.read_bytes()
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            digests.append(digest)
+            if digest not in self.vectors and digest not in missing:
+                missing[digest] = data
+
+        pending = list(missing.items())
+        for start in range(0, len(pending), HOG_BATCH):
+            chunk = pending[start:start + HOG_BATCH]
+            cells = [Image.open(BytesIO(data)) for _, data in chunk]
+            for (digest, _), vec in zip(chunk, hog_features_batch(cells)):
+                self.vectors[digest] = vec
+        self.computed += len(pending)
+        self.reused += len(digests) - len(pending)
+        self._dirty = self._dirty or bool(pending)
+
+        if not digests:
+            return np.zeros((0, 0))
+        return np.stack([self.vectors[d] for d in digests])
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            hashes = sorted(self.vectors)
+            tmp_path = self.path.with_name(f"{self.path.stem}.{os.getpid()}.tmp.npz")
+            np.savez(
+                tmp_path,
+                format=np.array(HOG_FEATURES_FORMAT),
+                params=np.array(self.params),
+                hashes=np.array(hashes, dtype=str),
+                vectors=np.stack([self.vectors[d] for d in hashes]) if hashes else np.zeros((0, 0)),
+            )
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError:
+            pass  # read-only checkout: features are recomputed next run
+
+    def summary(self) -> str:
+        return f"HOG features: {self.computed} computed, {self.reused} cached"
+
+
+def load_hog_store() -> HogFeatureStore:
+    """The shared HOG feature store (loaded on first call)."""
+    global _hog_store
+
+    if _hog_store is None:
+        _hog_store = HogFeatureStore()
+    return _hog_store
+
+
+def _confirmed_hog_cells(catalog: dict) -> list[tuple[str, Path]]:
+    """(sub, png path) of every confirmed non-empty cell with an extracted PNG."""
+    cells = []
+    for file_key, file_cells in catalog.items():
         if file_key.startswith("_"):
             continue
-        for cell_key, entry in cells.items():
+        for cell_key, entry in file_cells.items():
             if entry.get("status") != "confirmed":
                 continue
             sub = entry.get("sub", "other")
@@ -431,34 +593,64 @@ def build_hog_references(catalog: dict) -> dict[str, list[np.ndarray]]:
                 continue
             row, col = parse_cell_key(cell_key)
             p = png_path(file_key, row, col)
-            if not p.exists():
-                continue
-            img = load_png(p, upscale=4)
-            fvec = classify_hog(img)
-            if sub not in refs:
-                refs[sub] = []
-            refs[sub].append(fvec)
+            if p.exists():
+                cells.append((sub, p))
+    return cells
+
+
+def build_hog_references(catalog: dict) -> dict[str, list[np.ndarray]]:
+    """Build HOG feature vectors from confirmed items (via the feature store)."""
+    cells = _confirmed_hog_cells(catalog)
+    vectors = load_hog_store().features([p for _, p in cells])
+    refs: dict[str, list[np.ndarray]] = {}
+    for (sub, _), fvec in zip(cells, vectors):
+        if sub not in refs:
+            refs[sub] = []
+        refs[sub].append(fvec)
     return refs
 
 
-def classify_hog_by_reference(fvec: np.ndarray, refs: dict[str, list[np.ndarray]]) -> tuple[str, float]:
+def load_hog_index(catalog: dict) -> ReferenceIndex:
+    """HOG reference index over confirmed items.
+
+    Reuses .cache/hog_refs.npz when the confirmed cells, their PNGs (size
+    and mtime) and HOG_PARAMS are unchanged, so the reference HOG vectors
+    are not recomputed on every run.
+    """
+    cells = _confirmed_hog_cells(catalog)
+    stamps = []
+    for sub, p in cells:
+        st = p.stat()
+        stamps.append([sub, p.relative_to(CACHE_DIR).as_posix(), st.st_size, st.st_mtime_ns])
+    source = source_key(sorted(stamps), HOG_PARAMS)
+
+    index = ReferenceIndex.load(HOG_REFS_PATH, source)
+    if index is None:
+        index = ReferenceIndex.from_refs(build_hog_references(catalog), source)
+        index.save(HOG_REFS_PATH)
+    return index
+
+
+def classify_hog_by_reference(fvec: np.ndarray, refs: ReferenceIndex | dict[str, list[np.ndarray]]) -> tuple[str, float]:
     """Match a HOG feature vector against references using cosine similarity."""
-    best_sub = "other"
-    best_sim = -1.0
-    fv_norm = np.linalg.norm(fvec)
-    if fv_norm < 1e-6:
-        return ("other", 0.0)
-
-    for sub, ref_vectors in refs.items():
-        for rv in ref_vectors:
-            rv_norm = np.linalg.norm(rv)
-            if rv_norm < 1e-6:
-                continue
-            sim = float(np.dot(fvec, rv) / (fv_norm * rv_norm))
-            if sim > best_sim:
-                best_sim = sim
-                best_sub = sub
-    return (best_sub, best_sim)
+    return classify_hog_batch_by_reference([fvec], refs)[0]
+
+
+def classify_hog_batch_by_reference(
+    fvecs: list[np.ndarray],
+    refs: ReferenceIndex | dict[str, list[np.ndarray]],
+) -> list[tuple[str, float]]:
+    """classify_hog_by_reference() for many vectors, scored with one matrix multiply."""
+    if isinstance(refs, dict):
+        refs = ReferenceIndex.from_refs(refs)
+    if not fvecs:
+        return []
+    if not refs:
+        return [("other", -1.0)] * len(fvecs)
+    return [
+        (match.label, match.score) if match else ("other", 0.0)
+        for match in refs.query(np.stack(fvecs), k=2)
+    ]
 
 
 def parse_cell_key(ck: str) -> tuple[int, int]:
@@ -893,7 +1085,7 @@ def classify_file(
     model: str | None = None,
     force: bool = False,
     dry_run: bool = False,
-    hog_refs: dict | None = None,
+    hog_refs: ReferenceIndex | dict | None = None,
 ) -> dict:
     """Classify all cells in a file. Returns {cell_key: (cat, sub, confidence, desc)}."""
     results = {}
@@ -915,6 +1107,7 @@ def classify_file(
                 work_items.append((row, col, ck, existing))
 
     total = len(work_items)
+    hog_pending: list[tuple[str, Path]] = []  # extracted and scored together after the loop
     for idx, (row, col, ck, existing) in enumerate(work_items, 1):
             p = png_path(file_key, row, col)
 
@@ -929,12 +1122,9 @@ def classify_file(
             desc = ""
 
             if backend == "hog":
-                img = load_png(p, upscale=4)
-                fvec = classify_hog(img)
-                if hog_refs:
-                    sub, conf = classify_hog_by_reference(fvec, hog_refs)
-                else:
-                    sub, conf = ("other", 0.0)
+                hog_pending.append((ck, p))
+                results[ck] = None  # keeps cell order; filled in below
+                continue
             elif backend == "clip":
                 img = load_png(p, upscale=4, bg_color=(255, 255, 255),
                                resample=Image.Resampling.LANCZOS)
@@ -964,6 +1154,15 @@ def classify_file(
                 desc_tag = f"  \"{desc}\"" if desc else ""
                 print(f"    [{idx}/{total}] {ck} -> {cat}/{sub} ({conf:.2f}){desc_tag}", flush=True)
 
+    if hog_pending:
+        if hog_refs:
+            fvecs = load_hog_store().features([p for _, p in hog_pending])
+            matches = classify_hog_batch_by_reference(list(fvecs), hog_refs)
+        else:
+            matches = [("other", 0.0)] * len(hog_pending)
+        for (ck, _), (sub, conf) in zip(hog_pending, matches):
+            results[ck] = (VALID_SUBS.get(sub, "misc"), sub, conf, "")
+
     return results
 
 
@@ -1041,7 +1240,7 @@ def test_accuracy(catalog: dict, backend: str, model: str | None = None):
     # For HOG, build references EXCLUDING current test items (leave-one-out)
     hog_refs = None
     if backend == "hog":
-        hog_refs = build_hog_references(catalog)
+        hog_refs = load_hog_index(catalog)
         if not hog_refs:
             print("  No HOG references available (need confirmed items).")
             return
@@ -1050,14 +1249,24 @@ def test_accuracy(catalog: dict, backend: str, model: str | None = None):
     wrong = []
     t0 = time.time()
 
+    hog_preds = {}
+    if backend == "hog":
+        # Every ground-truth cell scored in one batch
+        store = load_hog_store()
+        fvecs = store.features([path for _, _, _, path in ground_truth])
+        hog_preds = dict(zip(
+            ((fk, ck) for fk, ck, _, _ in ground_truth),
+            classify_hog_batch_by_reference(list(fvecs), hog_refs),
+        ))
+        store.save()
+        print(f"  {store.summary()}")
+
     for file_key, ck, true_sub, path in ground_truth:
         ollama_model = model or "gemma3:4b"
         ai_desc = ""
 
         if backend == "hog":
-            img = load_png(path, upscale=4)
-            fvec = classify_hog(img)
-            pred_sub, conf = classify_hog_by_reference(fvec, hog_refs)
+            pred_sub, conf = hog_preds[(file_key, ck)]
         elif backend == "clip":
             img = load_png(path, upscale=4, bg_color=(255, 255, 255),
                            resample=Image.Resampling.LANCZOS)
@@ -1270,8 +1479,8 @@ def main():
     hog_refs = None
     if backend == "hog":
         print("  Building HOG references from confirmed items...")
-        hog_refs = build_hog_references(catalog)
-        print(f"  Built references: {sum(len(v) for v in hog_refs.values())} vectors across {len(hog_refs)} types")
+        hog_refs = load_hog_index(catalog)
+        print(f"  Built references: {len(hog_refs)} vectors across {len(hog_refs.labels)} types")
 
     # ── Run ──
     total_updated = 0
@@ -1326,6 +1535,10 @@ def main():
     elapsed = time.time() - t0
     action = "described" if backend == "describe" else f"classified via {backend}"
 
+    if _hog_store is not None:
+        _hog_store.save()  # features are content-keyed, so dry runs keep them too
+        print(f"  {_hog_store.summary()}")
+
     if not args.dry_run and total_updated > 0:
         save_catalog(catalog)
         print(f"\n  Done: {total_updated} cells {action} in {elapsed:.1f}s")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Polling file watcher for the regen_* scripts' --watch mode.
+
+No filesystem-notification service or extra dependency: the watched source
+files are stat()ed every POLL_INTERVAL seconds and compared with the
+previous (size, mtime_ns) snapshot. A typical watch set is a few dozen to a
+few hundred files, so a poll costs well under a millisecond per file.
+
+The caller owns everything else: it keeps its generators, decoded images
+and caches alive in-process between rebuilds and maps each changed file to
+the minimal set of outputs to regenerate.
+
+Usage:
+    def sources():                      # re-evaluated every poll (new files are seen)
+        return [config_path, *variant_dir.glob("*.tga")]
+
+    def rebuild(changed):               # list of changed/added/removed Paths
+        ...
+
+    watch.watch(sources, rebuild, label="regen_gauges")
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Callable, Iterable
+
+POLL_INTERVAL = 0.2  # seconds between stat() sweeps
+SETTLE_DELAY = 0.05  # quiet period before rebuilding (editors save in several writes)
+
+
+class StatWatcher:
+    """Stat-cache snapshot of a set of files; poll() reports what changed."""
+
+    def __init__(self, sources: Callable[[], Iterable[Path]]) -> None:
+        self.sources = sources
+        self._stats = self._snapshot()
+
+    def _snapshot(self) -> dict[Path, tuple[int, int]]:
+        snapshot: dict[Path, tuple[int, int]] = {}
+        for path in self.sources():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue  # missing (or mid-save); reported as removed if it was seen before
+            snapshot[Path(path)] = (st.st_size, st.st_mtime_ns)
+        return snapshot
+
+    def poll(self) -> list[Path]:
+        """Files added, removed or modified since the previous poll (sorted)."""
+        current = self._snapshot()
+        changed = {path for path, sig in current.items() if self._stats.get(path) != sig}
+        changed.update(path for path in self._stats if path not in current)
+        self._stats = current
+        return sorted(changed)
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+
+def watch(
+    sources: Callable[[], Iterable[Path]],
+    rebuild: Callable[[list[Path]], None],
+    label: str = "",
+    root: Path | None = None,
+    interval: float = POLL_INTERVAL,
+) -> int:
+    """Poll sources until Ctrl+C, calling rebuild(changed) after each change.
+
+    Args:
+        sources: Callable returning the files to watch (re-evaluated each poll)
+        rebuild: Callable receiving the changed paths; exceptions are printed
+                 and watching continues
+        label: Script name for the banner
+        root: Paths are printed relative to this directory when possible
+        interval: Seconds between polls
+
+    Returns:
+        0 (exit status after Ctrl+C)
+    """
+    watcher = StatWatcher(sources)
+
+    def _show(path: Path) -> str:
+        if root is not None:
+            try:
+                return path.resolve().relative_to(root.resolve()).as_posix()
+            except ValueError:
+                pass
+        return str(path)
+
+    print(f"\n{'=' * 70}")
+    print(f"WATCHING: {label or 'sources'} ({len(watcher)} file(s), polling every {interval:g}s)")
+    print("Press Ctrl+C to stop")
+    print(f"{'=' * 70}")
+
+    try:
+        while True:
+            time.sleep(interval)
+            changed = watcher.poll()
+            if not changed:
+                continue
+            # Let multi-write saves finish, folding any further changes in
+            while True:
+                time.sleep(SETTLE_DELAY)
+                more = watcher.poll()
+                if not more:
+                    break
+                changed = sorted(set(changed) | set(more))
+
+            print(f"\n[watch] changed: {', '.join(_show(path) for path in changed)}")
+            start = time.perf_counter()
+            try:
+                rebuild(changed)
+            except Exception as e:  # keep watching after a bad edit (e.g. invalid JSON)
+                print(f"[watch] ERROR: rebuild failed: {type(e).__name__}: {e}")
+            # Outputs written by the rebuild are not watched, but a rebuild may
+            # legitimately rewrite a source (e.g. PNG->TGA fix): the next poll
+            # picks that up and the build caches make the second pass a no-op
+            print(f"[watch] rebuilt in {time.perf_counter() - start:.2f}s; waiting for changes...")
+    except KeyboardInterrupt:
+        print("\n[watch] stopped")
+    return 0
@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+"""
+Cross-file symbol index for the skin XML (animations, templates, textures,
+controls, ScreenIDs).
+
+Every XML file under thorne_drak/ (root, Options/ and Testing/) is parsed
+once with expat into:
+
+    - definitions: top-level elements with an item="..." attribute
+      (Ui2DAnimation, TextureInfo, WindowDrawTemplate, Screen, Button, ...)
+    - references: leaf elements naming another item (<Pieces>, <Texture>,
+      <Normal>, <DrawTemplate>, <Fill>, ...) and <ScreenID> values
+
+each with its line number and the item that contains it. The index is kept
+in .tmp/xml-index.json: a file whose size and mtime are unchanged is not
+re-read, and files with identical content (Options/ copies of root files)
+share one parse. Queries are dictionary lookups:
+
+    python .bin/xml_index.py uses A_OversizedGauge120tBand3
+    python .bin/xml_index.py uses "A_Oversized*"      # glob over names
+    python .bin/xml_index.py defs WDT_Def
+    python .bin/xml_index.py undefined
+    python .bin/xml_index.py unused --kind Ui2DAnimation
+
+Scopes: an Options/ or Testing/ variant directory replaces the root files
+of the same name when it is installed, so a reference in a variant file
+resolves against the variant's own files plus the root files it does not
+replace. Root files resolve against root files only.
+
+Usage from other scripts:
+    index = xml_index.load()                 # refreshes changed files
+    for ref in index.uses("A_OversizedGauge120tBand3"):
+        print(ref.file, ref.line, ref.owner)
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import xml.parsers.expat
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_ROOT = REPO_ROOT / "thorne_drak"
+DEFAULT_INDEX = REPO_ROOT / ".tmp" / "xml-index.json"
+INDEX_FORMAT = 1
+
+EXCLUDED_DIRS = {".git", ".tmp", "__pycache__"}
+
+# Leaf elements whose text names another item. Pieces may be written
+# "Type:Name" (layout boxes); the type prefix is dropped.
+REFERENCE_TAGS = {
+    # Screen children / TabBox pages
+    "Pieces",
+    "Pages",
+    # Textures (TextureInfo items)
+    "Texture",
+    "Background",
+    "MiddleTextureInfo",
+    # Window / border templates
+    "DrawTemplate",
+    "TabBorderTemplate",
+    "PageBorderTemplate",
+    # Ui2DAnimation states, decals, gauge and frame pieces
+    "Normal",
+    "Pressed",
+    "Flyby",
+    "Disabled",
+    "PressedFlyby",
+    "NormalDecal",
+    "PressedDecal",
+    "FlybyDecal",
+    "DisabledDecal",
+    "PressedFlybyDecal",
+    "Animation",
+    "Fill",
+    "Lines",
+    "LinesFill",
+    "EndCapLeft",
+    "EndCapRight",
+    "Highlight",
+    "Holder",
+    "Header",
+    "SliderArt",
+    "Button",
+    "Overlay",
+    "Decal",
+    "TabIcon",
+    "TabIconActive",
+    "Top",
+    "Bottom",
+    "Left",
+    "Right",
+    "Middle",
+    "TopLeft",
+    "TopRight",
+    "BottomLeft",
+    "BottomRight",
+    "LeftTop",
+    "LeftBottom",
+    "RightTop",
+    "RightBottom",
+}
+
+# Names bound by the game client rather than by another XML item: indexed
+# for "uses" lookups, never reported as undefined
+CLIENT_TAGS = {"ScreenID"}
+
+# Top-level windows are opened by the client by item name, so an
+# unreferenced Screen is normal; excluded from "unused" unless asked for
+UNUSED_EXCLUDED_KINDS = {"Screen"}
+
+_NON_NAME_RE = re.compile(r"-?\d+|true|false|.*\s.*", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Definition:
+    kind: str  # element type: Ui2DAnimation, TextureInfo, Screen, ...
+    name: str
+    file: str  # path relative to the index root (posix)
+    line: int
+
+
+@dataclass(frozen=True)
+class Reference:
+    tag: str  # referencing element: Pieces, Texture, Normal, ScreenID, ...
+    name: str
+    file: str
+    line: int
+    owner: str | None  # item containing the reference
+
+
+def parse_symbols(path: Path) -> dict:
+    """Parse one XML file into {"defs", "refs", "error"} (lists of lists).
+
+    A malformed file keeps the symbols found before the error.
+    """
+    defs: list[list] = []
+    refs: list[list] = []
+    stack: list[list] = []  # [tag, line, has_children]
+    text: list[str] = []
+    owner: list[str | None] = [None]
+    parser = xml.parsers.expat.ParserCreate()
+
+    def start(tag: str, attrs: dict) -> None:
+        line = parser.CurrentLineNumber
+        if len(stack) == 1 and "item" in attrs:
+            defs.append([tag, attrs["item"], line])
+            owner[0] = attrs["item"]
+        if stack:
+            stack[-1][2] = True
+        stack.append([tag, line, False])
+        text.clear()
+
+    def end(tag: str) -> None:
+        _, line, has_children = stack.pop()
+        if not has_children and (tag in REFERENCE_TAGS or tag in CLIENT_TAGS):
+            value = "".join(text).strip()
+            if value and not _NON_NAME_RE.fullmatch(value):
+                if tag == "Pieces" and ":" in value:
+                    value = value.split(":", 1)[1]
+                refs.append([tag, value, line, owner[0]])
+        text.clear()
+        if len(stack) == 1:
+            owner[0] = None
+
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = text.append
+
+    error = None
+    try:
+        with open(path, "rb") as f:
+            parser.ParseFile(f)
+    except xml.parsers.expat.ExpatError as exc:
+        error = str(exc)
+    return {"defs": defs, "refs": refs, "error": error}
+
+
+def iter_xml_files(root: Path) -> Iterable[Path]:
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in EXCLUDED_DIRS)
+        for name in sorted(filenames):
+            if name.lower().endswith(".xml"):
+                yield Path(dirpath) / name
+
+
+class SymbolIndex:
+    """Definitions and references of every XML file under root."""
+
+    def __init__(self, root: Path = DEFAULT_ROOT, index_path: Path | None = DEFAULT_INDEX) -> None:
+        self.root = Path(root).resolve()
+        self.index_path = index_path
+        self.files: dict[str, list] = {}  # rel path -> [size, mtime_ns, sha256]
+        self.symbols: dict[str, dict] = {}  # sha256 -> parse_symbols() result
+        self.stats = {"files": 0, "parsed": 0, "cached": 0, "removed": 0, "elapsed_ms": 0.0}
+        self._defs: dict[str, list[Definition]] | None = None
+        self._refs: dict[str, list[Reference]] | None = None
+        self._visible: dict[str, set[str]] = {}
+        if index_path is None:
+            return
+        try:
+            data = json.loads(Path(index_path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("format") == INDEX_FORMAT and data.get("root") == str(self.root):
+            self.files = data.get("files", {})
+            self.symbols = data.get("symbols", {})
+
+    # ------------------------------------------------------------------
+    # Refresh / persistence
+    # ------------------------------------------------------------------
+
+    def refresh(self, force: bool = False) -> bool:
+        """Re-parse new and changed files, drop deleted ones. Returns True if anything changed."""
+        start = time.perf_counter()
+        seen: dict[str, list] = {}
+        parsed = cached = 0
+        for path in iter_xml_files(self.root):
+            rel = path.relative_to(self.root).as_posix()
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            known = self.files.get(rel)
+            if not force and known and known[0] == st.st_size and known[1] == st.st_mtime_ns and known[2] in self.symbols:
+                seen[rel] = known
+                cached += 1
+                continue
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            if force or digest not in self.symbols:
+                self.symbols[digest] = parse_symbols(path)
+                parsed += 1
+            else:
+                cached += 1
+            seen[rel] = [st.st_size, st.st_mtime_ns, digest]
+
+        removed = len(set(self.files) - set(seen))
+        changed = bool(parsed or removed or seen != self.files)
+        self.files = seen
+        live = {entry[2] for entry in seen.values()}
+        self.symbols = {digest: data for digest, data in self.symbols.items() if digest in live}
+        if changed:
+            self._defs = self._refs = None
+            self._visible.clear()
+        self.stats = {
+            "files": len(seen),
+            "parsed": parsed,
+            "cached": cached,
+            "removed": removed,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000.0, 3),
+        }
+        return changed
+
+    def save(self) -> None:
+        if self.index_path is None:
+            return
+        path = Path(self.index_path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            data = {"format": INDEX_FORMAT, "root": str(self.root), "files": self.files, "symbols": self.symbols}
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # read-only checkout: the index is rebuilt next time
+
+    # ------------------------------------------------------------------
+    # Lookup tables
+    # ------------------------------------------------------------------
+
+    def _build_tables(self) -> None:
+        defs: dict[str, list[Definition]] = defaultdict(list)
+        refs: dict[str, list[Reference]] = defaultdict(list)
+        for rel in sorted(self.files):
+            data = self.symbols[self.files[rel][2]]
+            for kind, name, line in data["defs"]:
+                defs[name].append(Definition(kind, name, rel, line))
+            for tag, name, line, owner in data["refs"]:
+                refs[name].append(Reference(tag, name, rel, line, owner))
+        self._defs = dict(defs)
+        self._refs = dict(refs)
+
+    @property
+    def defs_by_name(self) -> dict[str, list[Definition]]:
+        if self._defs is None:
+            self._build_tables()
+        return self._defs
+
+    @property
+    def refs_by_name(self) -> dict[str, list[Reference]]:
+        if self._refs is None:
+            self._build_tables()
+        return self._refs
+
+    def scope_of(self, rel: str) -> str:
+        """Variant directory of a file ("" for root files)."""
+        return rel.rpartition("/")[0]
+
+    def visible_names(self, scope: str) -> set[str]:
+        """Item names defined in the skin a scope's files are installed into."""
+        names = self._visible.get(scope)
+        if names is not None:
+            return names
+        overridden = {rel.rpartition("/")[2] for rel in self.files if self.scope_of(rel) == scope}
+        names = set()
+        for rel, entry in self.files.items():
+            file_scope = self.scope_of(rel)
+            if file_scope == scope or (file_scope == "" and rel not in overridden):
+                names.update(name for _, name, _ in self.symbols[entry[2]]["defs"])
+        self._visible[scope] = names
+        return names
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _match(self, table: dict, pattern: str) -> list[str]:
+        if any(ch in pattern for ch in "*?["):
+            return sorted(name for name in table if fnmatch.fnmatchcase(name, pattern))
+        return [pattern] if pattern in table else []
+
+    def definitions(self, pattern: str) -> List[Definition]:
+        """Definitions of a name (or every name matching a glob pattern)."""
+        return [d for name in self._match(self.defs_by_name, pattern) for d in self.defs_by_name[name]]
+
+    def uses(self, pattern: str) -> List[Reference]:
+        """References to a name (or every name matching a glob pattern)."""
+        return [r for name in self._match(self.refs_by_name, pattern) for r in self.refs_by_name[name]]
+
+    def undefined(self) -> List[Reference]:
+        """References that no definition visible from the referencing file satisfies."""
+        missing = []
+        for name, refs in self.refs_by_name.items():
+            for ref in refs:
+                if ref.tag in CLIENT_TAGS:
+                    continue
+                if name not in self.visible_names(self.scope_of(ref.file)):
+                    missing.append(ref)
+        return sorted(missing, key=lambda r: (r.file, r.line))
+
+    def unused(self, kinds: Iterable[str] | None = None) -> List[Definition]:
+        """Definitions that are not referenced from any file in the index."""
+        wanted = set(kinds) if kinds else None
+        result = []
+        for name, defs in self.defs_by_name.items():
+            if name in self.refs_by_name:
+                continue
+            for d in defs:
+                if wanted is None and d.kind in UNUSED_EXCLUDED_KINDS:
+                    continue
+                if wanted is not None and d.kind not in wanted:
+                    continue
+                result.append(d)
+        return sorted(result, key=lambda d: (d.file, d.line))
+
+    def errors(self) -> dict[str, str]:
+        """Files whose parse stopped early, with the expat error."""
+        return {rel: self.symbols[entry[2]]["error"] for rel, entry in sorted(self.files.items()) if self.symbols[entry[2]]["error"]}
+
+    def summary(self) -> dict:
+        kinds: dict[str, int] = defaultdict(int)
+        for defs in self.defs_by_name.values():
+            for d in defs:
+                kinds[d.kind] += 1
+        return {
+            "files": len(self.files),
+            "distinct_contents": len(self.symbols),
+            "definitions": sum(kinds.values()),
+            "references": sum(len(refs) for refs in self.refs_by_name.values()),
+            "names_defined": len(self.defs_by_name),
+            "names_referenced": len(self.refs_by_name),
+            "definitions_by_kind": dict(sorted(kinds.items())),
+            "parse_errors": len(self.errors()),
+        }
+
+
+def load(root: Path = DEFAULT_ROOT, index_path: Path | None = DEFAULT_INDEX, force: bool = False) -> SymbolIndex:
+    """Load the persisted index, refresh changed files and save it if needed."""
+    index = SymbolIndex(root, index_path)
+    if index.refresh(force=force):
+        index.save()
+    return index
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+
+def _print_refs(refs: List[Reference]) -> None:
+    for ref in refs:
+        owner = f"  in {ref.owner}" if ref.owner else ""
+        print(f"  {ref.file}:{ref.line}  <{ref.tag}>{ref.name}{owner}")
+
+
+def _print_defs(defs: List[Definition]) -> None:
+    for d in defs:
+        print(f"  {d.file}:{d.line}  {d.kind} {d.name}")
+
+
+def _filter_path(items: list, prefix: str | None) -> list:
+    if not prefix:
+        return items
+    prefix = prefix.replace("\\", "/").strip("/")
+    return [item for item in items if item.file == prefix or item.file.startswith(prefix + "/")]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Query the cross-file XML symbol index (definitions and references).",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python .bin/xml_index.py uses A_OversizedGauge120tBand3   # Who references an item
+  python .bin/xml_index.py uses "A_Oversized*"              # Glob over item names
+  python .bin/xml_index.py defs WDT_Def                     # Where an item is defined
+  python .bin/xml_index.py undefined                        # References with no definition
+  python .bin/xml_index.py undefined --path Options/Gauges  # ...limited to one subtree
+  python .bin/xml_index.py unused --kind Ui2DAnimation      # Unreferenced animations
+  python .bin/xml_index.py stats --json                     # Index summary as JSON
+        """,
+    )
+    parser.add_argument("query", choices=["uses", "defs", "undefined", "unused", "stats"], help="Query to run")
+    parser.add_argument("name", nargs="?", help="Item name or glob pattern (uses/defs)")
+    parser.add_argument("--root", default=str(DEFAULT_ROOT), help="Skin directory to index (default: thorne_drak/)")
+    parser.add_argument("--index", default=str(DEFAULT_INDEX), help="Index file (default: .tmp/xml-index.json)")
+    parser.add_argument("--path", help="Only report results in files under this path (relative to --root)")
+    parser.add_argument("--kind", action="append", help="unused: only these definition kinds (repeatable)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--force", action="store_true", help="Re-parse every file instead of refreshing changed ones")
+
+    args = parser.parse_args()
+    if args.query in ("uses", "defs") and not args.name:
+        parser.error(f"{args.query} needs an item name")
+
+    index = load(Path(args.root), Path(args.index), force=args.force)
+
+    if args.query == "uses":
+        results = _filter_path(index.uses(args.name), args.path)
+    elif args.query == "defs":
+        results = _filter_path(index.definitions(args.name), args.path)
+    elif args.query == "undefined":
+        results = _filter_path(index.undefined(), args.path)
+    elif args.query == "unused":
+        results = _filter_path(index.unused(args.kind), args.path)
+    else:
+        summary = index.summary()
+        summary["refresh"] = index.stats
+        summary["errors"] = index.errors()
+        if args.json:
+            print(json.dumps(summary, indent=2))
+        else:
+            print(f"Index: {args.index}")
+            print(
+                f"Files: {summary['files']} ({summary['distinct_contents']} distinct)  "
+                f"refreshed in {index.stats['elapsed_ms']:.0f} ms "
+                f"({index.stats['parsed']} parsed, {index.stats['cached']} cached)"
+            )
+            print(f"Definitions: {summary['definitions']} ({summary['names_defined']} names)")
+            print(f"References: {summary['references']} ({summary['names_referenced']} names)")
+            for kind, count in summary["definitions_by_kind"].items():
+                print(f"  {kind:<22} {count}")
+            for rel, error in summary["errors"].items():
+                print(f"  parse error: {rel}: {error}")
+        return 0
+
+    if args.json:
+        print(json.dumps([vars(item) for item in results], indent=2))
+        return 0
+
+    if args.query in ("uses", "undefined"):
+        _print_refs(results)
+    else:
+        _print_defs(results)
+    names = len({item.name for item in results})
+    files = len({item.file for item in results})
+    print(f"{len(results)} result(s), {names} name(s), {files} file(s)")
+    if args.query == "undefined":
+        return 1 if results else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())